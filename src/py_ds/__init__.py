@@ -1,20 +1,46 @@
 from importlib.metadata import PackageNotFoundError, version
 
+from py_ds.datastructures.caches import CacheStats, LFUCache, LRUCache, TTLCache
+from py_ds.datastructures.deque import Deque
+from py_ds.datastructures.fair_queue import FairQueue, LaneStats
 from py_ds.datastructures.heaps import MaxHeap, MinHeap
-from py_ds.datastructures.linked_lists import DoublyLinkedList, LinkedList
+from py_ds.datastructures.linked_hash_map import LinkedHashMap
+from py_ds.datastructures.linked_lists import ConsList, DoublyLinkedList, LinkedList, SkipList, UnrolledLinkedList
+from py_ds.datastructures.persistent_stack import PersistentStack
 from py_ds.datastructures.queue import Queue
-from py_ds.datastructures.stack import Stack
+from py_ds.datastructures.spill_stack import SpillStack
+from py_ds.datastructures.spsc_queue import SPSCQueue
+from py_ds.datastructures.stack import MaxStack, MinStack, MonotonicStack, Stack, TypedStack, UndoStack
 from py_ds.datastructures.trees import AVLTree, BinarySearchTree
 
 __all__ = [
     'AVLTree',
     'BinarySearchTree',
+    'CacheStats',
+    'ConsList',
+    'Deque',
     'DoublyLinkedList',
+    'FairQueue',
+    'LFUCache',
+    'LRUCache',
+    'LaneStats',
+    'LinkedHashMap',
     'LinkedList',
     'MaxHeap',
+    'MaxStack',
     'MinHeap',
+    'MinStack',
+    'MonotonicStack',
+    'PersistentStack',
     'Queue',
+    'SPSCQueue',
+    'SkipList',
+    'SpillStack',
     'Stack',
+    'TTLCache',
+    'TypedStack',
+    'UndoStack',
+    'UnrolledLinkedList',
 ]
 
 
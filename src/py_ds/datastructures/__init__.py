@@ -1,12 +1,36 @@
 """Data structures package."""
 
-from py_ds.datastructures.linked_lists import DoublyLinkedList, LinkedList
+from py_ds.datastructures.caches import LFUCache, LRUCache, TTLCache
+from py_ds.datastructures.deque import Deque
+from py_ds.datastructures.fair_queue import FairQueue
+from py_ds.datastructures.linked_hash_map import LinkedHashMap
+from py_ds.datastructures.linked_lists import ConsList, DoublyLinkedList, LinkedList, SkipList, UnrolledLinkedList
+from py_ds.datastructures.persistent_stack import PersistentStack
 from py_ds.datastructures.queue import Queue
-from py_ds.datastructures.stack import Stack
+from py_ds.datastructures.spill_stack import SpillStack
+from py_ds.datastructures.spsc_queue import SPSCQueue
+from py_ds.datastructures.stack import MaxStack, MinStack, MonotonicStack, Stack, TypedStack, UndoStack
 
 __all__ = [
     'Stack',
+    'MinStack',
+    'MaxStack',
+    'MonotonicStack',
+    'TypedStack',
+    'UndoStack',
+    'PersistentStack',
+    'SpillStack',
     'Queue',
+    'Deque',
+    'FairQueue',
+    'SPSCQueue',
     'LinkedList',
     'DoublyLinkedList',
+    'UnrolledLinkedList',
+    'SkipList',
+    'ConsList',
+    'LinkedHashMap',
+    'LRUCache',
+    'LFUCache',
+    'TTLCache',
 ]
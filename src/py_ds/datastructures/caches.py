@@ -0,0 +1,639 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from .linked_hash_map import LinkedHashMap
+from .linked_lists.doubly_linked import DoublyLinkedList, _DoublyNode
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_MISSING: Any = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """A snapshot of the counters of a cache.
+
+    Attributes:
+        hits: Number of `get` calls that found their key.
+        misses: Number of `get` calls that did not find their key.
+        evictions: Number of entries removed to stay within the capacity.
+        expirations: Number of entries removed because their time-to-live ran out.
+        size: The number of entries currently cached.
+        weight: The summed weight of the cached entries.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    weight: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of `get` calls that were hits.
+
+        Returns:
+            The hit rate, or 0.0 if `get` has not been called yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Cache(ABC, Generic[K, V]):
+    """Capacity, weighing and statistics shared by all caches."""
+
+    def __init__(self, capacity: int, weigher: Callable[[K, V], int] | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: The maximum total weight of the cached entries. With the
+                default weigher this is the maximum number of entries.
+            weigher: Optional function returning the weight of an entry from its
+                key and value. Every entry weighs 1 by default.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        self._capacity = capacity
+        self._weigher = weigher
+        self._weight: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+
+    @property
+    def capacity(self) -> int:
+        """The maximum total weight of the cached entries."""
+        return self._capacity
+
+    @property
+    def weight(self) -> int:
+        """The summed weight of the cached entries."""
+        return self._weight
+
+    @abstractmethod
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for a key and record a hit or a miss.
+
+        Args:
+            key: The key to look up.
+            default: The value to return on a miss.
+        """
+
+    @abstractmethod
+    def put(self, key: K, value: V) -> None:
+        """Cache a value, evicting entries as needed to stay within the capacity.
+
+        Args:
+            key: The key to cache the value under.
+            value: The value to cache.
+        """
+
+    @abstractmethod
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove a key and return its value.
+
+        Args:
+            key: The key to remove.
+            default: The value to return if the key is missing.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries. The statistics are kept."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            The hit, miss, eviction and expiration counts and the current size.
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self),
+            weight=self._weight,
+        )
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the cache.
+
+        Returns:
+            False if the cache is empty, True otherwise.
+        """
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache.
+
+        Returns:
+            A string showing the class name, size, weight and capacity.
+
+        Example:
+            LRUCache(size=3, weight=3, capacity=100)
+        """
+        return f'{self.__class__.__name__}(size={len(self)}, weight={self._weight}, capacity={self._capacity})'
+
+    def _weigh(self, key: K, value: V) -> int:
+        """Compute and validate the weight of an entry.
+
+        Args:
+            key: The key of the entry.
+            value: The value of the entry.
+
+        Returns:
+            The weight of the entry.
+
+        Raises:
+            ValueError: If the weight is negative or larger than the capacity.
+        """
+        weight = 1 if self._weigher is None else self._weigher(key, value)
+        if weight < 0:
+            raise ValueError('entry weight must be non-negative')
+        if weight > self._capacity:
+            raise ValueError('entry weight exceeds the cache capacity')
+        return weight
+
+
+class LRUCache(_Cache[K, V]):
+    """A least-recently-used cache.
+
+    Entries live in a `LinkedHashMap` in recency order: a hit moves the entry to
+    the end in O(1), and eviction removes entries from the front until the
+    total weight fits the capacity again.
+    """
+
+    def __init__(self, capacity: int, weigher: Callable[[K, V], int] | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: The maximum total weight of the cached entries. With the
+                default weigher this is the maximum number of entries.
+            weigher: Optional function returning the weight of an entry from its
+                key and value. Every entry weighs 1 by default.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        super().__init__(capacity, weigher)
+        # key -> (value, weight), least recently used first.
+        self._entries: LinkedHashMap[K, tuple[V, int]] = LinkedHashMap()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for a key and mark it most recently used.
+
+        Args:
+            key: The key to look up.
+            default: The value to return on a miss.
+
+        Returns:
+            The cached value, or `default` on a miss.
+
+        Time complexity: O(1).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value as the most recently used entry.
+
+        Least recently used entries are evicted until the capacity is met.
+
+        Args:
+            key: The key to cache the value under.
+            value: The value to cache. Replaces any value cached for the key.
+
+        Raises:
+            ValueError: If the entry weighs more than the capacity.
+
+        Time complexity: O(1), plus O(1) per eviction.
+        """
+        weight = self._weigh(key, value)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, weight)
+        self._weight += weight
+        while self._weight > self._capacity:
+            self._remove(self._entries.first())
+            self._evictions += 1
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove a key and return its value, without counting a hit or miss.
+
+        Args:
+            key: The key to remove.
+            default: The value to return if the key is missing. If omitted, a
+                missing key raises KeyError.
+
+        Returns:
+            The removed value, or `default`.
+
+        Raises:
+            KeyError: If the key is missing and no default was given.
+
+        Time complexity: O(1).
+        """
+        if key not in self._entries:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries. The statistics are kept.
+
+        Time complexity: O(1).
+        """
+        self._entries.clear()
+        self._weight = 0
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is cached, without touching its recency.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            True if the key is cached, False otherwise.
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns:
+            The number of entries.
+        """
+        return len(self._entries)
+
+    def _remove(self, key: K) -> V:
+        """Remove a cached entry and release its weight.
+
+        Args:
+            key: A cached key.
+
+        Returns:
+            The value that was cached for the key.
+        """
+        value, weight = self._entries.pop(key)
+        self._weight -= weight
+        return value
+
+
+class TTLCache(LRUCache[K, V]):
+    """A least-recently-used cache whose entries also expire after a fixed time.
+
+    Every `put` gives the entry `ttl` clock units to live. Since all entries get
+    the same time-to-live, a second `LinkedHashMap` in insertion order is also
+    in expiry order, so expired entries are always at its front. They are
+    dropped lazily whenever the cache is accessed, or explicitly with `expire`.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        ttl: float,
+        weigher: Callable[[K, V], int] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: The maximum total weight of the cached entries. With the
+                default weigher this is the maximum number of entries.
+            ttl: How long, in clock units, an entry stays valid after `put`.
+            weigher: Optional function returning the weight of an entry from its
+                key and value. Every entry weighs 1 by default.
+            clock: Function returning the current time. Defaults to
+                `time.monotonic`; inject a fake clock for testing.
+
+        Raises:
+            ValueError: If capacity or ttl is not positive.
+        """
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        super().__init__(capacity, weigher)
+        self._ttl = ttl
+        self._clock = clock
+        # key -> expiry time, soonest first.
+        self._expiry: LinkedHashMap[K, float] = LinkedHashMap()
+
+    @property
+    def ttl(self) -> float:
+        """How long an entry stays valid after it is put."""
+        return self._ttl
+
+    def expire(self) -> int:
+        """Drop every expired entry.
+
+        Returns:
+            The number of entries dropped.
+
+        Time complexity: O(1) per dropped entry.
+        """
+        now = self._clock()
+        dropped = 0
+        while self._expiry and self._expiry[self._expiry.first()] <= now:
+            self._remove(self._expiry.first())
+            dropped += 1
+        self._expirations += dropped
+        return dropped
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for a key and mark it most recently used.
+
+        Args:
+            key: The key to look up.
+            default: The value to return on a miss, including expired entries.
+
+        Returns:
+            The cached value, or `default` on a miss.
+
+        Time complexity: O(1), plus O(1) per expired entry dropped.
+        """
+        self.expire()
+        return super().get(key, default)
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value with a fresh time-to-live.
+
+        Args:
+            key: The key to cache the value under.
+            value: The value to cache. Replaces any value cached for the key.
+
+        Raises:
+            ValueError: If the entry weighs more than the capacity.
+
+        Time complexity: O(1), plus O(1) per eviction or expired entry dropped.
+        """
+        self.expire()
+        super().put(key, value)
+        self._expiry[key] = self._clock() + self._ttl
+
+    def clear(self) -> None:
+        """Remove all entries. The statistics are kept.
+
+        Time complexity: O(1).
+        """
+        super().clear()
+        self._expiry.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is cached and not expired.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            True if the key is cached and still valid, False otherwise.
+        """
+        self.expire()
+        return super().__contains__(key)
+
+    def _remove(self, key: K) -> V:
+        """Remove a cached entry, its expiry time and its weight.
+
+        Args:
+            key: A cached key.
+
+        Returns:
+            The value that was cached for the key.
+        """
+        self._expiry.pop(key, None)
+        return super()._remove(key)
+
+
+@dataclass(slots=True, eq=False)
+class _FrequencyNode(_DoublyNode[LinkedHashMap]):
+    """A bucket of the LFU frequency list.
+
+    The node's value is a `LinkedHashMap` of the keys used exactly `count`
+    times, least recently used first.
+    """
+
+    count: int = 0
+
+
+@dataclass(slots=True, eq=False)
+class _LFUEntry(Generic[V]):
+    """A cached value with its weight and current frequency bucket."""
+
+    value: V
+    weight: int
+    bucket: _FrequencyNode
+
+
+class LFUCache(_Cache[K, V]):
+    """A least-frequently-used cache with O(1) operations.
+
+    Keys are grouped into buckets by use count, and the buckets form a
+    `DoublyLinkedList` in increasing count order. A hit moves the key from its
+    bucket to the next one, creating that bucket if needed, so no operation
+    ever searches for a frequency. Eviction takes the least recently used key
+    of the first bucket. Every `get` hit and every `put` counts as a use.
+    """
+
+    def __init__(self, capacity: int, weigher: Callable[[K, V], int] | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: The maximum total weight of the cached entries. With the
+                default weigher this is the maximum number of entries.
+            weigher: Optional function returning the weight of an entry from its
+                key and value. Every entry weighs 1 by default.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        super().__init__(capacity, weigher)
+        self._entries: dict[K, _LFUEntry[V]] = {}
+        self._buckets: DoublyLinkedList[LinkedHashMap] = DoublyLinkedList()
+
+    def frequency(self, key: K) -> int:
+        """Return how many times a cached key has been used.
+
+        Args:
+            key: A cached key.
+
+        Returns:
+            The use count of the key.
+
+        Raises:
+            KeyError: If the key is not cached.
+
+        Time complexity: O(1).
+        """
+        return self._entries[key].bucket.count
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for a key and count a use.
+
+        Args:
+            key: The key to look up.
+            default: The value to return on a miss.
+
+        Returns:
+            The cached value, or `default` on a miss.
+
+        Time complexity: O(1).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._promote(key, entry)
+        return entry.value
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value and count a use.
+
+        Least frequently used entries are evicted until the capacity is met;
+        the entry being put is never evicted by its own `put`.
+
+        Args:
+            key: The key to cache the value under.
+            value: The value to cache. Replaces any value cached for the key.
+
+        Raises:
+            ValueError: If the entry weighs more than the capacity.
+
+        Time complexity: O(1), plus O(1) per eviction.
+        """
+        weight = self._weigh(key, value)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            self._promote(key, entry)
+        else:
+            first = self._buckets._head
+            if first is None or first.count != 1:
+                first = _FrequencyNode(LinkedHashMap(), count=1)
+                self._buckets._link_after(None, first)
+            first.value[key] = None
+            self._entries[key] = _LFUEntry(value, weight, first)
+            self._weight += weight
+        while self._weight > self._capacity:
+            self._evict_one(protect=key)
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove a key and return its value, without counting a hit or miss.
+
+        Args:
+            key: The key to remove.
+            default: The value to return if the key is missing. If omitted, a
+                missing key raises KeyError.
+
+        Returns:
+            The removed value, or `default`.
+
+        Raises:
+            KeyError: If the key is missing and no default was given.
+
+        Time complexity: O(1).
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._leave(key, entry.bucket)
+        self._weight -= entry.weight
+        return entry.value
+
+    def clear(self) -> None:
+        """Remove all entries. The statistics are kept.
+
+        Time complexity: O(1).
+        """
+        self._entries.clear()
+        self._buckets.clear()
+        self._weight = 0
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is cached, without counting a use.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            True if the key is cached, False otherwise.
+        """
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns:
+            The number of entries.
+        """
+        return len(self._entries)
+
+    def _promote(self, key: K, entry: _LFUEntry[V]) -> None:
+        """Move a key to the bucket for one more use.
+
+        Args:
+            key: A cached key.
+            entry: The entry of the key.
+        """
+        bucket = entry.bucket
+        target = self._buckets._after(bucket)
+        if target is None or target.count != bucket.count + 1:
+            if len(bucket.value) == 1:
+                # The key is alone and no bucket holds the next count: reuse its bucket.
+                bucket.count += 1
+                return
+            target = _FrequencyNode(LinkedHashMap(), count=bucket.count + 1)
+            self._buckets._link_after(bucket, target)
+        target.value[key] = None
+        entry.bucket = target
+        self._leave(key, bucket)
+
+    def _leave(self, key: K, bucket: _FrequencyNode) -> None:
+        """Remove a key from a bucket, unlinking the bucket if it becomes empty.
+
+        Args:
+            key: The key to remove.
+            bucket: The bucket holding the key.
+        """
+        del bucket.value[key]
+        if not bucket.value:
+            self._buckets._unlink_after(bucket.prev)
+
+    def _evict_one(self, protect: K) -> None:
+        """Evict the least recently used key of the lowest frequency.
+
+        Args:
+            protect: A key that must not be evicted.
+        """
+        bucket = self._buckets._head
+        keys = iter(bucket.value)
+        key = next(keys)
+        if key == protect:
+            key = next(keys, _MISSING)
+            if key is _MISSING:
+                key = bucket.next.value.first()
+        self._evictions += 1
+        self.pop(key)
@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+_BLOCK_SIZE = 64
+_CENTER = (_BLOCK_SIZE - 1) // 2
+
+
+@dataclass(slots=True, eq=False)
+class _Block(Generic[T]):
+    """A fixed-size block of slots in the deque.
+
+    Attributes:
+        items: The slots of the block. Unused slots hold None.
+        prev: Reference to the previous block, or None if this is the first block.
+        next: Reference to the next block, or None if this is the last block.
+    """
+
+    items: list[T | None] = field(default_factory=lambda: [None] * _BLOCK_SIZE)
+    prev: _Block[T] | None = None
+    next: _Block[T] | None = None
+
+
+class Deque(Generic[T]):
+    """A double-ended queue backed by a doubly linked list of fixed-size blocks.
+
+    Elements are stored contiguously inside blocks of `_BLOCK_SIZE` slots, so the
+    per-element overhead is a single list slot instead of a full node. Adding or
+    removing at either end is O(1), and indexing walks O(n / B) blocks from the
+    closer end.
+    """
+
+    def __init__(self, items: Iterable[T] | None = None) -> None:
+        """Initialize the deque.
+
+        Args:
+            items: Optional iterable of initial items. The first item of the
+                iterable becomes the left end of the deque.
+        """
+        self._head: _Block[T] = _Block()
+        self._tail: _Block[T] = self._head
+        # Index of the leftmost item in the head block and the rightmost item in
+        # the tail block. An empty deque has left == right + 1.
+        self._left: int = _CENTER + 1
+        self._right: int = _CENTER
+        self._length: int = 0
+        self.extend(items or [])
+
+    # -------------------------------------------------
+    # Core deque operations
+    # -------------------------------------------------
+
+    def append(self, item: T) -> None:
+        """Add an item to the right end of the deque.
+
+        Args:
+            item: The item to add.
+
+        Time complexity: O(1).
+        """
+        if self._right == _BLOCK_SIZE - 1:
+            block = _Block(prev=self._tail)
+            self._tail.next = block
+            self._tail = block
+            self._right = -1
+        self._right += 1
+        self._tail.items[self._right] = item
+        self._length += 1
+
+    def appendleft(self, item: T) -> None:
+        """Add an item to the left end of the deque.
+
+        Args:
+            item: The item to add.
+
+        Time complexity: O(1).
+        """
+        if self._left == 0:
+            block = _Block(next=self._head)
+            self._head.prev = block
+            self._head = block
+            self._left = _BLOCK_SIZE
+        self._left -= 1
+        self._head.items[self._left] = item
+        self._length += 1
+
+    def pop(self) -> T:
+        """Remove and return the item at the right end of the deque.
+
+        Returns:
+            The rightmost item.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time complexity: O(1).
+        """
+        if self._length == 0:
+            raise IndexError('pop from empty deque')
+        item = self._tail.items[self._right]
+        self._tail.items[self._right] = None
+        self._right -= 1
+        self._length -= 1
+        if self._length == 0:
+            self._recenter()
+        elif self._right < 0:
+            self._tail = self._tail.prev
+            self._tail.next = None
+            self._right = _BLOCK_SIZE - 1
+        return item
+
+    def popleft(self) -> T:
+        """Remove and return the item at the left end of the deque.
+
+        Returns:
+            The leftmost item.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time complexity: O(1).
+        """
+        if self._length == 0:
+            raise IndexError('pop from empty deque')
+        item = self._head.items[self._left]
+        self._head.items[self._left] = None
+        self._left += 1
+        self._length -= 1
+        if self._length == 0:
+            self._recenter()
+        elif self._left == _BLOCK_SIZE:
+            self._head = self._head.next
+            self._head.prev = None
+            self._left = 0
+        return item
+
+    def peek(self) -> T:
+        """Return the item at the right end without removing it.
+
+        Returns:
+            The rightmost item.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time complexity: O(1).
+        """
+        if self._length == 0:
+            raise IndexError('peek from empty deque')
+        return self._tail.items[self._right]
+
+    def peekleft(self) -> T:
+        """Return the item at the left end without removing it.
+
+        Returns:
+            The leftmost item.
+
+        Raises:
+            IndexError: If the deque is empty.
+
+        Time complexity: O(1).
+        """
+        if self._length == 0:
+            raise IndexError('peek from empty deque')
+        return self._head.items[self._left]
+
+    def is_empty(self) -> bool:
+        """Check if the deque is empty.
+
+        Returns:
+            True if the deque contains no items, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return self._length == 0
+
+    # -------------------------------------------------
+    # Bulk / utility operations
+    # -------------------------------------------------
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append multiple items to the right end, in iteration order.
+
+        The free slots of the tail block are filled with one slice assignment,
+        then whole new blocks are filled the same way, so the per-item work is
+        done by list slicing rather than by `append`.
+
+        Args:
+            items: An iterable of items to append.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        iterator = iter(list(items) if items is self else items)
+        while True:
+            room = _BLOCK_SIZE - 1 - self._right
+            chunk = list(islice(iterator, room or _BLOCK_SIZE))
+            if not chunk:
+                return
+            if room == 0:
+                block = _Block(prev=self._tail)
+                self._tail.next = block
+                self._tail = block
+                self._right = -1
+            start = self._right + 1
+            self._tail.items[start : start + len(chunk)] = chunk
+            self._right += len(chunk)
+            self._length += len(chunk)
+
+    def extendleft(self, items: Iterable[T]) -> None:
+        """Append multiple items to the left end, in iteration order.
+
+        As with `collections.deque`, the items end up in reverse order: the last
+        item of `items` becomes the new left end. Like `extend`, the items are
+        written one block at a time with slice assignments.
+
+        Args:
+            items: An iterable of items to prepend.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        iterator = iter(list(items) if items is self else items)
+        while True:
+            room = self._left
+            chunk = list(islice(iterator, room or _BLOCK_SIZE))
+            if not chunk:
+                return
+            if room == 0:
+                block = _Block(next=self._head)
+                self._head.prev = block
+                self._head = block
+                self._left = _BLOCK_SIZE
+            chunk.reverse()
+            stop = self._left
+            self._head.items[stop - len(chunk) : stop] = chunk
+            self._left -= len(chunk)
+            self._length += len(chunk)
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return `n` items from the right end.
+
+        Items are taken one block at a time: each block contributes a single
+        slice, and its vacated slots are cleared with one assignment.
+
+        Args:
+            n: The number of items to remove.
+
+        Returns:
+            The removed items, in the order `pop` would return them.
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the deque holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        self._validate_count(n)
+        result: list[T] = []
+        while n:
+            stop = self._right + 1
+            k = min(n, stop)
+            items = self._tail.items
+            chunk = items[stop - k : stop]
+            chunk.reverse()
+            result += chunk
+            items[stop - k : stop] = [None] * k
+            n -= k
+            self._right -= k
+            self._length -= k
+            if self._length == 0:
+                self._recenter()
+            elif self._right < 0:
+                self._tail = self._tail.prev
+                self._tail.next = None
+                self._right = _BLOCK_SIZE - 1
+        return result
+
+    def popleft_many(self, n: int) -> list[T]:
+        """Remove and return `n` items from the left end.
+
+        Items are taken one block at a time, as in `pop_many`.
+
+        Args:
+            n: The number of items to remove.
+
+        Returns:
+            The removed items, in the order `popleft` would return them.
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the deque holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        self._validate_count(n)
+        result: list[T] = []
+        while n:
+            start = self._left
+            k = min(n, _BLOCK_SIZE - start)
+            items = self._head.items
+            result += items[start : start + k]
+            items[start : start + k] = [None] * k
+            n -= k
+            self._left += k
+            self._length -= k
+            if self._length == 0:
+                self._recenter()
+            elif self._left == _BLOCK_SIZE:
+                self._head = self._head.next
+                self._head.prev = None
+                self._left = 0
+        return result
+
+    def clear(self) -> None:
+        """Remove all items from the deque.
+
+        Time complexity: O(1).
+        """
+        self._head = self._tail = _Block()
+        self._length = 0
+        self._recenter()
+
+    # -------------------------------------------------
+    # Python protocol methods
+    # -------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of items in the deque.
+
+        Returns:
+            The number of items in the deque.
+
+        Time complexity: O(1).
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the deque.
+
+        Returns:
+            False if the deque is empty, True otherwise.
+        """
+        return self._length > 0
+
+    def __getitem__(self, index: int) -> T:
+        """Get the item at the given index.
+
+        Args:
+            index: 0-based index from the left end, negative indexes supported.
+
+        Returns:
+            The item at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(n / B), where B is the block size.
+        """
+        block, offset = self._locate(index)
+        return block.items[offset]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """Set the item at the given index.
+
+        Args:
+            index: 0-based index from the left end, negative indexes supported.
+            item: The item to store.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(n / B), where B is the block size.
+        """
+        block, offset = self._locate(index)
+        block.items[offset] = item
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items from the left end to the right end.
+
+        Yields:
+            Each item in the deque, starting from the left end.
+        """
+        block, start, remaining = self._head, self._left, self._length
+        while remaining > 0:
+            stop = min(_BLOCK_SIZE, start + remaining)
+            yield from block.items[start:stop]
+            remaining -= stop - start
+            block, start = block.next, 0
+
+    def __reversed__(self) -> Iterator[T]:
+        """Iterate over the items from the right end to the left end.
+
+        Yields:
+            Each item in the deque, starting from the right end.
+        """
+        block, stop, remaining = self._tail, self._right + 1, self._length
+        while remaining > 0:
+            start = max(0, stop - remaining)
+            yield from reversed(block.items[start:stop])
+            remaining -= stop - start
+            block, stop = block.prev, _BLOCK_SIZE
+
+    def __repr__(self) -> str:
+        """Return a string representation of the deque.
+
+        Returns:
+            A string representation showing the class name and deque contents.
+
+        Example:
+            Deque([1, 2, 3])
+        """
+        return f'{self.__class__.__name__}({list(self)})'
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+
+    def _recenter(self) -> None:
+        """Reset the cursors of an empty deque to the middle of its only block.
+
+        Starting from the center leaves room to grow in both directions before
+        a new block has to be allocated.
+        """
+        self._left = _CENTER + 1
+        self._right = _CENTER
+
+    def _validate_count(self, n: int) -> None:
+        """Validate the number of items requested by a bulk pop.
+
+        Args:
+            n: The number of items to pop.
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the deque holds fewer than n items.
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if n > self._length:
+            raise IndexError('pop from empty deque')
+
+    def _locate(self, index: int) -> tuple[_Block[T], int]:
+        """Find the block and slot holding the item at the given index.
+
+        Walks from the head or the tail, whichever is closer.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+
+        Returns:
+            The block containing the item and the offset of the item in it.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(n / B), where B is the block size.
+        """
+        if index < 0:
+            index += self._length
+        if index < 0 or index >= self._length:
+            raise IndexError('deque index out of range')
+        position = self._left + index
+        block_index, offset = divmod(position, _BLOCK_SIZE)
+        last_block_index = (self._left + self._length - 1) // _BLOCK_SIZE
+        if block_index <= last_block_index - block_index:
+            block = self._head
+            for _ in range(block_index):
+                block = block.next
+        else:
+            block = self._tail
+            for _ in range(last_block_index - block_index):
+                block = block.prev
+        return block, offset
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from .deque import Deque
+from .queue import Queue
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    """A snapshot of the counters of a single lane.
+
+    Attributes:
+        weight: The scheduling weight of the lane.
+        depth: The number of items currently waiting in the lane.
+        enqueued: The total number of items ever enqueued into the lane.
+        dequeued: The total number of items ever dequeued from the lane.
+        total_wait: The summed time, in clock units, dequeued items spent waiting.
+        max_wait: The longest time a single dequeued item spent waiting.
+    """
+
+    weight: float
+    depth: int
+    enqueued: int
+    dequeued: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        """Average time a dequeued item spent waiting.
+
+        Returns:
+            The mean wait time, or 0.0 if nothing has been dequeued yet.
+        """
+        return self.total_wait / self.dequeued if self.dequeued else 0.0
+
+
+@dataclass
+class _Lane(Generic[T]):
+    """The per-lane queue and bookkeeping of a FairQueue.
+
+    Attributes:
+        weight: Number of items the lane may dequeue per round.
+        items: The waiting items, each paired with its enqueue timestamp.
+        deficit: Unspent dequeue credit carried over from previous rounds.
+        active: Whether the lane is currently in the round-robin ring.
+    """
+
+    weight: float
+    items: Queue[tuple[float, T]] = field(default_factory=Queue)
+    deficit: float = 0.0
+    active: bool = False
+    enqueued: int = 0
+    dequeued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class FairQueue(Generic[K, T]):
+    """A multi-lane queue scheduled by deficit round robin (DRR).
+
+    Every lane is a FIFO `Queue`. Non-empty lanes take turns in a ring; on its
+    turn a lane earns `weight` items of credit and dequeues until the credit is
+    spent or the lane runs dry. Over time each busy lane receives a share of the
+    dequeues proportional to its weight, so one heavy tenant cannot block the
+    others. Empty lanes are not part of the ring and cost nothing.
+    """
+
+    def __init__(
+        self,
+        weights: Mapping[K, float] | None = None,
+        default_weight: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            weights: Optional mapping of lane to weight for lanes known upfront.
+            default_weight: The weight given to lanes created on first enqueue.
+            clock: Function returning the current time, used for wait statistics.
+
+        Raises:
+            ValueError: If any weight is not positive.
+        """
+        self._validate_weight(default_weight)
+        self._default_weight = default_weight
+        self._clock = clock
+        self._lanes: dict[K, _Lane[T]] = {}
+        self._active: Deque[K] = Deque()
+        self._length: int = 0
+        for lane, weight in (weights or {}).items():
+            self.add_lane(lane, weight)
+
+    # -------------------------------------------------
+    # Lane management
+    # -------------------------------------------------
+
+    def add_lane(self, lane: K, weight: float | None = None) -> None:
+        """Register a new, empty lane.
+
+        Args:
+            lane: The key identifying the lane.
+            weight: The lane weight. Defaults to the queue's default weight.
+
+        Raises:
+            ValueError: If the lane already exists or the weight is not positive.
+        """
+        if lane in self._lanes:
+            raise ValueError(f'lane {lane!r} already exists')
+        weight = self._default_weight if weight is None else weight
+        self._validate_weight(weight)
+        self._lanes[lane] = _Lane(weight)
+
+    def set_weight(self, lane: K, weight: float) -> None:
+        """Change the weight of an existing lane.
+
+        The new weight takes effect from the lane's next turn.
+
+        Args:
+            lane: The key identifying the lane.
+            weight: The new weight.
+
+        Raises:
+            KeyError: If the lane does not exist.
+            ValueError: If the weight is not positive.
+        """
+        self._validate_weight(weight)
+        self._lanes[lane].weight = weight
+
+    def lanes(self) -> list[K]:
+        """Return the keys of all registered lanes.
+
+        Returns:
+            The lane keys, in registration order.
+        """
+        return list(self._lanes)
+
+    # -------------------------------------------------
+    # Core queue operations
+    # -------------------------------------------------
+
+    def enqueue(self, item: T, lane: K) -> None:
+        """Add an item to the back of a lane.
+
+        Lanes that do not exist yet are created with the default weight.
+
+        Args:
+            item: The item to add.
+            lane: The key of the lane to add the item to.
+
+        Time complexity: O(1).
+        """
+        state = self._lanes.get(lane)
+        if state is None:
+            self.add_lane(lane)
+            state = self._lanes[lane]
+        state.items.enqueue((self._clock(), item))
+        state.enqueued += 1
+        if not state.active:
+            state.active = True
+            self._active.append(lane)
+        self._length += 1
+
+    def dequeue(self) -> T:
+        """Remove and return the next item according to the DRR schedule.
+
+        Returns:
+            The front item of the lane whose turn it is.
+
+        Raises:
+            IndexError: If every lane is empty.
+
+        Time complexity: O(1) amortized for weights >= 1.
+        """
+        if self._length == 0:
+            raise IndexError('dequeue from empty queue')
+        while True:
+            lane = self._active.peekleft()
+            state = self._lanes[lane]
+            if state.deficit < 1:
+                state.deficit += state.weight
+            if state.deficit >= 1:
+                break
+            # Fractional weights may need several rounds to earn one item.
+            self._active.append(self._active.popleft())
+
+        enqueued_at, item = state.items.dequeue()
+        wait = self._clock() - enqueued_at
+        state.dequeued += 1
+        state.total_wait += wait
+        state.max_wait = max(state.max_wait, wait)
+        state.deficit -= 1
+        self._length -= 1
+
+        if not state.items:
+            state.deficit = 0.0
+            state.active = False
+            self._active.popleft()
+        elif state.deficit < 1:
+            self._active.append(self._active.popleft())
+        return item
+
+    def is_empty(self) -> bool:
+        """Check if every lane is empty.
+
+        Returns:
+            True if no lane holds an item, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return self._length == 0
+
+    def clear(self) -> None:
+        """Remove all waiting items from every lane.
+
+        Lanes, weights and cumulative statistics are kept.
+
+        Time complexity: O(L), where L is the number of lanes.
+        """
+        for state in self._lanes.values():
+            state.items.clear()
+            state.deficit = 0.0
+            state.active = False
+        self._active.clear()
+        self._length = 0
+
+    # -------------------------------------------------
+    # Statistics
+    # -------------------------------------------------
+
+    def depth(self, lane: K) -> int:
+        """Return the number of items waiting in a lane.
+
+        Args:
+            lane: The key identifying the lane.
+
+        Returns:
+            The number of items in the lane.
+
+        Raises:
+            KeyError: If the lane does not exist.
+        """
+        return len(self._lanes[lane].items)
+
+    def stats(self, lane: K) -> LaneStats:
+        """Return a snapshot of a lane's depth and wait-time counters.
+
+        Args:
+            lane: The key identifying the lane.
+
+        Returns:
+            The lane statistics.
+
+        Raises:
+            KeyError: If the lane does not exist.
+        """
+        state = self._lanes[lane]
+        return LaneStats(
+            weight=state.weight,
+            depth=len(state.items),
+            enqueued=state.enqueued,
+            dequeued=state.dequeued,
+            total_wait=state.total_wait,
+            max_wait=state.max_wait,
+        )
+
+    def all_stats(self) -> dict[K, LaneStats]:
+        """Return a snapshot of the statistics of every lane.
+
+        Returns:
+            A mapping of lane key to lane statistics.
+        """
+        return {lane: self.stats(lane) for lane in self._lanes}
+
+    # -------------------------------------------------
+    # Python protocol methods
+    # -------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the total number of items across all lanes.
+
+        Returns:
+            The number of items in the queue.
+
+        Time complexity: O(1).
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the queue.
+
+        Returns:
+            False if every lane is empty, True otherwise.
+        """
+        return self._length > 0
+
+    def __repr__(self) -> str:
+        """Return a string representation of the queue.
+
+        Returns:
+            A string showing the class name and the depth of each lane.
+
+        Example:
+            FairQueue({'a': 2, 'b': 0})
+        """
+        depths = {lane: len(state.items) for lane, state in self._lanes.items()}
+        return f'{self.__class__.__name__}({depths})'
+
+    @staticmethod
+    def _validate_weight(weight: float) -> None:
+        """Validate that a lane weight is positive.
+
+        Args:
+            weight: The weight to validate.
+
+        Raises:
+            ValueError: If the weight is not positive.
+        """
+        if weight <= 0:
+            raise ValueError('lane weight must be positive')
@@ -19,11 +19,9 @@ class Heap(Generic[T], ABC):
             items: Optional iterable of items to initialize the heap with.
                 If None, creates an empty heap.
         """
-        items = items or []
         self._items: list[T] = []
         self._size: int = 0
-        for item in items:
-            self.push(item)
+        self.extend(items or [])
 
     def _swap(self, idx1, idx2) -> None:
         """Swap two elements in the heap array.
@@ -135,15 +133,50 @@ class Heap(Generic[T], ABC):
         self._heapify_up()
 
     @abstractmethod
-    def _heapify_down(self) -> None:
-        """Restore heap property by moving the root element down the tree.
+    def _heapify_down(self, index: int = 0) -> None:
+        """Restore heap property by moving an element down the tree.
 
         This method is called after removing the root element to maintain
-        the heap property. Implementation depends on whether it's a min
-        or max heap.
+        the heap property, and on every internal node when building a heap
+        in bulk. Implementation depends on whether it's a min or max heap.
+
+        Args:
+            index: The index of the element to move down. Defaults to the root.
         """
         ...
 
+    def _heapify(self) -> None:
+        """Restore the heap property over the whole array (Floyd's method).
+
+        Sifts down every internal node, starting from the last one.
+
+        Time complexity: O(n).
+        """
+        for index in range(self._size // 2 - 1, -1, -1):
+            self._heapify_down(index)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Add multiple items to the heap.
+
+        Small batches are pushed one at a time. Batches at least as large as
+        the heap are appended in one call and the heap is rebuilt bottom-up,
+        which is cheaper than pushing each item.
+
+        Args:
+            items: An iterable of items to add.
+
+        Time complexity: O(k log n) for small batches, O(n + k) otherwise.
+        """
+        items = list(items)
+        if len(items) < self._size:
+            for item in items:
+                self.push(item)
+            return
+        del self._items[self._size :]
+        self._items.extend(items)
+        self._size = len(self._items)
+        self._heapify()
+
     def pop(self) -> T:
         """Remove and return the root element of the heap.
 
@@ -163,6 +196,27 @@ class Heap(Generic[T], ABC):
         self._heapify_down()
         return item
 
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return the top `n` elements in priority order.
+
+        Args:
+            n: The number of elements to pop.
+
+        Returns:
+            The popped elements, in the order `pop` would return them.
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the heap holds fewer than n elements.
+
+        Time complexity: O(n log m) where m is the number of elements.
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if n > self._size:
+            raise IndexError('pop from an empty heap')
+        return [self.pop() for _ in range(n)]
+
     def peek(self) -> T:
         """Return the root element without removing it.
 
@@ -236,14 +290,17 @@ class MinHeap(Heap):
             self._swap(index, parent_idx)
             index = parent_idx
 
-    def _heapify_down(self) -> None:
-        """Restore min-heap property by moving the root element down.
+    def _heapify_down(self, index: int = 0) -> None:
+        """Restore min-heap property by moving an element down.
 
-        Compares the root with its children and swaps with the smaller child
-        if the root is larger, continuing down the tree until the heap property
+        Compares the element with its children and swaps with the smaller child
+        if the element is larger, continuing down the tree until the heap property
         is restored.
+
+        Args:
+            index: The index of the element to move down. Defaults to the root.
         """
-        parent_idx = 0
+        parent_idx = index
         while self._has_left_child(parent_idx):
             smaller_child, smaller_child_idx = self._left_child(parent_idx), self._left_index(parent_idx)
             if self._has_right_child(parent_idx) and (right_child := self._right_child(parent_idx)) < smaller_child:
@@ -275,14 +332,17 @@ class MaxHeap(Heap):
             self._swap(index, parent_idx)
             index = parent_idx
 
-    def _heapify_down(self) -> None:
-        """Restore max-heap property by moving the root element down.
+    def _heapify_down(self, index: int = 0) -> None:
+        """Restore max-heap property by moving an element down.
 
-        Compares the root with its children and swaps with the larger child
-        if the root is smaller, continuing down the tree until the heap property
+        Compares the element with its children and swaps with the larger child
+        if the element is smaller, continuing down the tree until the heap property
         is restored.
+
+        Args:
+            index: The index of the element to move down. Defaults to the root.
         """
-        parent_idx = 0
+        parent_idx = index
         while self._has_left_child(parent_idx):
             bigger_child, bigger_child_idx = self._left_child(parent_idx), self._left_index(parent_idx)
             if self._has_right_child(parent_idx) and (right_child := self._right_child(parent_idx)) > bigger_child:
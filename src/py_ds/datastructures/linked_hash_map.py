@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from .linked_lists.doubly_linked import DoublyLinkedList, _DoublyNode
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_MISSING: Any = object()
+
+
+@dataclass(slots=True, eq=False)
+class _MapNode(_DoublyNode[V]):
+    """A node of the ordering list that also remembers its key."""
+
+    key: Any = None
+
+
+class LinkedHashMap(Generic[K, V]):
+    """A dict that keeps its keys in a `DoublyLinkedList` order.
+
+    Each key maps to its node in the list, so lookups, removals and moving a
+    key to either end are all O(1). New keys are added at the end; assigning
+    to an existing key keeps its position. This is the building block for
+    ordered sets and recency tracking.
+    """
+
+    def __init__(self, items: Iterable[tuple[K, V]] | None = None) -> None:
+        """Initialize the map.
+
+        Args:
+            items: Optional iterable of (key, value) pairs, added in order.
+        """
+        self._order: DoublyLinkedList[V] = DoublyLinkedList()
+        self._nodes: dict[K, _MapNode[V]] = {}
+        for key, value in items or []:
+            self[key] = value
+
+    # -------------------------------------------------
+    # Ordering operations
+    # -------------------------------------------------
+
+    def move_to_end(self, key: K) -> None:
+        """Move an existing key to the end of the order.
+
+        Args:
+            key: The key to move.
+
+        Raises:
+            KeyError: If the key is not in the map.
+
+        Time complexity: O(1).
+        """
+        node = self._nodes[key]
+        self._order._unlink_after(node.prev)
+        self._order._link_after(self._order._tail, node)
+
+    def move_to_front(self, key: K) -> None:
+        """Move an existing key to the front of the order.
+
+        Args:
+            key: The key to move.
+
+        Raises:
+            KeyError: If the key is not in the map.
+
+        Time complexity: O(1).
+        """
+        node = self._nodes[key]
+        self._order._unlink_after(node.prev)
+        self._order._link_after(None, node)
+
+    def popitem(self, last: bool = True) -> tuple[K, V]:
+        """Remove and return the (key, value) pair at one end of the order.
+
+        Args:
+            last: If True, remove the last pair; otherwise the first.
+
+        Returns:
+            The removed (key, value) pair.
+
+        Raises:
+            KeyError: If the map is empty.
+
+        Time complexity: O(1).
+        """
+        if not self._nodes:
+            raise KeyError('popitem from empty map')
+        node = self._order._tail if last else self._order._head
+        self._unlink(node)
+        return node.key, node.value
+
+    def first(self) -> K:
+        """Return the first key without removing it.
+
+        Returns:
+            The first key in the order.
+
+        Raises:
+            KeyError: If the map is empty.
+
+        Time complexity: O(1).
+        """
+        if not self._nodes:
+            raise KeyError('first from empty map')
+        return self._order._head.key
+
+    def last(self) -> K:
+        """Return the last key without removing it.
+
+        Returns:
+            The last key in the order.
+
+        Raises:
+            KeyError: If the map is empty.
+
+        Time complexity: O(1).
+        """
+        if not self._nodes:
+            raise KeyError('last from empty map')
+        return self._order._tail.key
+
+    # -------------------------------------------------
+    # Mapping operations
+    # -------------------------------------------------
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the value for a key, or a default if the key is missing.
+
+        Args:
+            key: The key to look up.
+            default: The value to return if the key is missing.
+
+        Returns:
+            The value for the key, or `default`.
+
+        Time complexity: O(1).
+        """
+        node = self._nodes.get(key)
+        return default if node is None else node.value
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove a key and return its value.
+
+        Args:
+            key: The key to remove.
+            default: The value to return if the key is missing. If omitted, a
+                missing key raises KeyError.
+
+        Returns:
+            The removed value, or `default`.
+
+        Raises:
+            KeyError: If the key is missing and no default was given.
+
+        Time complexity: O(1).
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._unlink(node)
+        return node.value
+
+    def keys(self) -> Iterator[K]:
+        """Iterate through the keys in order.
+
+        Yields:
+            Each key, from first to last.
+        """
+        for node in self._order._iter_nodes():
+            yield node.key
+
+    def values(self) -> Iterator[V]:
+        """Iterate through the values in key order.
+
+        Returns:
+            An iterator over the values, from first to last.
+        """
+        return iter(self._order)
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        """Iterate through the (key, value) pairs in order.
+
+        Yields:
+            Each (key, value) pair, from first to last.
+        """
+        for node in self._order._iter_nodes():
+            yield node.key, node.value
+
+    def clear(self) -> None:
+        """Remove all keys from the map.
+
+        Time complexity: O(1).
+        """
+        self._order.clear()
+        self._nodes.clear()
+
+    # -------------------------------------------------
+    # Python protocol methods
+    # -------------------------------------------------
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Set the value for a key. New keys are added at the end.
+
+        Args:
+            key: The key to set.
+            value: The value to store.
+
+        Time complexity: O(1).
+        """
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value = value
+            return
+        node = _MapNode(value, key=key)
+        self._order._link_after(self._order._tail, node)
+        self._nodes[key] = node
+
+    def __getitem__(self, key: K) -> V:
+        """Return the value for a key.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The value for the key.
+
+        Raises:
+            KeyError: If the key is not in the map.
+
+        Time complexity: O(1).
+        """
+        return self._nodes[key].value
+
+    def __delitem__(self, key: K) -> None:
+        """Remove a key.
+
+        Args:
+            key: The key to remove.
+
+        Raises:
+            KeyError: If the key is not in the map.
+
+        Time complexity: O(1).
+        """
+        self._unlink(self._nodes[key])
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is in the map.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            True if the key is in the map, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return key in self._nodes
+
+    def __len__(self) -> int:
+        """Return the number of keys in the map.
+
+        Returns:
+            The number of keys.
+        """
+        return len(self._nodes)
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the map.
+
+        Returns:
+            False if the map is empty, True otherwise.
+        """
+        return bool(self._nodes)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate through the keys in order.
+
+        Returns:
+            An iterator over the keys, from first to last.
+        """
+        return self.keys()
+
+    def __reversed__(self) -> Iterator[K]:
+        """Iterate through the keys in reverse order.
+
+        Yields:
+            Each key, from last to first.
+        """
+        for node in self._order._iter_nodes_reversed():
+            yield node.key
+
+    def __repr__(self) -> str:
+        """Return a string representation of the map.
+
+        Returns:
+            A string representation showing the class name and the pairs in order.
+
+        Example:
+            LinkedHashMap({'a': 1, 'b': 2})
+        """
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+
+    def _unlink(self, node: _MapNode[V]) -> None:
+        """Remove a node from the ordering list and the index.
+
+        Args:
+            node: The node of a key in the map.
+        """
+        self._order._unlink_after(node.prev)
+        del self._nodes[node.key]
@@ -1,7 +1,17 @@
+from .cons_list import ConsList
+from .cursor import Cursor
 from .doubly_linked import DoublyLinkedList
+from .node_handle import NodeHandle
 from .singly_linked import LinkedList
+from .skip_list import SkipList
+from .unrolled import UnrolledLinkedList
 
 __all__ = [
     'LinkedList',
     'DoublyLinkedList',
+    'UnrolledLinkedList',
+    'SkipList',
+    'ConsList',
+    'Cursor',
+    'NodeHandle',
 ]
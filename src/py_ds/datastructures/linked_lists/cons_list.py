@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, TypeVar
+
+from .singly_linked import LinkedList, _Node
+
+T = TypeVar('T')
+
+
+class ConsList(Generic[T]):
+    """An immutable singly linked list whose versions share their tails.
+
+    A cons list is a pointer to its first node. `prepend` returns a new list
+    whose first node points at the existing one, so it copies nothing, and
+    `rest` returns the list starting at the second node. Forking a list is
+    free: any number of lists can be prepended to the same one, and they all
+    share it as their common tail. Nodes are never modified once a list has
+    been built, which is what makes the sharing safe.
+
+    Pickling and copying store the values as a flat list, so they work for
+    chains of any length, but the unpickled list no longer shares nodes with
+    other lists.
+    """
+
+    __slots__ = ('_first', '_length')
+
+    def __init__(self, items: Iterable[T] | None = None) -> None:
+        """Initialize the list.
+
+        The nodes are chained front to back in a single pass, so building from
+        a `LinkedList` or any other iterable needs no intermediate copy.
+
+        Args:
+            items: Optional iterable of items. The first item becomes the head.
+
+        Example:
+            ConsList([1, 2, 3])  # 1 is the head
+        """
+        first: _Node[T] | None = None
+        last: _Node[T] | None = None
+        length = 0
+        for item in items or []:
+            node = _Node(item)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            length += 1
+        self._first = first
+        self._length = length
+
+    @classmethod
+    def _from_node(cls, first: _Node[T] | None, length: int) -> ConsList[T]:
+        """Create a list that points at an existing chain of nodes.
+
+        Args:
+            first: The first node of the list, or None for an empty list.
+            length: The number of nodes reachable from `first`.
+
+        Returns:
+            A new list sharing the given nodes.
+        """
+        cons = cls.__new__(cls)
+        cons._first = first
+        cons._length = length
+        return cons
+
+    # -------------------------------------------------
+    # Core operations
+    # -------------------------------------------------
+
+    def prepend(self, value: T) -> ConsList[T]:
+        """Return a new list with a value added at the front.
+
+        The current list is left unchanged and becomes the tail of the new one.
+
+        Args:
+            value: The value to add.
+
+        Returns:
+            The new list.
+
+        Time complexity: O(1).
+        """
+        return self._from_node(_Node(value, self._first), self._length + 1)
+
+    def head(self) -> T | None:
+        """Return the first value in the list.
+
+        Returns:
+            The first value in the list, or None if the list is empty.
+
+        Time complexity: O(1).
+        """
+        return self._first.value if self._first else None
+
+    def rest(self) -> ConsList[T]:
+        """Return the list without its first value.
+
+        The result shares all of its nodes with this list.
+
+        Returns:
+            The list starting at the second value.
+
+        Raises:
+            IndexError: If the list is empty.
+
+        Time complexity: O(1).
+        """
+        if self._first is None:
+            raise IndexError('rest of empty list')
+        return self._from_node(self._first.next, self._length - 1)
+
+    def to_linked_list(self) -> LinkedList[T]:
+        """Copy the values into a new, mutable `LinkedList`.
+
+        Returns:
+            A `LinkedList` with the same values in the same order.
+
+        Time complexity: O(n).
+        """
+        return LinkedList(self)
+
+    # -------------------------------------------------
+    # Python protocol methods
+    # -------------------------------------------------
+
+    def __len__(self) -> int:
+        """Return the number of values in the list.
+
+        Returns:
+            The number of values in the list.
+
+        Time complexity: O(1).
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the list.
+
+        Returns:
+            False if the list is empty, True otherwise.
+        """
+        return self._first is not None
+
+    def __getitem__(self, index: int) -> T:
+        """Get the value at the given index.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(index).
+        """
+        if index < -self._length or index >= self._length:
+            raise IndexError('index out-of-bounds')
+        node = self._first
+        for _ in range(index % self._length):
+            node = node.next
+        return node.value
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through the values from head to tail.
+
+        Iteration is a plain loop over the nodes, so it works for chains of any
+        length.
+
+        Yields:
+            The values in the list from head to tail.
+        """
+        curr = self._first
+        while curr is not None:
+            yield curr.value
+            curr = curr.next
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two lists value by value.
+
+        Lists that share a tail stop comparing as soon as they reach it.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            True if `other` is a ConsList with the same values in the same
+            order, False otherwise.
+        """
+        if not isinstance(other, ConsList):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        a, b = self._first, other._first
+        while a is not b:
+            if a.value != b.value:
+                return False
+            a, b = a.next, b.next
+        return True
+
+    __hash__ = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling and copying without recursing through the nodes.
+
+        Returns:
+            The class and a flat list of the values to rebuild it from.
+        """
+        return self.__class__, (list(self),)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns:
+            A string representation showing the class name and list contents.
+
+        Example:
+            ConsList([1, 2, 3])
+        """
+        return f'{self.__class__.__name__}({list(self)})'
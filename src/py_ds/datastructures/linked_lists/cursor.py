@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .singly_linked import LinkedList, _Node
+
+T = TypeVar('T')
+
+
+class Cursor(Generic[T]):
+    """A position in a linked list that supports O(1) edits around it.
+
+    A cursor sits on one value of the list, or past the end (`at_end`). It
+    keeps references to the node under it and the node before it, so
+    inserting and removing next to it never walks the list. Created by `LinkedList.cursor`.
+
+    A cursor is fail-fast: once the list is structurally changed by anything
+    other than the cursor itself, every further use raises RuntimeError.
+    Changing a value with `list[i] = v` does not invalidate cursors.
+
+    Example:
+        Remove all even values in a single pass:
+
+            cur = ll.cursor()
+            while not cur.at_end:
+                if cur.value % 2 == 0:
+                    cur.remove_current()
+                else:
+                    cur.move_next()
+    """
+
+    def __init__(self, owner: LinkedList[T], prev: _Node[T] | None, index: int) -> None:
+        """Initialize a cursor. Use `LinkedList.cursor` instead.
+
+        Args:
+            owner: The list the cursor moves over.
+            prev: The node before the cursor position, or None at the head.
+            index: The index of the cursor position.
+        """
+        self._owner = owner
+        self._prev = prev
+        self._curr = owner._after(prev)
+        self._index = index
+        self._mod_count = owner._mod_count
+
+    @property
+    def index(self) -> int:
+        """The index of the value under the cursor, or the length at the end."""
+        self._check()
+        return self._index
+
+    @property
+    def at_end(self) -> bool:
+        """Whether the cursor is past the last value."""
+        self._check()
+        return self._curr is None
+
+    @property
+    def value(self) -> T:
+        """The value under the cursor.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+        """
+        return self._current().value
+
+    # -------------------------------------------------
+    # Movement
+    # -------------------------------------------------
+
+    def move_next(self) -> None:
+        """Move the cursor to the next value, or past the end.
+
+        Raises:
+            IndexError: If the cursor is already past the end.
+
+        Time complexity: O(1).
+        """
+        self._prev = self._current()
+        self._curr = self._owner._after(self._prev)
+        self._index += 1
+
+    def move_prev(self) -> None:
+        """Move the cursor to the previous value.
+
+        Raises:
+            IndexError: If the cursor is on the first value.
+
+        Time complexity: O(1) for a `DoublyLinkedList`, O(n) for a `LinkedList`.
+        """
+        self._check()
+        if self._prev is None:
+            raise IndexError('cursor is at the start of the list')
+        self._curr = self._prev
+        self._prev = self._owner._predecessor(self._prev)
+        self._index -= 1
+
+    # -------------------------------------------------
+    # Editing
+    # -------------------------------------------------
+
+    def insert_before(self, value: T) -> None:
+        """Insert a value before the cursor. The cursor stays on its value.
+
+        Past the end, this appends to the list.
+
+        Args:
+            value: The value to insert.
+
+        Time complexity: O(1).
+        """
+        self._check()
+        node = self._owner._new_node(value)
+        self._owner._link_after(self._prev, node)
+        self._prev = node
+        self._index += 1
+        self._mod_count = self._owner._mod_count
+
+    def insert_after(self, value: T) -> None:
+        """Insert a value after the cursor. The cursor stays on its value.
+
+        Args:
+            value: The value to insert.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+
+        Time complexity: O(1).
+        """
+        current = self._current()
+        self._owner._link_after(current, self._owner._new_node(value))
+        self._mod_count = self._owner._mod_count
+
+    def remove_current(self) -> T:
+        """Remove the value under the cursor and move onto the value after it.
+
+        Returns:
+            The removed value.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+
+        Time complexity: O(1).
+        """
+        self._current()
+        node = self._owner._unlink_after(self._prev)
+        self._curr = self._owner._after(self._prev)
+        self._mod_count = self._owner._mod_count
+        value = node.value
+        self._owner._release_node(node)
+        return value
+
+    def replace(self, value: T) -> T:
+        """Replace the value under the cursor.
+
+        Args:
+            value: The new value.
+
+        Returns:
+            The value that was replaced.
+
+        Raises:
+            IndexError: If the cursor is past the end.
+
+        Time complexity: O(1).
+        """
+        node = self._current()
+        old, node.value = node.value, value
+        return old
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cursor.
+
+        Returns:
+            A string showing the cursor's index and the value under it.
+
+        Example:
+            Cursor(index=2, value=5)
+        """
+        node = self._curr
+        value = 'END' if node is None else repr(node.value)
+        return f'{self.__class__.__name__}(index={self._index}, value={value})'
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+
+    def _check(self) -> None:
+        """Fail fast if the list was structurally changed outside the cursor.
+
+        Raises:
+            RuntimeError: If the list was changed since the cursor last saw it.
+        """
+        if self._owner._mod_count != self._mod_count:
+            raise RuntimeError(f'{self._owner.__class__.__name__} changed outside the cursor')
+
+    def _current(self) -> _Node[T]:
+        """Return the node under the cursor after checking the cursor is valid.
+
+        Raises:
+            RuntimeError: If the list was changed outside the cursor.
+            IndexError: If the cursor is past the end.
+        """
+        self._check()
+        if self._curr is None:
+            raise IndexError('cursor is past the end of the list')
+        return self._curr
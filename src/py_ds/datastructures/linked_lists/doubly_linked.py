@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from typing import Any
 
+from py_ds.datastructures.linked_lists.node_handle import NodeHandle
 from py_ds.datastructures.linked_lists.singly_linked import LinkedList, T, _Node
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class _DoublyNode(_Node[T]):
     """A node in the doubly linked list."""
 
@@ -17,59 +19,133 @@ class DoublyLinkedList(LinkedList[T]):
     """A doubly linked list with forward and backward links.
 
     Advantages over singly linked list include O(1) append (with tail pointer),
-    O(1) tail access, bidirectional traversal, and more efficient deletion
-    when node reference is known.
+    O(1) tail access, bidirectional traversal, and O(1) deletion when the node
+    is known: `append`, `prepend` and `insert` can return a `NodeHandle` that
+    `remove_node`, `insert_after`, `insert_before`, `move_to_front` and
+    `move_to_end` accept.
+
+    Internally the nodes form a ring closed by one sentinel node: the
+    sentinel's `next` is the head and its `prev` is the tail, and the head and
+    tail point back at it. Every node therefore has real neighbours on both
+    sides, so linking and unlinking never branch on the ends or on an empty
+    list. The sentinel counts as index -1 (and `n`) when walking by index.
     """
 
-    def __init__(self, items: Iterable[T] | None = None) -> None:
+    _node_type: type[_DoublyNode] = _DoublyNode
+
+    def __init__(self, items: Iterable[T] | None = None, pool_size: int = 0) -> None:
         """Initialize the doubly linked list with optional items.
 
         Args:
             items: Optional iterable of items to initialize the list with.
+            pool_size: If positive, removed nodes are recycled through a
+                `NodePool` holding up to this many free nodes.
         """
-        self._head: _DoublyNode[T] | None = None
-        self._tail: _DoublyNode[T] | None = None
-        super().__init__(items)
-
-    def append(self, value: T) -> None:
+        # Its value stays None, which makes head() and tail() of an empty list None.
+        self._sentinel: _DoublyNode[Any] = _DoublyNode(None)
+        # Bumped when nodes leave the list wholesale, which makes all handles stale.
+        self._epoch: int = 0
+        super().__init__(items, pool_size)
+
+    @property
+    def _head(self) -> _DoublyNode[T] | None:
+        """The first node, or None if the list is empty."""
+        node = self._sentinel.next
+        return None if node is self._sentinel else node
+
+    @property
+    def _tail(self) -> _DoublyNode[T] | None:
+        """The last node, or None if the list is empty."""
+        node = self._sentinel.prev
+        return None if node is self._sentinel else node
+
+    def append(self, value: T, handle: bool = False) -> NodeHandle[T] | None:
         """Add a value to the end of the list.
 
         Args:
             value: The value to append to the list.
+            handle: If True, return a handle to the new value.
+
+        Returns:
+            A `NodeHandle` to the new value if `handle` is True, else None.
 
         Time complexity: O(1).
         """
-        node = _DoublyNode(value)
-        if self._head is None:
-            self._head = self._tail = node
-        else:
-            self._tail.next = node
-            node.prev = self._tail
-            self._tail = node
-        self._length += 1
+        node = self._new_node(value)
+        self._link_after(self._sentinel.prev, node)
+        return NodeHandle(self, node) if handle else None
 
-    def prepend(self, value: T) -> None:
+    def prepend(self, value: T, handle: bool = False) -> NodeHandle[T] | None:
         """Add a value to the beginning of the list.
 
         Args:
             value: The value to prepend to the list.
+            handle: If True, return a handle to the new value.
+
+        Returns:
+            A `NodeHandle` to the new value if `handle` is True, else None.
 
         Time complexity: O(1).
         """
-        node = _DoublyNode(value)
-        if self._head is None:
-            self._head = self._tail = node
-        else:
-            node.next = self._head
-            self._head.prev = node
-            self._head = node
-        self._length += 1
+        node = self._new_node(value)
+        self._link_after(self._sentinel, node)
+        return NodeHandle(self, node) if handle else None
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append multiple values to the end of the list, in iteration order.
+
+        The new nodes are chained together in a single pass and linked to the
+        tail once, without going through `append` for every value.
+
+        Args:
+            items: An iterable of values to append.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        sentinel = self._sentinel
+        tail, count = sentinel.prev, 0
+        for value in items:
+            node = self._new_node(value)
+            node.prev = tail
+            tail.next = node
+            tail = node
+            count += 1
+        tail.next = sentinel
+        sentinel.prev = tail
+        self._length += count
+        self._mod_count += 1
+
+    def _pop_front(self, n: int) -> list[T]:
+        """Detach the first `n` nodes and return their values.
+
+        Args:
+            n: The number of values to remove. Must not exceed the length.
+
+        Returns:
+            The removed values, head first.
+
+        Time complexity: O(n).
+        """
+        values = []
+        sentinel = self._sentinel
+        curr = sentinel.next
+        for _ in range(n):
+            values.append(curr.value)
+            node, curr = curr, curr.next
+            self._release_node(node)
+        sentinel.next = curr
+        curr.prev = sentinel
+        self._length -= n
+        self._mod_count += 1
+        self._epoch += 1
+        return values
 
     def _get_node_at(self, index: int) -> _DoublyNode[T]:
         """Get the node at the specified index.
 
-        Uses bidirectional traversal for efficiency when accessing nodes near
-        the tail.
+        Walks from the sentinel at either end or from the finger (the node
+        found by the previous lookup), whichever is closest, in either
+        direction.
 
         Args:
             index: The position of the node to retrieve. Supports negative indexing.
@@ -80,49 +156,48 @@ class DoublyLinkedList(LinkedList[T]):
         Raises:
             IndexError: If the list is empty or index is out of bounds.
 
-        Time complexity: O(n).
+        Time complexity: O(n), and O(1) amortized for sequential indexes.
         """
         self._validate_index(index)
-        if index < 0:
-            index = self._length + index
-
-        if index <= self._length // 2:
-            return super()._get_node_at(index)
-
-        curr = self._tail
-        for _ in range(self._length - index - 1):
+        index = self._get_positive_index(index)
+
+        at, curr = -1, self._sentinel
+        if self._length - index < index + 1:
+            at = self._length
+        finger = self._valid_finger()
+        if finger is not None and abs(index - finger[0]) < abs(index - at):
+            at, curr = finger
+        for _ in range(at, index):
+            curr = curr.next
+        for _ in range(index, at):
             curr = curr.prev
+        self._set_finger(index, curr)
         return curr
 
-    def insert(self, index: int, value: T) -> None:
+    def insert(self, index: int, value: T, handle: bool = False) -> NodeHandle[T] | None:
         """Insert a value at a specific index.
 
         Args:
             index: The position at which to insert the value.
             value: The value to insert.
+            handle: If True, return a handle to the new value.
+
+        Returns:
+            A `NodeHandle` to the new value if `handle` is True, else None.
 
         Raises:
             IndexError: If index is out of bounds.
 
         Time complexity: O(n).
         """
-        if index == self._length:
-            self.append(value)
-            return
-
-        new_node = _DoublyNode(value)
-        index_node = self._get_node_at(index)
-        prev = index_node.prev
-
-        new_node.next = index_node
-        index_node.prev = new_node
-
-        if prev:
-            prev.next = new_node
-            new_node.prev = prev
-        else:
-            self._head = new_node
-        self._length += 1
+        position = self._get_positive_index(index)
+        if position < 0 or position > self._length:
+            raise IndexError('index out of bounds on list')
+        prev = self._sentinel.prev if position == self._length else self._get_node_at(position).prev
+        node = self._new_node(value)
+        self._link_after(prev, node)
+        self._set_finger(position - 1, prev)
+        return NodeHandle(self, node) if handle else None
 
     def remove(self, value: T) -> None:
         """Remove the first occurrence of `value` from the list.
@@ -135,29 +210,13 @@ class DoublyLinkedList(LinkedList[T]):
 
         Time complexity: O(n).
         """
-        curr = self._head
-        while curr and curr.value != value:
+        sentinel = self._sentinel
+        curr = sentinel.next
+        while curr is not sentinel and curr.value != value:
             curr = curr.next
-        if curr is None or curr.value != value:
+        if curr is sentinel:
             raise ValueError('value not found')
-
-        prev = curr.prev
-        next_ = curr.next
-
-        if prev:
-            prev.next = next_
-        else:
-            self._head = next_
-            if self._head:
-                self._head.prev = None
-
-        if next_:
-            next_.prev = prev
-        else:
-            self._tail = prev
-            if self._tail:
-                self._tail.next = None
-        self._length -= 1
+        self._release_node(self._unlink_after(curr.prev))
 
     def pop(self, index: int = -1) -> T:
         """Remove and return the item at the given index.
@@ -174,29 +233,214 @@ class DoublyLinkedList(LinkedList[T]):
 
         Time complexity: O(n).
         """
+        position = self._get_positive_index(index)
         curr = self._get_node_at(index)
+        prev = curr.prev
+        self._unlink_after(prev)
+        self._set_finger(position - 1, prev)
         value = curr.value
-        prev, next_ = curr.prev, curr.next
-
-        if prev:
-            prev.next = next_
-        else:
-            self._head = next_
-
-        if next_:
-            next_.prev = prev
-        else:
-            self._tail = prev
-        self._length -= 1
+        self._release_node(curr)
         return value
 
     def clear(self) -> None:
         """Remove all elements from the list.
 
+        Time complexity: O(1).
+        """
+        super().clear()
+        self._epoch += 1
+
+    def split_at(self, index: int) -> DoublyLinkedList[T]:
+        """Cut the list in two, moving the values from `index` on to a new list.
+
+        All handles to this list become stale, including handles to the values
+        that stay.
+
+        Args:
+            index: 0-based index of the first value to move, negative indexes
+                supported (Python style).
+
+        Returns:
+            A new list of the same type holding the moved nodes.
+
+        Raises:
+            IndexError: If index is out of bounds.
+
+        Time complexity: O(min(index, n - index)), plus O(1) for the cut itself.
+        """
+        position = self._get_positive_index(index)
+        if position < 0 or position > self._length:
+            raise IndexError('index out of bounds on list')
+        rest = type(self)()
+        if position == self._length:
+            return rest
+        sentinel = self._sentinel
+        prev = self._get_node_at(position - 1) if position > 0 else sentinel
+        first, last = prev.next, sentinel.prev
+        prev.next = sentinel
+        sentinel.prev = prev
+        rest._link_chain_after(None, first, last, self._length - position)
+        self._length = position
+        self._mod_count += 1
+        self._epoch += 1
+        return rest
+
+    def reverse(self) -> None:
+        """Reverse the list in place by swapping the links of every node.
+
+        No values are copied and no nodes are allocated. Node handles stay valid.
+
         Time complexity: O(n).
         """
-        self._head = self._tail = None
-        self._length = 0
+        curr = self._sentinel
+        for _ in range(self._length + 1):
+            curr.next, curr.prev = curr.prev, curr.next
+            curr = curr.prev
+        self._mod_count += 1
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the list `k` steps to the right, like `collections.deque.rotate`.
+
+        The last `k` values move to the front; a negative `k` moves the first
+        `-k` values to the end instead. The cut is found from whichever end is
+        closer, and rotating just moves the sentinel there: the old ends are
+        joined and the ring is reopened at the cut. Node handles stay valid.
+
+        Args:
+            k: The number of steps to rotate. Any integer is accepted.
+
+        Time complexity: O(min(k, n - k)), with k taken mod n.
+        """
+        n = self._length
+        if n < 2 or k % n == 0:
+            return
+        new_tail = self._get_node_at(n - k % n - 1)
+        sentinel = self._sentinel
+        head, tail = sentinel.next, sentinel.prev
+        tail.next = head
+        head.prev = tail
+        new_head = new_tail.next
+        new_tail.next = sentinel
+        sentinel.prev = new_tail
+        new_head.prev = sentinel
+        sentinel.next = new_head
+        self._mod_count += 1
+
+    # -------------------------------------------------
+    # Node handle operations
+    # -------------------------------------------------
+
+    def remove_node(self, handle: NodeHandle[T]) -> T:
+        """Remove the value a handle refers to.
+
+        Args:
+            handle: A live handle to a value of this list. It is stale afterwards.
+
+        Returns:
+            The removed value.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+
+        Time complexity: O(1).
+        """
+        node = self._handle_node(handle)
+        self._unlink_after(node.prev)
+        value = node.value
+        self._release_node(node)
+        return value
+
+    def insert_after(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        """Insert a value right after the value a handle refers to.
+
+        Args:
+            handle: A live handle to a value of this list.
+            value: The value to insert.
+
+        Returns:
+            A handle to the new value.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+
+        Time complexity: O(1).
+        """
+        prev = self._handle_node(handle)
+        node = self._new_node(value)
+        self._link_after(prev, node)
+        return NodeHandle(self, node)
+
+    def insert_before(self, handle: NodeHandle[T], value: T) -> NodeHandle[T]:
+        """Insert a value right before the value a handle refers to.
+
+        Args:
+            handle: A live handle to a value of this list.
+            value: The value to insert.
+
+        Returns:
+            A handle to the new value.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+
+        Time complexity: O(1).
+        """
+        following = self._handle_node(handle)
+        node = self._new_node(value)
+        self._link_after(following.prev, node)
+        return NodeHandle(self, node)
+
+    def move_to_front(self, handle: NodeHandle[T]) -> None:
+        """Move the value a handle refers to to the beginning of the list.
+
+        The handle stays valid.
+
+        Args:
+            handle: A live handle to a value of this list.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+
+        Time complexity: O(1).
+        """
+        node = self._handle_node(handle)
+        self._unlink_after(node.prev)
+        self._link_after(self._sentinel, node)
+
+    def move_to_end(self, handle: NodeHandle[T]) -> None:
+        """Move the value a handle refers to to the end of the list.
+
+        The handle stays valid.
+
+        Args:
+            handle: A live handle to a value of this list.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+
+        Time complexity: O(1).
+        """
+        node = self._handle_node(handle)
+        self._unlink_after(node.prev)
+        self._link_after(self._sentinel.prev, node)
+
+    def _handle_node(self, handle: NodeHandle[T]) -> _DoublyNode[T]:
+        """Return the node of a handle after checking it is live and ours.
+
+        Args:
+            handle: The handle to check.
+
+        Returns:
+            The node the handle refers to.
+
+        Raises:
+            ValueError: If the handle is stale or belongs to another list.
+        """
+        if handle._owner is not self:
+            raise ValueError('handle belongs to another list')
+        if not handle.alive:
+            raise ValueError('stale node handle')
+        return handle._node
 
     def head(self) -> T | None:
         """Return the first value in the list.
@@ -206,7 +450,7 @@ class DoublyLinkedList(LinkedList[T]):
 
         Time complexity: O(1).
         """
-        return self._head.value if self._head else None
+        return self._sentinel.next.value
 
     def tail(self) -> T | None:
         """Return the last value in the list.
@@ -216,7 +460,19 @@ class DoublyLinkedList(LinkedList[T]):
 
         Time complexity: O(1).
         """
-        return self._tail.value if self._tail else None
+        return self._sentinel.prev.value
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through values in the list.
+
+        Yields:
+            The values in the list from head to tail.
+        """
+        sentinel = self._sentinel
+        curr = sentinel.next
+        while curr is not sentinel:
+            yield curr.value
+            curr = curr.next
 
     def reverse_iter(self) -> Iterator[T]:
         """Iterate through values from tail to head.
@@ -229,11 +485,185 @@ class DoublyLinkedList(LinkedList[T]):
 
         Time complexity: O(n).
         """
-        curr = self._tail
-        while curr:
+        sentinel = self._sentinel
+        curr = sentinel.prev
+        while curr is not sentinel:
             yield curr.value
             curr = curr.prev
 
+    # -------------------------------------------------
+    # Node linking primitives
+    # -------------------------------------------------
+
+    def _reset_links(self) -> None:
+        """Close the sentinel on itself, leaving the list with no nodes."""
+        sentinel = self._sentinel
+        sentinel.next = sentinel.prev = sentinel
+
+    def _after(self, prev: _DoublyNode[T] | None) -> _DoublyNode[T] | None:
+        """Return the node after `prev`, or the head if `prev` is None.
+
+        Args:
+            prev: A node in the list, or None for the position before the head.
+
+        Returns:
+            The following node, or None if `prev` is the tail.
+
+        Time complexity: O(1).
+        """
+        node = (self._sentinel if prev is None else prev).next
+        return None if node is self._sentinel else node
+
+    def _iter_nodes(self) -> Iterator[_DoublyNode[T]]:
+        """Iterate through the nodes of the list.
+
+        Yields:
+            Each node, from head to tail.
+        """
+        sentinel = self._sentinel
+        curr = sentinel.next
+        while curr is not sentinel:
+            yield curr
+            curr = curr.next
+
+    def _iter_nodes_reversed(self) -> Iterator[_DoublyNode[T]]:
+        """Iterate through the nodes of the list backwards.
+
+        Yields:
+            Each node, from tail to head.
+        """
+        sentinel = self._sentinel
+        curr = sentinel.prev
+        while curr is not sentinel:
+            yield curr
+            curr = curr.prev
+
+    def _link_after(self, prev: _DoublyNode[T] | None, node: _DoublyNode[T]) -> None:
+        """Link a detached node after `prev`, or at the head if `prev` is None.
+
+        `prev` may also be the sentinel, which links at the head as well.
+
+        Args:
+            prev: The node to link after, or None to link at the head.
+            node: The node to link.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            prev = self._sentinel
+        following = prev.next
+        node.prev = prev
+        node.next = following
+        prev.next = node
+        following.prev = node
+        self._length += 1
+        self._mod_count += 1
+
+    def _unlink_after(self, prev: _DoublyNode[T] | None) -> _DoublyNode[T]:
+        """Unlink the node after `prev`, or the head if `prev` is None.
+
+        `prev` may also be the sentinel, which unlinks the head as well. The
+        node is not released to the pool, so callers can still read it.
+
+        Args:
+            prev: The node before the one to unlink, or None for the head.
+
+        Returns:
+            The unlinked node.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            prev = self._sentinel
+        node = prev.next
+        following = node.next
+        prev.next = following
+        following.prev = prev
+        self._length -= 1
+        self._mod_count += 1
+        return node
+
+    def _link_chain_after(
+        self, prev: _DoublyNode[T] | None, first: _DoublyNode[T], last: _DoublyNode[T], count: int
+    ) -> None:
+        """Link a detached chain of nodes after `prev`, or at the head if `prev` is None.
+
+        Args:
+            prev: The node to link after, or None to link at the head.
+            first: The first node of the chain.
+            last: The last node of the chain.
+            count: The number of nodes in the chain.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            prev = self._sentinel
+        following = prev.next
+        first.prev = prev
+        last.next = following
+        prev.next = first
+        following.prev = last
+        self._length += count
+        self._mod_count += 1
+
+    def _values_at(self, positions: Sequence[int]) -> list[T]:
+        """Collect the values at increasing, valid positions in one walk.
+
+        Walks backward from the last position when the positions sit closer to
+        the tail than to the head.
+
+        Args:
+            positions: Non-negative indexes in increasing order.
+
+        Returns:
+            The values at `positions`, in the same order.
+
+        Time complexity: O(n).
+        """
+        if positions[0] <= self._length - 1 - positions[-1]:
+            return super()._values_at(positions)
+        values = []
+        at = positions[-1]
+        node = self._get_node_at(at)
+        for position in reversed(positions):
+            for _ in range(at - position):
+                node = node.prev
+            at = position
+            values.append(node.value)
+        values.reverse()
+        return values
+
+    def _relink(self, nodes: list[_DoublyNode[T]]) -> None:
+        """Chain all nodes of the list again, in the given order.
+
+        Args:
+            nodes: Every node of the list, in their new order.
+
+        Time complexity: O(n).
+        """
+        prev = sentinel = self._sentinel
+        for node in nodes:
+            node.prev = prev
+            prev.next = node
+            prev = node
+        prev.next = sentinel
+        sentinel.prev = prev
+        self._mod_count += 1
+
+    def _predecessor(self, node: _DoublyNode[T] | None) -> _DoublyNode[T] | None:
+        """Return the node before `node`, or the tail if `node` is None.
+
+        Args:
+            node: A node in the list, or None for the position past the end.
+
+        Returns:
+            The node before `node`, or None if `node` is the head.
+
+        Time complexity: O(1).
+        """
+        prev = (self._sentinel if node is None else node).prev
+        return None if prev is self._sentinel else prev
+
     def __str__(self) -> str:
         """Return a string representation of the linked list.
 
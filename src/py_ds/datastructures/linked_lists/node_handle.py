@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .doubly_linked import DoublyLinkedList, _DoublyNode
+
+T = TypeVar('T')
+
+
+class NodeHandle(Generic[T]):
+    """A stable reference to one value of a `DoublyLinkedList`.
+
+    Handles are returned by `append`, `prepend` and `insert` when called with
+    `handle=True`, and by `insert_after` and `insert_before`. Passing a handle
+    back to the list removes, moves or inserts next to its value in O(1),
+    without searching. Unlike a `Cursor`, a handle stays valid while the list
+    is changed elsewhere.
+
+    A handle becomes stale once its value is removed from the list, or when
+    the list is cleared, split with `split_at` or concatenated into another
+    list. The list rejects stale handles with ValueError. With a node pool
+    (`pool_size`), a node removed by `pop` or `remove` can be reused for a new
+    value in the same list, and an old handle to it cannot tell the
+    difference; drop handles to values removed that way.
+    """
+
+    __slots__ = ('_owner', '_node', '_epoch')
+
+    def __init__(self, owner: DoublyLinkedList[T], node: _DoublyNode[T]) -> None:
+        """Initialize a handle. Use the `DoublyLinkedList` methods instead.
+
+        Args:
+            owner: The list holding the node.
+            node: The node the handle refers to.
+        """
+        self._owner = owner
+        self._node = node
+        self._epoch = owner._epoch
+
+    @property
+    def alive(self) -> bool:
+        """Whether the handle still refers to a value in its list."""
+        owner, node = self._owner, self._node
+        if self._epoch != owner._epoch:
+            return False
+        return (owner._head if node.prev is None else node.prev.next) is node
+
+    @property
+    def value(self) -> T:
+        """The value the handle refers to.
+
+        Raises:
+            ValueError: If the handle is stale.
+        """
+        return self._owner._handle_node(self).value
+
+    @value.setter
+    def value(self, value: T) -> None:
+        self._owner._handle_node(self).value = value
+
+    def __repr__(self) -> str:
+        """Return a string representation of the handle.
+
+        Returns:
+            A string showing the value the handle refers to.
+
+        Example:
+            NodeHandle(value=5)
+        """
+        value = repr(self._node.value) if self.alive else 'STALE'
+        return f'{self.__class__.__name__}(value={value})'
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from itertools import pairwise
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+from ..node_pool import NodePool
+from .cursor import Cursor
 
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class _Node(Generic[T]):
     """A node in the singly linked list.
 
@@ -27,18 +32,52 @@ class LinkedList(Generic[T]):
     and length/truthiness operations.
     """
 
-    def __init__(self, items: Iterable[T] | None = None) -> None:
+    _node_type: type[_Node] = _Node
+
+    def __init__(self, items: Iterable[T] | None = None, pool_size: int = 0) -> None:
         """Initialize the list with optional items.
 
         Args:
             items: Optional iterable of items to initialize the list with.
                 If None, creates an empty list.
+            pool_size: If positive, removed nodes are recycled through a
+                `NodePool` holding up to this many free nodes.
         """
-        self._head: _Node[T] | None = None
-        self._tail: _Node[T] | None = None
+        self._reset_links()
         self._length: int = 0
-        for item in items or []:
-            self.append(item)
+        self._mod_count: int = 0
+        # Last node reached by index, valid while _finger_mod_count == _mod_count.
+        self._finger: tuple[int, _Node[T]] | None = None
+        self._finger_mod_count: int = 0
+        self._pool: NodePool[_Node[T]] | None = NodePool(self._node_type, pool_size) if pool_size else None
+        self.extend(items or [])
+
+    @property
+    def pool(self) -> NodePool[_Node[T]] | None:
+        """The node pool of the list, or None if pooling is disabled."""
+        return self._pool
+
+    def _new_node(self, value: T) -> _Node[T]:
+        """Create a node for a value, reusing a pooled node when possible.
+
+        Args:
+            value: The value to store in the node.
+
+        Returns:
+            A node holding `value` with no links.
+        """
+        if self._pool is not None:
+            return self._pool.acquire(value)
+        return self._node_type(value)
+
+    def _release_node(self, node: _Node[T]) -> None:
+        """Hand an unlinked node back to the pool, if pooling is enabled.
+
+        Args:
+            node: The node that was just removed from the list.
+        """
+        if self._pool is not None:
+            self._pool.release(node)
 
     def append(self, value: T) -> None:
         """Add a value to the end of the list.
@@ -46,15 +85,9 @@ class LinkedList(Generic[T]):
         Args:
             value: The value to append to the list.
 
-        Time complexity: O(n).
+        Time complexity: O(1).
         """
-        new_node = _Node(value=value)
-        if self._head is None:
-            self._head = self._tail = new_node
-        else:
-            self._tail.next = new_node
-            self._tail = new_node
-        self._length += 1
+        self._link_after(self._tail, self._new_node(value))
 
     def prepend(self, value: T) -> None:
         """Add a value to the beginning of the list.
@@ -64,13 +97,31 @@ class LinkedList(Generic[T]):
 
         Time complexity: O(1).
         """
-        new_node = _Node(value=value)
-        if self._head is None:
-            self._head = self._tail = new_node
-        else:
-            new_node.next = self._head
-            self._head = new_node
-        self._length += 1
+        self._link_after(None, self._new_node(value))
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append multiple values to the end of the list, in iteration order.
+
+        The new nodes are chained together in a single pass and linked to the
+        tail once, without going through `append` for every value.
+
+        Args:
+            items: An iterable of values to append.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        tail, count = self._tail, 0
+        for value in items:
+            node = self._new_node(value)
+            if tail is None:
+                self._head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        self._tail = tail
+        self._length += count
+        self._mod_count += 1
 
     def insert(self, index: int, value: T) -> None:
         """Insert a value at a specific index.
@@ -87,16 +138,9 @@ class LinkedList(Generic[T]):
         index = self._get_positive_index(index) + int(index < 0)
         if index < 0 or index > self._length:
             raise IndexError('index out of bounds on list')
-        if index == 0:
-            self.prepend(value)
-        elif index == self._length:
-            self.append(value)
-        else:
-            new_node = _Node(value=value)
-            prev = self._get_node_at(index - 1)
-            new_node.next = prev.next
-            prev.next = new_node
-            self._length += 1
+        prev = self._get_node_at(index - 1) if index > 0 else None
+        self._link_after(prev, self._new_node(value))
+        self._set_finger(index - 1, prev)
 
     def remove(self, value: T) -> None:
         """Remove the first occurrence of `value` from the list.
@@ -115,16 +159,7 @@ class LinkedList(Generic[T]):
             curr = curr.next
         if not curr or curr.value != value:
             raise ValueError('value not found')
-
-        if prev:
-            prev.next = curr.next
-            if curr == self._tail:
-                self._tail = prev
-        else:
-            self._head = self._head.next
-            if self._head is None:
-                self._tail = None
-        self._length -= 1
+        self._release_node(self._unlink_after(prev))
 
     def pop(self, index: int = -1) -> T:
         """Remove and return the item at the given index.
@@ -144,28 +179,48 @@ class LinkedList(Generic[T]):
         idx = self._get_positive_index(index)
         if idx < 0 or idx >= self._length:
             raise IndexError('invalid index')
-        try:
-            assert idx - 1 >= 0
-            prev_node = self._get_node_at(idx - 1)
-            value = prev_node.next.value
-            prev_node.next = prev_node.next.next
-            if prev_node.next is None:
-                self._tail = prev_node
-        except AssertionError:
-            value = self._head.value
-            self._head = self._head.next
-            if self._head is None:
-                self._tail = None
-        self._length -= 1
+        prev = self._get_node_at(idx - 1) if idx > 0 else None
+        node = self._unlink_after(prev)
+        self._set_finger(idx - 1, prev)
+        value = node.value
+        self._release_node(node)
         return value
 
+    def _pop_front(self, n: int) -> list[T]:
+        """Detach the first `n` nodes and return their values.
+
+        Used by `Queue.dequeue_many` to remove a batch with a single walk.
+
+        Args:
+            n: The number of values to remove. Must not exceed the length.
+
+        Returns:
+            The removed values, head first.
+
+        Time complexity: O(n).
+        """
+        values = []
+        curr = self._head
+        for _ in range(n):
+            values.append(curr.value)
+            node, curr = curr, curr.next
+            self._release_node(node)
+        self._head = curr
+        if curr is None:
+            self._tail = None
+        self._length -= n
+        self._mod_count += 1
+        return values
+
     def clear(self) -> None:
         """Remove all elements from the list.
 
         Time complexity: O(1).
         """
-        self._head = self._tail = None
+        self._reset_links()
         self._length = 0
+        self._mod_count += 1
+        self._finger = None
 
     def head(self) -> T | None:
         """Return the first value in the list.
@@ -220,20 +275,59 @@ class LinkedList(Generic[T]):
         """
         return self._length > 0
 
-    def __getitem__(self, index: int) -> T:
-        """Get the value at the given index.
+    def __getitem__(self, index: int | slice) -> T | LinkedList[T]:
+        """Get the value at the given index, or a new list for a slice.
 
         Args:
-            index: 0-based index, negative indexes supported (Python style).
+            index: 0-based index, negative indexes supported (Python style),
+                or a slice.
 
         Returns:
-            The value at the specified index.
+            The value at the specified index, or a new list of the same type
+            holding the sliced values.
 
         Raises:
             IndexError: If the index is out of range.
+
+        Time complexity: O(n). A slice is collected in a single traversal.
         """
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._length))
+            if not positions:
+                return type(self)()
+            if positions.step > 0:
+                return type(self)(self._values_at(positions))
+            return type(self)(reversed(self._values_at(positions[::-1])))
         return self._get_node_at(index).value
 
+    def get_many(self, indices: Iterable[int]) -> list[T]:
+        """Get the values at several indexes with a single traversal.
+
+        The indexes are sorted and visited in one walk, so each node is passed
+        at most once no matter how many indexes are requested.
+
+        Args:
+            indices: 0-based indexes, negative indexes supported (Python style).
+                Duplicates and any order are allowed.
+
+        Returns:
+            The values at the requested indexes, in the order requested.
+
+        Raises:
+            IndexError: If any index is out of range.
+
+        Time complexity: O(n + k log k), where k is the number of indexes.
+        """
+        positions = []
+        for index in indices:
+            self._validate_index(index)
+            positions.append(self._get_positive_index(index))
+        if not positions:
+            return []
+        wanted = sorted(set(positions))
+        found = dict(zip(wanted, self._values_at(wanted), strict=True))
+        return [found[position] for position in positions]
+
     def __setitem__(self, index: int, value: T) -> None:
         """Set item at the specified index.
 
@@ -280,6 +374,329 @@ class LinkedList(Generic[T]):
             return 'HEAD → TAIL'
         return 'HEAD → ' + ' → '.join(str(item) for item in self) + ' → TAIL'
 
+    def concat(self, other: LinkedList[T]) -> None:
+        """Move all nodes of another list to the end of this list.
+
+        The nodes are relinked, not copied, and `other` is left empty.
+
+        Args:
+            other: The list to take the nodes from.
+
+        Raises:
+            TypeError: If `other` is not a list of the same kind.
+            ValueError: If `other` is this list.
+
+        Time complexity: O(1).
+        """
+        self._splice_from(self._tail, other)
+
+    def splice(self, index: int, other: LinkedList[T]) -> None:
+        """Move all nodes of another list into this list before `index`.
+
+        The nodes are relinked, not copied, and `other` is left empty.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+                `len(self)` splices at the end.
+            other: The list to take the nodes from.
+
+        Raises:
+            IndexError: If index is out of bounds.
+            TypeError: If `other` is not a list of the same kind.
+            ValueError: If `other` is this list.
+
+        Time complexity: O(index), plus O(1) for the splice itself.
+        """
+        position = self._get_positive_index(index)
+        if position < 0 or position > self._length:
+            raise IndexError('index out of bounds on list')
+        self._splice_from(self._get_node_at(position - 1) if position > 0 else None, other)
+
+    def split_at(self, index: int) -> LinkedList[T]:
+        """Cut the list in two, moving the values from `index` on to a new list.
+
+        Args:
+            index: 0-based index of the first value to move, negative indexes
+                supported (Python style).
+
+        Returns:
+            A new list of the same type holding the moved nodes.
+
+        Raises:
+            IndexError: If index is out of bounds.
+
+        Time complexity: O(index), plus O(1) for the cut itself.
+        """
+        position = self._get_positive_index(index)
+        if position < 0 or position > self._length:
+            raise IndexError('index out of bounds on list')
+        rest = type(self)()
+        if position == self._length:
+            return rest
+        prev = self._get_node_at(position - 1) if position > 0 else None
+        first, last = (self._head if prev is None else prev.next), self._tail
+        if prev is None:
+            self._head = None
+        else:
+            prev.next = None
+        rest._link_chain_after(None, first, last, self._length - position)
+        self._tail = prev
+        self._length = position
+        self._mod_count += 1
+        return rest
+
+    def sort(self, key: Callable[[T], Any] | None = None, reverse: bool = False) -> None:
+        """Sort the list in place by relinking its nodes.
+
+        The nodes are ordered with the built-in stable sort and then chained
+        again in that order. No values are copied and no nodes are allocated,
+        so every value keeps its node.
+
+        Args:
+            key: Optional function computing the sort key of each value. Keys
+                are computed once per value.
+            reverse: If True, sort in descending order.
+
+        Time complexity: O(n log n).
+        """
+        if self._length < 2:
+            return
+        nodes = list(self._iter_nodes())
+        nodes.sort(key=attrgetter('value') if key is None else lambda node: key(node.value), reverse=reverse)
+        self._relink(nodes)
+
+    def reverse(self) -> None:
+        """Reverse the list in place by flipping every link.
+
+        No values are copied and no nodes are allocated.
+
+        Time complexity: O(n).
+        """
+        prev, curr = None, self._head
+        self._tail = curr
+        while curr is not None:
+            following = curr.next
+            curr.next = prev
+            prev, curr = curr, following
+        self._head = prev
+        self._mod_count += 1
+
+    def rotate(self, k: int = 1) -> None:
+        """Rotate the list `k` steps to the right, like `collections.deque.rotate`.
+
+        The last `k` values move to the front; a negative `k` moves the first
+        `-k` values to the end instead. The list is closed into a ring and cut
+        at the new position, so only the links at the cut change.
+
+        Args:
+            k: The number of steps to rotate. Any integer is accepted.
+
+        Time complexity: O(n - k mod n) to find the cut, plus O(1) to relink.
+        """
+        n = self._length
+        if n < 2 or k % n == 0:
+            return
+        new_tail = self._get_node_at(n - k % n - 1)
+        new_head = new_tail.next
+        new_tail.next = None
+        self._tail.next = self._head
+        self._head, self._tail = new_head, new_tail
+        self._mod_count += 1
+
+    def cursor(self, at: int = 0) -> Cursor[T]:
+        """Return a cursor positioned on the value at a given index.
+
+        Args:
+            at: 0-based index of the starting value, negative indexes supported
+                (Python style). `len(self)` positions the cursor past the end.
+
+        Returns:
+            A cursor for O(1) edits around its position.
+
+        Raises:
+            IndexError: If at is out of bounds.
+
+        Time complexity: O(at).
+        """
+        index = self._get_positive_index(at)
+        if index < 0 or index > self._length:
+            raise IndexError('index out of bounds on list')
+        prev = self._get_node_at(index - 1) if index > 0 else None
+        return Cursor(self, prev, index)
+
+    # -------------------------------------------------
+    # Node linking primitives
+    # -------------------------------------------------
+
+    def _reset_links(self) -> None:
+        """Point the list at no nodes at all."""
+        self._head: _Node[T] | None = None
+        self._tail: _Node[T] | None = None
+
+    def _after(self, prev: _Node[T] | None) -> _Node[T] | None:
+        """Return the node after `prev`, or the head if `prev` is None.
+
+        Args:
+            prev: A node in the list, or None for the position before the head.
+
+        Returns:
+            The following node, or None if `prev` is the tail.
+
+        Time complexity: O(1).
+        """
+        return self._head if prev is None else prev.next
+
+    def _iter_nodes(self) -> Iterator[_Node[T]]:
+        """Iterate through the nodes of the list.
+
+        Yields:
+            Each node, from head to tail.
+        """
+        curr = self._head
+        while curr is not None:
+            yield curr
+            curr = curr.next
+
+    def _link_after(self, prev: _Node[T] | None, node: _Node[T]) -> None:
+        """Link a detached node after `prev`, or at the head if `prev` is None.
+
+        Args:
+            prev: The node to link after, or None to link at the head.
+            node: The node to link.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            node.next = self._head
+            self._head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+        if node.next is None:
+            self._tail = node
+        self._length += 1
+        self._mod_count += 1
+
+    def _unlink_after(self, prev: _Node[T] | None) -> _Node[T]:
+        """Unlink the node after `prev`, or the head if `prev` is None.
+
+        The node is not released to the pool, so callers can still read it.
+
+        Args:
+            prev: The node before the one to unlink, or None for the head.
+
+        Returns:
+            The unlinked node.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            node = self._head
+            self._head = node.next
+        else:
+            node = prev.next
+            prev.next = node.next
+        if node is self._tail:
+            self._tail = prev
+        self._length -= 1
+        self._mod_count += 1
+        return node
+
+    def _link_chain_after(self, prev: _Node[T] | None, first: _Node[T], last: _Node[T], count: int) -> None:
+        """Link a detached chain of nodes after `prev`, or at the head if `prev` is None.
+
+        Args:
+            prev: The node to link after, or None to link at the head.
+            first: The first node of the chain.
+            last: The last node of the chain.
+            count: The number of nodes in the chain.
+
+        Time complexity: O(1).
+        """
+        if prev is None:
+            last.next = self._head
+            self._head = first
+        else:
+            last.next = prev.next
+            prev.next = first
+        if last.next is None:
+            self._tail = last
+        self._length += count
+        self._mod_count += 1
+
+    def _values_at(self, positions: Sequence[int]) -> list[T]:
+        """Collect the values at increasing, valid positions in one walk.
+
+        Args:
+            positions: Non-negative indexes in increasing order.
+
+        Returns:
+            The values at `positions`, in the same order.
+
+        Time complexity: O(n).
+        """
+        values = []
+        at = positions[0]
+        node = self._get_node_at(at)
+        for position in positions:
+            for _ in range(position - at):
+                node = node.next
+            at = position
+            values.append(node.value)
+        return values
+
+    def _relink(self, nodes: list[_Node[T]]) -> None:
+        """Chain all nodes of the list again, in the given order.
+
+        Args:
+            nodes: Every node of the list, in their new order.
+
+        Time complexity: O(n).
+        """
+        for node, following in pairwise(nodes):
+            node.next = following
+        nodes[-1].next = None
+        self._head, self._tail = nodes[0], nodes[-1]
+        self._mod_count += 1
+
+    def _splice_from(self, prev: _Node[T] | None, other: LinkedList[T]) -> None:
+        """Move all nodes of `other` after `prev`, leaving `other` empty.
+
+        Args:
+            prev: The node to link after, or None to link at the head.
+            other: The list to take the nodes from.
+
+        Raises:
+            TypeError: If `other` is not a list of the same kind, that is, one
+                built from the same node type.
+            ValueError: If `other` is this list.
+        """
+        if not isinstance(other, LinkedList) or other._node_type is not self._node_type:
+            raise TypeError(f'can only splice a {type(self).__name__} into a {type(self).__name__}')
+        if other is self:
+            raise ValueError('cannot splice a list into itself')
+        if not other:
+            return
+        first, last, count = other._head, other._tail, other._length
+        other.clear()
+        self._link_chain_after(prev, first, last, count)
+
+    def _predecessor(self, node: _Node[T] | None) -> _Node[T] | None:
+        """Return the node before `node`, or the tail if `node` is None.
+
+        Args:
+            node: A node in the list, or None for the position past the end.
+
+        Returns:
+            The node before `node`, or None if `node` is the head.
+
+        Time complexity: O(n).
+        """
+        prev, curr = None, self._head
+        while curr is not node:
+            prev, curr = curr, curr.next
+        return prev
+
     def _validate_index(self, index: int) -> None:
         """Validate that an index is within bounds.
 
@@ -297,6 +714,11 @@ class LinkedList(Generic[T]):
     def _get_node_at(self, index: int) -> _Node[T]:
         """Get the node at the specified index.
 
+        Walks forward from the head or from the finger, whichever is closer.
+        The finger is left on the node *before* the one found, so both the next
+        index and an insert or pop at the same index can start from it. The
+        last node is reached directly through the tail pointer.
+
         Args:
             index: The position of the node to retrieve. Supports negative indexing.
 
@@ -306,16 +728,40 @@ class LinkedList(Generic[T]):
         Raises:
             IndexError: If the list is empty or index is out of bounds.
 
-        Time complexity: O(n).
+        Time complexity: O(n), and O(1) amortized for sequential indexes.
         """
         self._validate_index(index)
         index = self._get_positive_index(index)
-
-        curr = self._head
-        for _ in range(index):
-            curr = curr.next
+        if index == self._length - 1:
+            return self._tail
+        at, prev, curr = 0, None, self._head
+        finger = self._valid_finger()
+        if finger is not None and finger[0] <= index:
+            at, curr = finger
+        for _ in range(index - at):
+            prev, curr = curr, curr.next
+        if prev is not None:
+            self._set_finger(index - 1, prev)
         return curr
 
+    def _valid_finger(self) -> tuple[int, _Node[T]] | None:
+        """Return the cached (index, node) finger, or None if the list changed since.
+
+        Returns:
+            The finger, or None if there is no usable finger.
+        """
+        return self._finger if self._finger_mod_count == self._mod_count else None
+
+    def _set_finger(self, index: int, node: _Node[T] | None) -> None:
+        """Remember the node at an index to speed up the next lookup.
+
+        Args:
+            index: The index of `node` in the current list.
+            node: The node at `index`, or None to forget the finger.
+        """
+        self._finger = None if node is None else (index, node)
+        self._finger_mod_count = self._mod_count
+
     def _get_positive_index(self, index: int) -> int:
         """Convert a potentially negative index to a positive one.
 
@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True, eq=False)
+class _SkipNode(Generic[T]):
+    """A node in the skip list.
+
+    Attributes:
+        value: The data stored in the node.
+        next: The next node on each level the node takes part in, or None at
+            the end of a level.
+        width: For each level, the number of level-0 links that `next` skips.
+            Only meaningful where `next` is not None.
+    """
+
+    value: T
+    next: list[_SkipNode[T] | None]
+    width: list[int]
+
+
+class SkipList(Generic[T]):
+    """A sorted linked list with express lanes for O(log n) expected operations.
+
+    Every node is on level 0, and each level above keeps a random subset of
+    roughly a fraction `p` of the nodes below it. Searches start on the top
+    level and drop down a level whenever the next step would overshoot. Each
+    link also records how many level-0 links it skips, so positions can be
+    counted on the way down, which gives `rank` and indexing in O(log n).
+
+    Equal values are kept, in insertion order.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] | None = None,
+        max_level: int = 32,
+        p: float = 0.5,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the skip list with optional items.
+
+        Args:
+            items: Optional iterable of items to insert.
+            max_level: The maximum number of levels. 32 levels comfortably cover
+                2**32 items with the default `p`.
+            p: The probability that a node on one level is also on the next.
+            seed: Optional seed for the level generator, for reproducible shapes.
+
+        Raises:
+            ValueError: If max_level is not positive or p is not in (0, 1).
+        """
+        if max_level < 1:
+            raise ValueError('max_level must be positive')
+        if not 0 < p < 1:
+            raise ValueError('p must be between 0 and 1')
+        self._max_level = max_level
+        self._p = p
+        self._random = random.Random(seed)
+        self._head: _SkipNode[Any] = _SkipNode(None, [None] * max_level, [1] * max_level)
+        self._level: int = 1
+        self._length: int = 0
+        for item in items or []:
+            self.insert(item)
+
+    # -------------------------------------------------
+    # Core operations
+    # -------------------------------------------------
+
+    def insert(self, value: T) -> None:
+        """Insert a value, keeping the list sorted.
+
+        The value goes after any values equal to it.
+
+        Args:
+            value: The value to insert.
+
+        Time complexity: O(log n) expected.
+        """
+        height = self._random_height()
+        self._level = max(self._level, height)
+        update: list[_SkipNode[Any]] = [self._head] * self._level
+        steps_at: list[int] = [0] * self._level
+        node, steps = self._head, 0
+        for level in reversed(range(self._level)):
+            nxt = node.next[level]
+            while nxt is not None and nxt.value <= value:
+                steps += node.width[level]
+                node, nxt = nxt, nxt.next[level]
+            update[level], steps_at[level] = node, steps
+
+        new_node = _SkipNode(value, [None] * height, [1] * height)
+        for level in range(self._level):
+            prev = update[level]
+            skipped = steps - steps_at[level]
+            if level < height:
+                new_node.next[level] = prev.next[level]
+                new_node.width[level] = prev.width[level] - skipped
+                prev.next[level] = new_node
+                prev.width[level] = skipped + 1
+            else:
+                prev.width[level] += 1
+        self._length += 1
+
+    def remove(self, value: T) -> None:
+        """Remove the first occurrence of `value` from the list.
+
+        Args:
+            value: The value to remove.
+
+        Raises:
+            ValueError: If the value is not found.
+
+        Time complexity: O(log n) expected.
+        """
+        update = self._find_predecessors(value)
+        target = update[0].next[0]
+        if target is None or target.value != value:
+            raise ValueError('value not found')
+        self._unlink(update, target)
+
+    def pop(self, index: int = -1) -> T:
+        """Remove and return the value at the given index.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+                Defaults to -1 (largest value).
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the list is empty or index is invalid.
+
+        Time complexity: O(log n) expected.
+        """
+        index = self._get_positive_index(index)
+        if index < 0 or index >= self._length:
+            raise IndexError('invalid index')
+        update: list[_SkipNode[Any]] = [self._head] * self._level
+        node, steps = self._head, 0
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and steps + node.width[level] <= index:
+                steps += node.width[level]
+                node = node.next[level]
+            update[level] = node
+        target = node.next[0]
+        self._unlink(update, target)
+        return target.value
+
+    def clear(self) -> None:
+        """Remove all elements from the list.
+
+        Time complexity: O(1).
+        """
+        self._head = _SkipNode(None, [None] * self._max_level, [1] * self._max_level)
+        self._level = 1
+        self._length = 0
+
+    # -------------------------------------------------
+    # Ordered queries
+    # -------------------------------------------------
+
+    def rank(self, value: T) -> int:
+        """Return the number of values strictly smaller than `value`.
+
+        This is the index `value` has, or would have, in the list.
+
+        Args:
+            value: The value to rank. It does not have to be in the list.
+
+        Returns:
+            The number of values smaller than `value`.
+
+        Time complexity: O(log n) expected.
+        """
+        node, steps = self._head, 0
+        for level in reversed(range(self._level)):
+            nxt = node.next[level]
+            while nxt is not None and nxt.value < value:
+                steps += node.width[level]
+                node, nxt = nxt, nxt.next[level]
+        return steps
+
+    def find(self, value: T) -> int:
+        """Return the index of the first occurrence of a value.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The index of the first occurrence of the value.
+
+        Raises:
+            ValueError: If the value is not found in the list.
+
+        Time complexity: O(log n) expected.
+        """
+        index = self.rank(value)
+        if index == self._length or self[index] != value:
+            raise ValueError('value not found')
+        return index
+
+    def iter_range(self, start: T | None = None, stop: T | None = None) -> Iterator[T]:
+        """Iterate through the values `v` with `start <= v < stop`, in order.
+
+        Args:
+            start: Inclusive lower bound, or None to start at the smallest value.
+            stop: Exclusive upper bound, or None to run to the largest value.
+
+        Yields:
+            The values within the bounds, in sorted order.
+
+        Time complexity: O(log n + k) expected, where k is the number of values yielded.
+        """
+        node = self._head.next[0] if start is None else self._find_predecessors(start)[0].next[0]
+        while node is not None and (stop is None or node.value < stop):
+            yield node.value
+            node = node.next[0]
+
+    # -------------------------------------------------
+    # Python protocol methods
+    # -------------------------------------------------
+
+    def __contains__(self, value: object) -> bool:
+        """Check whether a value is in the list.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            True if the value is in the list, False otherwise.
+
+        Time complexity: O(log n) expected.
+        """
+        node = self._find_predecessors(value)[0].next[0]
+        return node is not None and node.value == value
+
+    def __len__(self) -> int:
+        """Return the number of elements in the list.
+
+        Returns:
+            The number of elements in the skip list.
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the list.
+
+        Returns:
+            False if the list is empty, True otherwise.
+        """
+        return self._length > 0
+
+    def __getitem__(self, index: int) -> T:
+        """Get the value at the given index in sorted order.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(log n) expected.
+        """
+        if index < -self._length or index >= self._length:
+            raise IndexError('index out-of-bounds')
+        target = self._get_positive_index(index) + 1
+        node, steps = self._head, 0
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and steps + node.width[level] <= target:
+                steps += node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through values in sorted order.
+
+        Yields:
+            The values in the list from smallest to largest.
+        """
+        node = self._head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the skip list.
+
+        Returns:
+            A string representation showing the class name and list contents.
+        """
+        return f'{self.__class__.__name__}({list(self)})'
+
+    # -------------------------------------------------
+    # Helpers
+    # -------------------------------------------------
+
+    def _random_height(self) -> int:
+        """Draw the number of levels for a new node.
+
+        Returns:
+            A height between 1 and `max_level`, geometrically distributed.
+        """
+        height = 1
+        while height < self._max_level and self._random.random() < self._p:
+            height += 1
+        return height
+
+    def _find_predecessors(self, value: Any) -> list[_SkipNode[Any]]:
+        """Find, on each level, the last node whose value is smaller than `value`.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The predecessor on each level, level 0 first.
+
+        Time complexity: O(log n) expected.
+        """
+        update: list[_SkipNode[Any]] = [self._head] * self._level
+        node = self._head
+        for level in reversed(range(self._level)):
+            nxt = node.next[level]
+            while nxt is not None and nxt.value < value:
+                node, nxt = nxt, nxt.next[level]
+            update[level] = node
+        return update
+
+    def _unlink(self, update: list[_SkipNode[Any]], target: _SkipNode[T]) -> None:
+        """Remove a node given its predecessor on every level.
+
+        Args:
+            update: The predecessor of `target` on each level, level 0 first.
+            target: The node to remove.
+        """
+        for level in range(self._level):
+            prev = update[level]
+            if prev.next[level] is target:
+                prev.width[level] += target.width[level] - 1
+                prev.next[level] = target.next[level]
+            else:
+                prev.width[level] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._length -= 1
+
+    def _get_positive_index(self, index: int) -> int:
+        """Convert a potentially negative index to a positive one.
+
+        Args:
+            index: The index to convert (may be negative).
+
+        Returns:
+            The positive equivalent of the index.
+        """
+        return self._length + index if index < 0 else index
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass(slots=True, eq=False)
+class _Chunk(Generic[T]):
+    """A node of the unrolled linked list holding several values.
+
+    Attributes:
+        items: The values stored in the chunk, in list order.
+        next: Reference to the next chunk, or None if this is the last chunk.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next: _Chunk[T] | None = None
+
+
+class UnrolledLinkedList(Generic[T]):
+    """A singly linked list whose nodes each hold up to `chunk_size` values.
+
+    Storing values contiguously in chunks means iteration chases one pointer
+    per chunk instead of one per value, the per-value overhead is a single list
+    slot, and indexing skips whole chunks in O(n / B). A full chunk is split in
+    half on insert, and a chunk is merged with its successor after a removal
+    when both fit in one chunk. The API mirrors `LinkedList`.
+    """
+
+    def __init__(self, items: Iterable[T] | None = None, chunk_size: int = 64) -> None:
+        """Initialize the list with optional items.
+
+        Args:
+            items: Optional iterable of items to initialize the list with.
+                If None, creates an empty list.
+            chunk_size: The maximum number of values stored in one chunk.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive')
+        self._chunk_size = chunk_size
+        self._head: _Chunk[T] | None = None
+        self._tail: _Chunk[T] | None = None
+        self._length: int = 0
+        self.extend(items or [])
+
+    @property
+    def chunk_size(self) -> int:
+        """The maximum number of values stored in one chunk."""
+        return self._chunk_size
+
+    def append(self, value: T) -> None:
+        """Add a value to the end of the list.
+
+        Args:
+            value: The value to append to the list.
+
+        Time complexity: O(1).
+        """
+        if self._tail is None or len(self._tail.items) == self._chunk_size:
+            self._link_chunk(self._tail, _Chunk([value]))
+        else:
+            self._tail.items.append(value)
+        self._length += 1
+
+    def prepend(self, value: T) -> None:
+        """Add a value to the beginning of the list.
+
+        Args:
+            value: The value to prepend to the list.
+
+        Time complexity: O(B), where B is the chunk size.
+        """
+        if self._head is None or len(self._head.items) == self._chunk_size:
+            self._link_chunk(None, _Chunk([value]))
+        else:
+            self._head.items.insert(0, value)
+        self._length += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append multiple values to the end of the list, in iteration order.
+
+        The tail chunk is topped up first and the rest of the values are cut
+        into full chunks.
+
+        Args:
+            items: An iterable of values to append.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        values = list(items)
+        start = 0
+        if self._tail is not None:
+            start = self._chunk_size - len(self._tail.items)
+            self._tail.items.extend(values[:start])
+        for i in range(start, len(values), self._chunk_size):
+            self._link_chunk(self._tail, _Chunk(values[i : i + self._chunk_size]))
+        self._length += len(values)
+
+    def insert(self, index: int, value: T) -> None:
+        """Insert a value at a specific index.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+            value: The value to insert.
+
+        Raises:
+            IndexError: If index is out of bounds.
+
+        Time complexity: O(n / B + B), where B is the chunk size.
+        """
+        index = self._get_positive_index(index) + int(index < 0)
+        if index < 0 or index > self._length:
+            raise IndexError('index out of bounds on list')
+        if index == self._length:
+            self.append(value)
+            return
+        _, chunk, offset = self._locate(index)
+        if len(chunk.items) == self._chunk_size:
+            half = self._chunk_size // 2
+            self._link_chunk(chunk, _Chunk(chunk.items[half:]))
+            del chunk.items[half:]
+            if offset > half:
+                chunk, offset = chunk.next, offset - half
+        chunk.items.insert(offset, value)
+        self._length += 1
+
+    def remove(self, value: T) -> None:
+        """Remove the first occurrence of `value` from the list.
+
+        Args:
+            value: The value to remove from the list.
+
+        Raises:
+            ValueError: If the value is not found.
+
+        Time complexity: O(n).
+        """
+        prev, chunk = None, self._head
+        while chunk is not None:
+            if value in chunk.items:
+                chunk.items.remove(value)
+                self._length -= 1
+                self._compact(prev, chunk)
+                return
+            prev, chunk = chunk, chunk.next
+        raise ValueError('value not found')
+
+    def pop(self, index: int = -1) -> T:
+        """Remove and return the item at the given index.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+                Defaults to -1 (last element).
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the list is empty or index is invalid.
+
+        Time complexity: O(n / B + B). Popping from the tail chunk is O(1)
+        unless it empties the chunk.
+        """
+        idx = self._get_positive_index(index)
+        if idx < 0 or idx >= self._length:
+            raise IndexError('invalid index')
+        tail_start = self._length - len(self._tail.items)
+        if idx >= tail_start and len(self._tail.items) > 1:
+            self._length -= 1
+            return self._tail.items.pop(idx - tail_start)
+        prev, chunk, offset = self._locate(idx)
+        value = chunk.items.pop(offset)
+        self._length -= 1
+        self._compact(prev, chunk)
+        return value
+
+    def clear(self) -> None:
+        """Remove all elements from the list.
+
+        Time complexity: O(1).
+        """
+        self._head = self._tail = None
+        self._length = 0
+
+    def head(self) -> T | None:
+        """Return the first value in the list.
+
+        Returns:
+            The first value in the list, or None if the list is empty.
+
+        Time complexity: O(1).
+        """
+        return self._head.items[0] if self._head else None
+
+    def tail(self) -> T | None:
+        """Return the last value in the list.
+
+        Returns:
+            The last value in the list, or None if the list is empty.
+
+        Time complexity: O(1).
+        """
+        return self._tail.items[-1] if self._tail else None
+
+    def find(self, value: T) -> int:
+        """Return the index of the first occurrence of a value.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The index of the first occurrence of the value.
+
+        Raises:
+            ValueError: If the value is not found in the list.
+        """
+        start, chunk = 0, self._head
+        while chunk is not None:
+            if value in chunk.items:
+                return start + chunk.items.index(value)
+            start += len(chunk.items)
+            chunk = chunk.next
+        raise ValueError('value not found')
+
+    def __len__(self) -> int:
+        """Return the number of elements in the list.
+
+        Returns:
+            The number of elements in the list.
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the list.
+
+        Returns:
+            False if the list is empty, True otherwise.
+        """
+        return self._length > 0
+
+    def __getitem__(self, index: int) -> T:
+        """Get the value at the given index.
+
+        Args:
+            index: 0-based index, negative indexes supported (Python style).
+
+        Returns:
+            The value at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Time complexity: O(n / B), where B is the chunk size.
+        """
+        self._validate_index(index)
+        chunk, offset = self._chunk_at(self._get_positive_index(index))
+        return chunk.items[offset]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """Set item at the specified index.
+
+        Args:
+            index: The position at which to set the value.
+                0-based index, negative indexes supported (Python style).
+            value: The value to set.
+
+        Raises:
+            IndexError: If index is out of bounds.
+
+        Time complexity: O(n / B), where B is the chunk size.
+        """
+        self._validate_index(index)
+        chunk, offset = self._chunk_at(self._get_positive_index(index))
+        chunk.items[offset] = value
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate through values in the list.
+
+        The values of each chunk are produced by a C-level iterator, so the
+        Python-level loop only runs once per chunk.
+
+        Returns:
+            An iterator over the values in the list from head to tail.
+        """
+        return chain.from_iterable(self._chunk_items())
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns:
+            A string representation showing the class name and list contents.
+        """
+        return f'{self.__class__.__name__}({list(self)})'
+
+    def __str__(self) -> str:
+        """Return a string representation of the list.
+
+        Returns:
+            A visual representation of the list, one bracketed group per chunk.
+
+        Time complexity: O(n).
+        """
+        chunks = []
+        chunk = self._head
+        while chunk:
+            chunks.append(str(chunk.items))
+            chunk = chunk.next
+        return ' → '.join(['HEAD', *chunks, 'TAIL'])
+
+    def _chunk_items(self) -> Iterator[list[T]]:
+        """Iterate through the value lists of the chunks.
+
+        Yields:
+            The `items` list of each chunk, from head to tail.
+        """
+        chunk = self._head
+        while chunk:
+            yield chunk.items
+            chunk = chunk.next
+
+    def _link_chunk(self, prev: _Chunk[T] | None, chunk: _Chunk[T]) -> None:
+        """Link a new chunk after `prev`, or at the head if `prev` is None.
+
+        Args:
+            prev: The chunk to link after, or None to link at the head.
+            chunk: The chunk to link.
+        """
+        if prev is None:
+            chunk.next = self._head
+            self._head = chunk
+        else:
+            chunk.next = prev.next
+            prev.next = chunk
+        if chunk.next is None:
+            self._tail = chunk
+
+    def _compact(self, prev: _Chunk[T] | None, chunk: _Chunk[T]) -> None:
+        """Restore the chunk invariants after a value was removed from `chunk`.
+
+        An emptied chunk is unlinked, and a chunk that fits together with its
+        successor absorbs it.
+
+        Args:
+            prev: The chunk before `chunk`, or None if `chunk` is the head.
+            chunk: The chunk a value was just removed from.
+        """
+        if not chunk.items:
+            if prev is None:
+                self._head = chunk.next
+            else:
+                prev.next = chunk.next
+            if chunk is self._tail:
+                self._tail = prev
+            return
+        following = chunk.next
+        if following is not None and len(chunk.items) + len(following.items) <= self._chunk_size:
+            chunk.items.extend(following.items)
+            chunk.next = following.next
+            if following is self._tail:
+                self._tail = chunk
+
+    def _chunk_at(self, index: int) -> tuple[_Chunk[T], int]:
+        """Find the chunk and offset holding the value at a non-negative index.
+
+        The tail chunk is checked first, so access to the last values does not
+        walk the list.
+
+        Args:
+            index: A 0-based index smaller than the length.
+
+        Returns:
+            The chunk holding the value and the offset of the value in it.
+
+        Time complexity: O(n / B), where B is the chunk size.
+        """
+        tail_start = self._length - len(self._tail.items)
+        if index >= tail_start:
+            return self._tail, index - tail_start
+        _, chunk, offset = self._locate(index)
+        return chunk, offset
+
+    def _locate(self, index: int) -> tuple[_Chunk[T] | None, _Chunk[T], int]:
+        """Find the chunk holding the value at a non-negative index, and its predecessor.
+
+        Args:
+            index: A 0-based index smaller than the length.
+
+        Returns:
+            The chunk before the found chunk (None if it is the head), the
+            chunk and the offset of the value in it.
+
+        Time complexity: O(n / B), where B is the chunk size.
+        """
+        prev, chunk = None, self._head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            prev, chunk = chunk, chunk.next
+        return prev, chunk, index
+
+    def _validate_index(self, index: int) -> None:
+        """Validate that an index is within bounds.
+
+        Args:
+            index: The index to validate.
+
+        Raises:
+            IndexError: If the list is empty or index is out of bounds.
+        """
+        if self._length == 0:
+            raise IndexError('empty list')
+        if index < -self._length or index >= self._length:
+            raise IndexError('index out-of-bounds')
+
+    def _get_positive_index(self, index: int) -> int:
+        """Convert a potentially negative index to a positive one.
+
+        Args:
+            index: The index to convert (may be negative).
+
+        Returns:
+            The positive equivalent of the index.
+        """
+        return self._length + index if index < 0 else index
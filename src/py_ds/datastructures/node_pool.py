@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any, Generic, TypeVar
+
+N = TypeVar('N')
+
+
+class NodePool(Generic[N]):
+    """A capped free list that recycles node objects of a single type.
+
+    Structures that churn through nodes hand removed nodes to `release` and
+    get nodes for new values from `acquire`. A released node has all its
+    fields cleared, so it keeps neither its value nor its neighbours alive.
+    At most `max_size` nodes are kept; extra released nodes are left to the
+    garbage collector.
+
+    Attributes:
+        max_size: The maximum number of free nodes kept for reuse.
+        hits: Number of `acquire` calls served from the free list.
+        misses: Number of `acquire` calls that had to allocate a new node.
+    """
+
+    def __init__(self, node_type: type[N], max_size: int) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            node_type: The dataclass node type the pool hands out. Its first
+                field must be `value` and all other fields must default to None.
+            max_size: The maximum number of free nodes to keep.
+
+        Raises:
+            ValueError: If max_size is negative.
+        """
+        if max_size < 0:
+            raise ValueError('max_size must be non-negative')
+        self._node_type = node_type
+        self._fields = tuple(f.name for f in fields(node_type))
+        self._free: list[N] = []
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, value: Any) -> N:
+        """Return a node holding `value`, reusing a free node when possible.
+
+        Args:
+            value: The value to store in the node.
+
+        Returns:
+            A node whose link fields are all None.
+
+        Time complexity: O(1).
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.value = value
+            return node
+        self.misses += 1
+        return self._node_type(value)
+
+    def release(self, node: N) -> None:
+        """Return a node that is no longer linked into any structure.
+
+        Args:
+            node: The node to recycle. It must not be used by the caller again.
+
+        Time complexity: O(1).
+        """
+        if len(self._free) < self.max_size:
+            for name in self._fields:
+                setattr(node, name, None)
+            self._free.append(node)
+
+    def clear(self) -> None:
+        """Drop all free nodes and reset the hit and miss counters."""
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of free nodes currently in the pool.
+
+        Returns:
+            The number of nodes available for reuse.
+        """
+        return len(self._free)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool.
+
+        Returns:
+            A string showing the node type, occupancy and hit/miss counters.
+
+        Example:
+            NodePool(_Node, size=3, max_size=1024, hits=10, misses=4)
+        """
+        return (
+            f'{self.__class__.__name__}({self._node_type.__name__}, size={len(self._free)}, '
+            f'max_size={self.max_size}, hits={self.hits}, misses={self.misses})'
+        )
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, TypeVar
+
+from .linked_lists.singly_linked import _Node
+
+T = TypeVar('T')
+
+
+class PersistentStack(Generic[T]):
+    """An immutable LIFO stack whose versions share structure.
+
+    Each version is a pointer to its top node; `push` and `pop` return new
+    versions and never modify existing ones. Versions derived from a common
+    ancestor share every node below the point where they diverged, so keeping
+    a snapshot costs O(1) and memory grows with the number of distinct frames
+    rather than the number of versions.
+
+    Pickling and copying store the items as a flat list, so they work for
+    stacks of any height, but the unpickled stack no longer shares nodes with
+    other versions.
+    """
+
+    __slots__ = ('_top', '_length')
+
+    def __init__(self, items: Iterable[T] | None = None) -> None:
+        """Initialize the stack.
+
+        Args:
+            items: Optional iterable of initial items. The last item in the
+                   iterable becomes the top of the stack.
+
+        Example:
+            PersistentStack([1, 2, 3])  # 3 is at the top
+        """
+        top: _Node[T] | None = None
+        length = 0
+        for item in items or []:
+            top = _Node(item, top)
+            length += 1
+        self._top = top
+        self._length = length
+
+    @classmethod
+    def _from_node(cls, top: _Node[T] | None, length: int) -> PersistentStack[T]:
+        """Create a version that points at an existing chain of nodes.
+
+        Args:
+            top: The top node of the version, or None for an empty stack.
+            length: The number of nodes reachable from `top`.
+
+        Returns:
+            A new stack sharing the given nodes.
+        """
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._length = length
+        return stack
+
+    # -------- Core stack operations --------
+
+    def push(self, item: T) -> PersistentStack[T]:
+        """Return a new version with an item pushed on top.
+
+        The current version is left unchanged and shares all of its nodes with
+        the new one.
+
+        Args:
+            item: The item to push.
+
+        Returns:
+            The new version of the stack.
+
+        Time complexity: O(1).
+        """
+        return self._from_node(_Node(item, self._top), self._length + 1)
+
+    def pop(self) -> PersistentStack[T]:
+        """Return a new version with the top item removed.
+
+        Use `peek` beforehand to read the item being removed.
+
+        Returns:
+            The new version of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1).
+        """
+        if self._top is None:
+            raise IndexError('pop from empty stack')
+        return self._from_node(self._top.next, self._length - 1)
+
+    def peek(self) -> T:
+        """Return the top item of the stack.
+
+        Returns:
+            The item at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1).
+        """
+        if self._top is None:
+            raise IndexError('peek from empty stack')
+        return self._top.value
+
+    def is_empty(self) -> bool:
+        """Check if the stack is empty.
+
+        Returns:
+            True if the stack has no elements, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return self._top is None
+
+    # -------- Python protocol methods --------
+
+    def __len__(self) -> int:
+        """Return the number of items in the stack.
+
+        Returns:
+            The number of items in the stack.
+
+        Time complexity: O(1).
+        """
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the stack.
+
+        Returns:
+            False if the stack is empty, True otherwise.
+        """
+        return self._top is not None
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items in the stack from top to bottom.
+
+        Yields:
+            Each item in the stack, starting from the top.
+
+        Example:
+            s = PersistentStack([1, 2, 3])
+            list(s)  # [3, 2, 1]  (top to bottom)
+        """
+        curr = self._top
+        while curr is not None:
+            yield curr.value
+            curr = curr.next
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two stacks item by item.
+
+        Versions that share their top node are equal without a traversal.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            True if `other` is a PersistentStack with the same items in the same
+            order, False otherwise.
+        """
+        if not isinstance(other, PersistentStack):
+            return NotImplemented
+        if self._length != other._length:
+            return False
+        a, b = self._top, other._top
+        while a is not b:
+            if a.value != b.value:
+                return False
+            a, b = a.next, b.next
+        return True
+
+    __hash__ = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling and copying without recursing through the nodes.
+
+        Returns:
+            The class and a flat list of the items, bottom to top, to rebuild
+            it from.
+        """
+        return self.__class__, (list(self)[::-1],)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the stack.
+
+        Returns:
+            A string representation showing the class name and stack contents,
+            bottom to top.
+
+        Example:
+            PersistentStack([1, 2, 3])
+        """
+        return f'{self.__class__.__name__}({list(self)[::-1]})'
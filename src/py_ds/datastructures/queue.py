@@ -4,6 +4,8 @@ from collections.abc import Iterable, Iterator
 from typing import Generic, TypeVar
 
 from .linked_lists import LinkedList
+from .node_pool import NodePool
+from .views import QueueView
 
 T = TypeVar('T')
 
@@ -14,14 +16,22 @@ class Queue(Generic[T]):
     Backed by a Python list, providing O(1) enqueue and O(1) dequeue operations.
     """
 
-    def __init__(self, items: Iterable[T] | None = None) -> None:
+    def __init__(self, items: Iterable[T] | None = None, pool_size: int = 0) -> None:
         """Initialize the queue.
 
         Args:
             items: Optional iterable of initial items.
                    The first item of the iterable becomes the front of the queue.
+            pool_size: If positive, dequeued nodes are recycled through a
+                   `NodePool` holding up to this many free nodes.
         """
-        self._items = LinkedList(items)
+        self._items = LinkedList(items, pool_size)
+        self._mod_count: int = 0
+
+    @property
+    def pool(self) -> NodePool | None:
+        """The node pool of the backing list, or None if pooling is disabled."""
+        return self._items.pool
 
     # -------------------------------------------------
     # Core queue operations
@@ -36,6 +46,7 @@ class Queue(Generic[T]):
         Time complexity: O(1).
         """
         self._items.append(item)
+        self._mod_count += 1
 
     def dequeue(self) -> T:
         """Remove and return the front item of the queue.
@@ -50,6 +61,7 @@ class Queue(Generic[T]):
         """
         if self.is_empty():
             raise IndexError('dequeue from empty queue')
+        self._mod_count += 1
         return self._items.pop(0)
 
     def peek(self) -> T:
@@ -91,8 +103,30 @@ class Queue(Generic[T]):
 
         Time complexity: O(k), where k is the number of items.
         """
-        for item in items:
-            self.enqueue(item)
+        self._items.extend(items)
+        self._mod_count += 1
+
+    def dequeue_many(self, n: int) -> list[T]:
+        """Remove and return the first `n` items in a single walk.
+
+        Args:
+            n: The number of items to dequeue.
+
+        Returns:
+            The dequeued items, in FIFO order.
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the queue holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if n > len(self._items):
+            raise IndexError('dequeue from empty queue')
+        self._mod_count += 1
+        return self._items._pop_front(n)
 
     def clear(self) -> None:
         """Remove all items from the queue.
@@ -102,6 +136,7 @@ class Queue(Generic[T]):
         Time complexity: O(1).
         """
         self._items.clear()
+        self._mod_count += 1
 
     # -------------------------------------------------
     # Python protocol methods
@@ -139,6 +174,22 @@ class Queue(Generic[T]):
         """
         return iter(self._items)
 
+    def view(self) -> QueueView[T]:
+        """Return a read-only, zero-copy view of the queue.
+
+        The view is indexed from the front: `view[0]` is the next item to be
+        dequeued. Slicing the view returns another view. Any modification of the
+        queue invalidates the view, and using it afterwards raises RuntimeError.
+
+        Returns:
+            A view over the current items, front to back.
+
+        Example:
+            q = Queue([1, 2, 3, 4])
+            q.view()[1:3]  # QueueView([2, 3])
+        """
+        return QueueView(self, range(len(self._items)))
+
     def __repr__(self) -> str:
         """Return a string representation of the queue.
 
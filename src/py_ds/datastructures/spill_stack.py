@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import pickle
+import tempfile
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import IO, Any, NoReturn, Protocol
+
+from .stack import Stack, T
+
+
+class Codec(Protocol):
+    """Serializer used to write spilled chunks to disk.
+
+    Any object with `dumps`/`loads` functions that round-trip a list of items
+    through bytes works, such as the `pickle` and `marshal` modules.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object to bytes."""
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        """Deserialize an object from bytes."""
+        ...
+
+
+class SpillStack(Stack[T]):
+    """A LIFO stack that pages its oldest items out to a temporary file.
+
+    The top `memory_limit` items live in the in-memory list of `Stack`. When a
+    push exceeds the limit, the bottom `chunk_size` in-memory items are encoded
+    with the codec and appended to the file in one write. When the in-memory
+    part runs dry, the most recently spilled chunk is read back in one read.
+    The file is therefore used as a stack of chunks and every I/O is a single
+    sequential bulk operation.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T] | None = None,
+        memory_limit: int = 100_000,
+        chunk_size: int | None = None,
+        codec: Codec = pickle,
+        directory: str | None = None,
+    ) -> None:
+        """Initialize the stack.
+
+        Args:
+            items: Optional iterable of initial items. The last item in the
+                   iterable should be considered the "top" of the stack.
+            memory_limit: Maximum number of items kept in memory.
+            chunk_size: Number of items written per spill. Defaults to half of
+                `memory_limit`, so a page-in is not immediately followed by a
+                spill.
+            codec: Serializer for spilled chunks. Defaults to `pickle`.
+            directory: Directory for the temporary file. Defaults to the system
+                temporary directory.
+
+        Raises:
+            ValueError: If memory_limit or chunk_size is out of range.
+        """
+        if memory_limit < 1:
+            raise ValueError('memory_limit must be positive')
+        chunk_size = max(1, memory_limit // 2) if chunk_size is None else chunk_size
+        if not 1 <= chunk_size <= memory_limit:
+            raise ValueError('chunk_size must be between 1 and memory_limit')
+        self._memory_limit = memory_limit
+        self._chunk_size = chunk_size
+        self._codec = codec
+        self._directory = directory
+        self._file: IO[bytes] | None = None
+        # (offset, byte size, item count) of each spilled chunk, oldest first.
+        self._chunks: list[tuple[int, int, int]] = []
+        self._spilled: int = 0
+        super().__init__()
+        self.extend(items or [])
+
+    @property
+    def spilled(self) -> int:
+        """The number of items currently stored on disk."""
+        return self._spilled
+
+    # -------- Core stack operations --------
+
+    def push(self, item: T) -> None:
+        """Push a single item onto the top of the stack.
+
+        Spills the oldest in-memory chunk to disk if the memory limit is exceeded.
+
+        Args:
+            item: The item to push onto the stack.
+
+        Time complexity: O(1) amortized.
+        """
+        super().push(item)
+        if len(self._items) > self._memory_limit:
+            self._spill()
+
+    def pop(self) -> T:
+        """Remove and return the top item of the stack.
+
+        Pages the most recently spilled chunk back in if memory is empty.
+
+        Returns:
+            The item that was at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1) amortized.
+        """
+        if not self._items and self._chunks:
+            self._page_in()
+        return super().pop()
+
+    def peek(self) -> T:
+        """Return the top item of the stack without removing it.
+
+        Returns:
+            The item at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1) amortized.
+        """
+        if not self._items and self._chunks:
+            self._page_in()
+        return super().peek()
+
+    def is_empty(self) -> bool:
+        """Check if the stack is empty.
+
+        Returns:
+            True if the stack has no elements in memory or on disk.
+
+        Time complexity: O(1).
+        """
+        return not self._items and not self._chunks
+
+    # -------- Bulk / utility operations --------
+
+    def clear(self) -> None:
+        """Remove all items from the stack, in memory and on disk.
+
+        Time complexity: O(1).
+        """
+        super().clear()
+        self._chunks = []
+        self._spilled = 0
+        if self._file is not None:
+            self._file.truncate(0)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Push multiple items onto the stack, in iteration order.
+
+        The items are read in batches that fill memory up to one chunk past
+        the limit, and each batch is appended in one call before the overflow
+        is spilled in whole chunks. At most `memory_limit + chunk_size` items
+        are ever held in memory, however long `items` is.
+
+        Args:
+            items: An iterable of items to push onto the stack.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, self._memory_limit - len(self._items) + self._chunk_size))
+            if not batch:
+                return
+            super().extend(batch)
+            while len(self._items) > self._memory_limit:
+                self._spill()
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return the top `n` items, paging chunks in as needed.
+
+        Args:
+            n: The number of items to pop.
+
+        Returns:
+            The popped items, in pop order (top first).
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the stack holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if n > len(self):
+            raise IndexError('pop from empty stack')
+        popped: list[T] = []
+        while len(popped) < n:
+            if not self._items:
+                self._page_in()
+            popped += super().pop_many(min(n - len(popped), len(self._items)))
+        return popped
+
+    def view(self) -> NoReturn:
+        """Views are not supported, since most items may be on disk.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError('SpillStack does not support views')
+
+    def close(self) -> None:
+        """Close and delete the backing file. The stack is emptied."""
+        self.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> SpillStack[T]:
+        """Enter a context that closes the stack on exit.
+
+        Returns:
+            The stack itself.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the stack when leaving the context."""
+        self.close()
+
+    # -------- Python protocol methods --------
+
+    def __len__(self) -> int:
+        """Return the number of items in the stack.
+
+        Returns:
+            The number of items in memory and on disk.
+
+        Time complexity: O(1).
+        """
+        return len(self._items) + self._spilled
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the stack.
+
+        Returns:
+            False if the stack is empty, True otherwise.
+        """
+        return not self.is_empty()
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items in the stack from top to bottom.
+
+        Spilled chunks are read one at a time and are not paged back in.
+
+        Yields:
+            Each item in the stack, starting from the top.
+        """
+        yield from reversed(self._items)
+        for chunk in reversed(self._chunks):
+            yield from reversed(self._read_chunk(chunk))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the stack.
+
+        Returns:
+            A string showing the class name and how many items are in memory
+            and on disk.
+
+        Example:
+            SpillStack(in_memory=10, spilled=500)
+        """
+        return f'{self.__class__.__name__}(in_memory={len(self._items)}, spilled={self._spilled})'
+
+    # -------- Disk paging --------
+
+    def _spill(self) -> None:
+        """Write the bottom in-memory chunk to the end of the file."""
+        chunk = self._items[: self._chunk_size]
+        del self._items[: self._chunk_size]
+        data = self._codec.dumps(chunk)
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)  # noqa: SIM115 - closed by close()
+        offset = self._chunks[-1][0] + self._chunks[-1][1] if self._chunks else 0
+        self._file.seek(offset)
+        self._file.write(data)
+        self._chunks.append((offset, len(data), len(chunk)))
+        self._spilled += len(chunk)
+
+    def _page_in(self) -> None:
+        """Move the most recently spilled chunk from the file back to memory.
+
+        The chunk's bytes are left in place and overwritten by the next spill.
+        """
+        chunk = self._chunks.pop()
+        self._items[:0] = self._read_chunk(chunk)
+        self._spilled -= chunk[2]
+
+    def _read_chunk(self, chunk: tuple[int, int, int]) -> list[T]:
+        """Read and decode a spilled chunk.
+
+        Args:
+            chunk: The (offset, byte size, item count) record of the chunk.
+
+        Returns:
+            The chunk's items, bottom to top.
+        """
+        offset, size, _ = chunk
+        self._file.seek(offset)
+        return self._codec.loads(self._file.read(size))
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class SPSCQueue(Generic[T]):
+    """A bounded single-producer/single-consumer FIFO ring buffer.
+
+    Items live in a power-of-two list indexed by two ever-increasing counters:
+    `_tail` (items pushed) is written only by the producer and `_head` (items
+    popped) is written only by the consumer. Neither side takes a lock.
+
+    Correctness relies on two properties of CPython. First, every step that one
+    side publishes is a single store: a list item or slice assignment, or an
+    attribute rebinding to an immutable int, so the other thread never sees a
+    torn value. Second, those stores become visible in program order. With the
+    GIL this holds because only one thread runs bytecode at a time. On the
+    free-threaded build (3.13t+), list and instance-attribute writes each go
+    through per-object locks, which give release/acquire ordering. The producer
+    fills a slot and only then advances `_tail`; a consumer that observes the
+    new `_tail` is therefore guaranteed to see the filled slot. The consumer
+    clears the slot before advancing `_head`, so the producer never overwrites
+    a slot that is still being read.
+
+    The queue is only safe with exactly one producer thread and one consumer
+    thread. Lengths observed from either side may be stale, but always err on
+    the safe side: the producer may see less free space and the consumer fewer
+    items than there really are.
+    """
+
+    def __init__(self, capacity: int = 1024, items: Iterable[T] | None = None) -> None:
+        """Initialize the queue.
+
+        Args:
+            capacity: The maximum number of items. Rounded up to a power of two.
+            items: Optional iterable of initial items. The first item of the
+                iterable becomes the front of the queue.
+
+        Raises:
+            ValueError: If capacity is not positive or the items do not fit.
+        """
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+        capacity = 1 << (capacity - 1).bit_length()
+        self._capacity: int = capacity
+        self._mask: int = capacity - 1
+        self._buffer: list[T | None] = [None] * capacity
+        self._head: int = 0
+        self._tail: int = 0
+        if items is not None:
+            items = list(items)
+            if self.push_many(items) != len(items):
+                raise ValueError('initial items exceed capacity')
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of items the queue can hold."""
+        return self._capacity
+
+    # -------------------------------------------------
+    # Producer side
+    # -------------------------------------------------
+
+    def push(self, item: T) -> bool:
+        """Add an item to the back of the queue, if there is room.
+
+        Must only be called from the producer thread.
+
+        Args:
+            item: The item to add.
+
+        Returns:
+            True if the item was added, False if the queue was full.
+
+        Time complexity: O(1).
+        """
+        tail = self._tail
+        if tail - self._head == self._capacity:
+            return False
+        self._buffer[tail & self._mask] = item
+        self._tail = tail + 1
+        return True
+
+    def push_many(self, items: Sequence[T]) -> int:
+        """Add as many items as fit to the back of the queue.
+
+        Items are copied with at most two slice assignments and published with
+        a single counter update. Must only be called from the producer thread.
+
+        Args:
+            items: The items to add, in order.
+
+        Returns:
+            The number of leading items that were added.
+
+        Time complexity: O(k), where k is the number of items added.
+        """
+        tail = self._tail
+        count = min(len(items), self._capacity - (tail - self._head))
+        if count <= 0:
+            return 0
+        start = tail & self._mask
+        first = min(count, self._capacity - start)
+        self._buffer[start : start + first] = items[:first]
+        if first < count:
+            self._buffer[: count - first] = items[first:count]
+        self._tail = tail + count
+        return count
+
+    # -------------------------------------------------
+    # Consumer side
+    # -------------------------------------------------
+
+    def pop(self) -> T:
+        """Remove and return the front item of the queue.
+
+        Must only be called from the consumer thread.
+
+        Returns:
+            The item that was at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+
+        Time complexity: O(1).
+        """
+        head = self._head
+        if head == self._tail:
+            raise IndexError('pop from empty queue')
+        index = head & self._mask
+        item = self._buffer[index]
+        self._buffer[index] = None
+        self._head = head + 1
+        return item
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return up to `n` items from the front of the queue.
+
+        Items are copied out with at most two slices and released with a single
+        counter update. Must only be called from the consumer thread.
+
+        Args:
+            n: The maximum number of items to remove.
+
+        Returns:
+            The removed items in FIFO order. Empty if the queue is empty.
+
+        Raises:
+            ValueError: If n is negative.
+
+        Time complexity: O(k), where k is the number of items removed.
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        head = self._head
+        count = min(n, self._tail - head)
+        if count <= 0:
+            return []
+        start = head & self._mask
+        first = min(count, self._capacity - start)
+        items = self._buffer[start : start + first]
+        self._buffer[start : start + first] = [None] * first
+        if first < count:
+            items += self._buffer[: count - first]
+            self._buffer[: count - first] = [None] * (count - first)
+        self._head = head + count
+        return items
+
+    def peek(self) -> T:
+        """Return the front item without removing it.
+
+        Must only be called from the consumer thread.
+
+        Returns:
+            The item at the front of the queue.
+
+        Raises:
+            IndexError: If the queue is empty.
+
+        Time complexity: O(1).
+        """
+        head = self._head
+        if head == self._tail:
+            raise IndexError('peek from empty queue')
+        return self._buffer[head & self._mask]
+
+    # -------------------------------------------------
+    # Status
+    # -------------------------------------------------
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty.
+
+        Returns:
+            True if the queue contains no items, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return self._head == self._tail
+
+    def is_full(self) -> bool:
+        """Check if the queue is full.
+
+        Returns:
+            True if no more items can be pushed, False otherwise.
+
+        Time complexity: O(1).
+        """
+        return self._tail - self._head == self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of items in the queue.
+
+        Returns:
+            The number of items in the queue at the time of the call.
+
+        Time complexity: O(1).
+        """
+        return self._tail - self._head
+
+    def __bool__(self) -> bool:
+        """Return the truthiness of the queue.
+
+        Returns:
+            False if the queue is empty, True otherwise.
+        """
+        return self._tail != self._head
+
+    def __repr__(self) -> str:
+        """Return a string representation of the queue.
+
+        Returns:
+            A string showing the class name, capacity and queue contents.
+
+        Example:
+            SPSCQueue(capacity=4, items=[1, 2, 3])
+        """
+        head, tail = self._head, self._tail
+        items = [self._buffer[i & self._mask] for i in range(head, tail)]
+        return f'{self.__class__.__name__}(capacity={self._capacity}, items={items})'
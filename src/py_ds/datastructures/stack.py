@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
 from typing import Generic, TypeVar
 
+from .views import StackView
+
 T = TypeVar('T')
 
+# Kind of value stored by each `array` typecode, used to match buffer formats
+# that name the same machine type with a different character.
+_TYPECODE_KINDS = {
+    **dict.fromkeys('bhilq', 'signed'),
+    **dict.fromkeys('BHILQ', 'unsigned'),
+    **dict.fromkeys('fd', 'float'),
+    **dict.fromkeys('uw', 'char'),
+}
+
 
 class Stack(Generic[T]):
     """A simple LIFO (last-in, first-out) stack.
@@ -24,6 +39,7 @@ class Stack(Generic[T]):
             Stack([1, 2, 3])  # 3 is at the top
         """
         self._items = list(items) if items else []
+        self._mod_count: int = 0
 
     # -------- Core stack operations --------
 
@@ -36,6 +52,7 @@ class Stack(Generic[T]):
         Time complexity: O(1) amortized.
         """
         self._items.append(item)
+        self._mod_count += 1
 
     def pop(self) -> T:
         """Remove and return the top item of the stack.
@@ -50,6 +67,7 @@ class Stack(Generic[T]):
         """
         if self.is_empty():
             raise IndexError('pop from empty stack')
+        self._mod_count += 1
         return self._items.pop()
 
     def peek(self) -> T:
@@ -84,9 +102,12 @@ class Stack(Generic[T]):
 
         After this call, is_empty() returns True and len(stack) == 0.
 
+        The backing storage is emptied in place rather than reallocated.
+
         Time complexity: O(1).
         """
-        self._items = []
+        del self._items[:]
+        self._mod_count += 1
 
     def extend(self, items: Iterable[T]) -> None:
         """Push multiple items onto the stack, in iteration order.
@@ -103,8 +124,38 @@ class Stack(Generic[T]):
 
         Time complexity: O(k), where k is the number of items.
         """
-        for item in items:
-            self.push(item)
+        self._items.extend(items)
+        self._mod_count += 1
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return the top `n` items in a single slice operation.
+
+        Args:
+            n: The number of items to pop.
+
+        Returns:
+            The popped items, in pop order (top first).
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the stack holds fewer than n items.
+
+        Example:
+            s = Stack([1, 2, 3, 4])
+            s.pop_many(2)  # [4, 3]
+
+        Time complexity: O(n).
+        """
+        if n < 0:
+            raise ValueError('n must be non-negative')
+        if n > len(self._items):
+            raise IndexError('pop from empty stack')
+        start = len(self._items) - n
+        popped = self._items[start:]
+        del self._items[start:]
+        self._mod_count += 1
+        popped.reverse()
+        return popped
 
     # -------- Python protocol methods --------
 
@@ -131,6 +182,8 @@ class Stack(Generic[T]):
     def __iter__(self) -> Iterator[T]:
         """Iterate over the items in the stack from top to bottom.
 
+        The iteration is lazy and does not copy the stack.
+
         Yields:
             Each item in the stack, starting from the top.
 
@@ -138,7 +191,23 @@ class Stack(Generic[T]):
             s = Stack([1, 2, 3])
             list(s)  # [3, 2, 1]  (top to bottom)
         """
-        return iter(self._items[::-1])
+        return reversed(self._items)
+
+    def view(self) -> StackView[T]:
+        """Return a read-only, zero-copy view of the stack.
+
+        The view is indexed from the top: `view[0]` is the top item. Slicing the
+        view returns another view. Any modification of the stack invalidates the
+        view, and using it afterwards raises RuntimeError.
+
+        Returns:
+            A view over the current items, top to bottom.
+
+        Example:
+            s = Stack([1, 2, 3, 4])
+            s.view()[1:3]  # StackView([3, 2])
+        """
+        return StackView(self, range(len(self._items) - 1, -1, -1))
 
     def __repr__(self) -> str:
         """Return a string representation of the stack.
@@ -149,4 +218,524 @@ class Stack(Generic[T]):
         Example:
             Stack([1, 2, 3])
         """
-        return f'Stack({self._items})'
+        return f'{self.__class__.__name__}({self._items})'
+
+
+class _ExtremumStack(Stack[T], ABC):
+    """Abstract base class for stacks that track their extreme item.
+
+    Alongside the items, an auxiliary list records every item that was the
+    extreme when it was pushed. Its last entry is always the extreme of the
+    whole stack. Only items that tie or beat the current extreme are recorded,
+    so for most workloads the auxiliary list stays far smaller than the stack.
+    """
+
+    def __init__(self, items: Iterable[T] | None = None) -> None:
+        """Initialize the stack.
+
+        Args:
+            items: Optional iterable of initial items. The last item in the
+                   iterable should be considered the "top" of the stack.
+        """
+        self._extremes: list[T] = []
+        super().__init__()
+        self.extend(items or [])
+
+    @staticmethod
+    @abstractmethod
+    def _replaces(item: T, extreme: T) -> bool:
+        """Check whether an item ties or beats the current extreme.
+
+        Args:
+            item: The item being pushed or popped.
+            extreme: The current extreme of the stack.
+
+        Returns:
+            True if `item` must be recorded as the new extreme.
+        """
+        ...
+
+    def push(self, item: T) -> None:
+        """Push a single item onto the top of the stack.
+
+        Args:
+            item: The item to push onto the stack.
+
+        Time complexity: O(1) amortized.
+        """
+        self._items.append(item)
+        self._mod_count += 1
+        if not self._extremes or self._replaces(item, self._extremes[-1]):
+            self._extremes.append(item)
+
+    def pop(self) -> T:
+        """Remove and return the top item of the stack.
+
+        Returns:
+            The item that was at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1).
+        """
+        item = super().pop()
+        if self._replaces(item, self._extremes[-1]):
+            self._extremes.pop()
+        return item
+
+    def clear(self) -> None:
+        """Remove all items from the stack.
+
+        Time complexity: O(1).
+        """
+        super().clear()
+        self._extremes = []
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Push multiple items onto the stack, in iteration order.
+
+        Each item still has to be compared with the current extreme, so this
+        pushes the items one at a time.
+
+        Args:
+            items: An iterable of items to push onto the stack.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        for item in items:
+            self.push(item)
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return the top `n` items.
+
+        Args:
+            n: The number of items to pop.
+
+        Returns:
+            The popped items, in pop order (top first).
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the stack holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        popped = super().pop_many(n)
+        for item in popped:
+            if self._replaces(item, self._extremes[-1]):
+                self._extremes.pop()
+        return popped
+
+    def _extreme(self, name: str) -> T:
+        """Return the tracked extreme of the stack.
+
+        Args:
+            name: The name of the public query, used in the error message.
+
+        Returns:
+            The extreme item of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+        """
+        if not self._extremes:
+            raise IndexError(f'{name} from empty stack')
+        return self._extremes[-1]
+
+
+class MinStack(_ExtremumStack[T]):
+    """A stack that reports its minimum item in O(1)."""
+
+    @staticmethod
+    def _replaces(item: T, extreme: T) -> bool:
+        """Check whether an item is less than or equal to the current minimum.
+
+        Args:
+            item: The item being pushed or popped.
+            extreme: The current minimum of the stack.
+
+        Returns:
+            True if `item` must be recorded as the new minimum.
+        """
+        return item <= extreme
+
+    def min(self) -> T:
+        """Return the minimum item in the stack.
+
+        Returns:
+            The smallest item currently in the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1).
+        """
+        return self._extreme('min')
+
+
+class MaxStack(_ExtremumStack[T]):
+    """A stack that reports its maximum item in O(1)."""
+
+    @staticmethod
+    def _replaces(item: T, extreme: T) -> bool:
+        """Check whether an item is greater than or equal to the current maximum.
+
+        Args:
+            item: The item being pushed or popped.
+            extreme: The current maximum of the stack.
+
+        Returns:
+            True if `item` must be recorded as the new maximum.
+        """
+        return item >= extreme
+
+    def max(self) -> T:
+        """Return the maximum item in the stack.
+
+        Returns:
+            The largest item currently in the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1).
+        """
+        return self._extreme('max')
+
+
+class MonotonicStack(Stack[T]):
+    """A stack whose items stay sorted from bottom to top.
+
+    Pushing an item first pops every item that would break the ordering and
+    returns them. For an increasing stack the evicted items are exactly those
+    for which the pushed item is the next smaller element, and for a decreasing
+    stack those for which it is the next greater element. Every item is pushed
+    and evicted at most once, so a full scan costs O(n).
+
+    Example:
+        # next greater element of each value
+        next_greater = {}
+        stack = MonotonicStack(increasing=False)
+        for value in [2, 1, 5, 3, 4]:
+            for smaller in stack.push(value):
+                next_greater[smaller] = value
+        # next_greater == {1: 5, 2: 5, 3: 4}
+    """
+
+    def __init__(self, items: Iterable[T] | None = None, increasing: bool = True, strict: bool = False) -> None:
+        """Initialize the stack.
+
+        Args:
+            items: Optional iterable of initial items, pushed in order.
+            increasing: If True, items increase from bottom to top, otherwise
+                they decrease.
+            strict: If True, equal items also evict each other, so the stack is
+                strictly monotonic.
+        """
+        self._increasing = increasing
+        self._strict = strict
+        super().__init__()
+        self.extend(items or [])
+
+    def _evicts(self, item: T, top: T) -> bool:
+        """Check whether pushing an item must evict the current top.
+
+        Args:
+            item: The item being pushed.
+            top: The item currently at the top of the stack.
+
+        Returns:
+            True if `top` breaks the ordering once `item` is pushed.
+        """
+        if self._increasing:
+            return top >= item if self._strict else top > item
+        return top <= item if self._strict else top < item
+
+    def push(self, item: T) -> list[T]:
+        """Evict the items that break the ordering, then push an item.
+
+        Args:
+            item: The item to push onto the stack.
+
+        Returns:
+            The evicted items, in the order they were popped (top first).
+
+        Time complexity: O(1) amortized.
+        """
+        evicted = []
+        items = self._items
+        while items and self._evicts(item, items[-1]):
+            evicted.append(items.pop())
+        items.append(item)
+        self._mod_count += 1
+        return evicted
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Push multiple items in iteration order, evicting as `push` does.
+
+        Args:
+            items: An iterable of items to push onto the stack.
+
+        Time complexity: O(k) amortized, where k is the number of items.
+        """
+        for item in items:
+            self.push(item)
+
+
+class TypedStack(Stack[T]):
+    """A stack of unboxed machine values backed by an `array.array`.
+
+    Every item is stored as a raw C value of the given typecode (see the
+    `array` module), so an int or float item costs 1 to 8 bytes instead of a
+    pointer plus a boxed object. Items are boxed again only when read.
+    """
+
+    def __init__(self, typecode: str, items: Iterable[T] | None = None) -> None:
+        """Initialize the stack.
+
+        Args:
+            typecode: An `array` typecode such as 'i', 'q' or 'd'.
+            items: Optional iterable or buffer of initial items. The last item
+                   should be considered the "top" of the stack.
+
+        Raises:
+            ValueError: If the typecode is not a valid `array` typecode.
+
+        Example:
+            TypedStack('q', [1, 2, 3])  # 3 is at the top
+        """
+        super().__init__()
+        self._items = array(typecode)
+        if items is not None:
+            self.push_many(items)
+
+    @property
+    def typecode(self) -> str:
+        """The `array` typecode of the stored items."""
+        return self._items.typecode
+
+    def push_many(self, items: Iterable[T]) -> None:
+        """Push multiple items onto the stack, in iteration order.
+
+        Contiguous buffers holding native values of the same kind and size as
+        the typecode (another array, a memoryview, a NumPy array) are copied
+        with a single `memcpy`, even when their format character differs, such
+        as an int64 NumPy array ('l') pushed onto a 'q' stack. Anything else is
+        converted item by item. The items are converted before any is pushed,
+        so a rejected call leaves the stack, and its iterators and views,
+        untouched.
+
+        Args:
+            items: An iterable or buffer of items to push.
+
+        Raises:
+            TypeError: If an item cannot be stored with this typecode.
+            OverflowError: If an item does not fit in this typecode.
+
+        Time complexity: O(k), where k is the number of items.
+        """
+        try:
+            view = memoryview(items)
+        except TypeError:
+            self._items.extend(array(self._items.typecode, items))
+        else:
+            with view:
+                if view.c_contiguous and self._matches_buffer(view):
+                    self._items.frombytes(view.cast('B'))
+                else:
+                    self._items.extend(array(self._items.typecode, view.tolist()))
+        self._mod_count += 1
+
+    def _matches_buffer(self, view: memoryview) -> bool:
+        """Check whether a buffer's raw bytes can be copied into the stack.
+
+        Args:
+            view: A view of the buffer.
+
+        Returns:
+            True if the buffer holds native-order values of the same kind
+            (signed, unsigned, float or character) and item size as the stack.
+        """
+        fmt = view.format.lstrip('@=')
+        if fmt[:1] in ('<', '>', '!'):
+            if fmt[0] != ('<' if sys.byteorder == 'little' else '>'):
+                return False
+            fmt = fmt[1:]
+        kind = _TYPECODE_KINDS.get(fmt)
+        return (
+            kind is not None and kind == _TYPECODE_KINDS[self._items.typecode] and view.itemsize == self._items.itemsize
+        )
+
+    def pop_many(self, n: int) -> array:
+        """Remove and return the top `n` items.
+
+        Args:
+            n: The number of items to pop.
+
+        Returns:
+            An array of the popped items, in pop order (top first).
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the stack holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        return super().pop_many(n)
+
+    def to_memoryview(self) -> memoryview:
+        """Return a zero-copy view of the items, bottom to top.
+
+        While the view is alive the stack cannot grow or shrink: `push` and
+        `pop` raise BufferError until the view is released.
+
+        Returns:
+            A memoryview over the underlying array.
+        """
+        return memoryview(self._items)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the stack.
+
+        Returns:
+            A string representation showing the typecode and stack contents.
+
+        Example:
+            TypedStack('q', [1, 2, 3])
+        """
+        return f'{self.__class__.__name__}({self._items.typecode!r}, {self._items.tolist()})'
+
+
+class UndoStack(Stack[T]):
+    """A stack used as an undo log, with O(1) checkpoints and bulk rollback.
+
+    A checkpoint records the current height of the stack under a new, unique
+    mark, so taking one or nesting them costs O(1). Rolling back truncates the
+    list with a single slice deletion. Rolling back to a mark keeps that mark
+    and every earlier one live, and invalidates every mark taken after it.
+    Popping or clearing below a mark invalidates it too, so a stale mark can
+    never silently remove the wrong entries.
+
+    Example:
+        log = UndoStack()
+        outer = log.checkpoint()
+        log.push('a')
+        inner = log.checkpoint()
+        log.extend(['b', 'c'])
+        log.rollback(inner)  # ['c', 'b']
+        log.rollback(outer)  # ['a']
+    """
+
+    def __init__(self, items: Iterable[T] | None = None) -> None:
+        """Initialize the stack.
+
+        Args:
+            items: Optional iterable of initial items. The last item in the
+                   iterable should be considered the "top" of the stack.
+        """
+        super().__init__(items)
+        # Live marks, oldest first, and the heights they recorded.
+        self._marks: list[int] = []
+        self._heights: list[int] = []
+        self._next_mark = 0
+
+    def checkpoint(self) -> int:
+        """Mark the current state of the log.
+
+        Returns:
+            A mark to pass to `rollback`. The mark becomes invalid when a mark
+            taken before it is rolled back, or when the stack is popped or
+            cleared below the height it recorded.
+
+        Time complexity: O(1).
+        """
+        mark = self._next_mark
+        self._next_mark += 1
+        self._marks.append(mark)
+        self._heights.append(len(self._items))
+        return mark
+
+    def rollback(self, mark: int, undo: Callable[[list[T]], None] | None = None) -> list[T]:
+        """Remove every item pushed since a checkpoint.
+
+        Args:
+            mark: A mark returned by `checkpoint`.
+            undo: Optional callback invoked once with all removed items, newest
+                first, so they can be undone in bulk.
+
+        Returns:
+            The removed items, newest first.
+
+        Raises:
+            ValueError: If the mark was never returned by `checkpoint` or has
+                been invalidated.
+
+        Time complexity: O(k + log m), where k is the number of removed items
+        and m the number of live marks.
+        """
+        index = bisect_left(self._marks, mark)
+        if index == len(self._marks) or self._marks[index] != mark:
+            raise ValueError('invalid checkpoint')
+        height = self._heights[index]
+        del self._marks[index + 1 :]
+        del self._heights[index + 1 :]
+        entries = self._items[height:]
+        del self._items[height:]
+        self._mod_count += 1
+        entries.reverse()
+        if undo is not None:
+            undo(entries)
+        return entries
+
+    def pop(self) -> T:
+        """Remove and return the top item, invalidating marks above it.
+
+        Returns:
+            The item that was at the top of the stack.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Time complexity: O(1) amortized.
+        """
+        item = super().pop()
+        self._drop_marks_above_height()
+        return item
+
+    def pop_many(self, n: int) -> list[T]:
+        """Remove and return the top `n` items, invalidating marks above them.
+
+        Args:
+            n: The number of items to pop.
+
+        Returns:
+            The popped items, in pop order (top first).
+
+        Raises:
+            ValueError: If n is negative.
+            IndexError: If the stack holds fewer than n items.
+
+        Time complexity: O(n).
+        """
+        popped = super().pop_many(n)
+        self._drop_marks_above_height()
+        return popped
+
+    def clear(self) -> None:
+        """Remove all items from the stack and every mark above the bottom.
+
+        Time complexity: O(m), where m is the number of invalidated marks.
+        """
+        super().clear()
+        self._drop_marks_above_height()
+
+    def _drop_marks_above_height(self) -> None:
+        """Forget every mark that recorded a height above the current one.
+
+        Live marks are kept oldest first, and their heights never decrease, so
+        the marks to drop are a suffix found by binary search.
+        """
+        index = bisect_right(self._heights, len(self._items))
+        del self._marks[index:]
+        del self._heights[index:]
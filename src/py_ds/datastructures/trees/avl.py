@@ -127,7 +127,7 @@ class AVLTree(BinarySearchTree[T]):
             The root node of the subtree after insertion and rebalancing.
         """
         if node is None:
-            return _BinaryNode(value=value)
+            return self._new_node(value)
         if value <= node.value:
             node.left = self._insert_recursive(node.left, value)
         else:
@@ -154,10 +154,10 @@ class AVLTree(BinarySearchTree[T]):
         elif value > node.value:
             node.right, removed = self._remove_recursive(node.right, value)
         else:
-            if node.left is None:
-                return node.right, True
-            elif node.right is None:
-                return node.left, True
+            if node.left is None or node.right is None:
+                child = node.left if node.left is not None else node.right
+                self._release_node(node)
+                return child, True
 
             temp = self._get_min_node(node.right)
             node.value = temp.value
@@ -5,10 +5,12 @@ from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from ..node_pool import NodePool
+
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class _BinaryNode(Generic[T]):
     """A node with references to its left and right child nodes."""
 
@@ -27,15 +29,18 @@ class _BinaryNode(Generic[T]):
 
 
 class BinaryTree(ABC, Generic[T]):
-    def __init__(self, items: Iterable[T] | None = None):
+    def __init__(self, items: Iterable[T] | None = None, pool_size: int = 0):
         """Initialize a binary tree.
 
         Args:
             items: Optional iterable of items to insert into the tree. If None,
                 an empty tree is created.
+            pool_size: If positive, removed nodes are recycled through a
+                `NodePool` holding up to this many free nodes.
         """
         self.root: _BinaryNode[T] | None = None
         self.size: int = 0
+        self._pool: NodePool[_BinaryNode[T]] | None = NodePool(_BinaryNode, pool_size) if pool_size else None
         items = items or []
         for item in items:
             self.insert(item)
@@ -56,6 +61,33 @@ class BinaryTree(ABC, Generic[T]):
             value: The value to remove from the tree.
         """
 
+    @property
+    def pool(self) -> NodePool[_BinaryNode[T]] | None:
+        """The node pool of the tree, or None if pooling is disabled."""
+        return self._pool
+
+    def _new_node(self, value: T) -> _BinaryNode[T]:
+        """Create a leaf node for a value, reusing a pooled node when possible.
+
+        Args:
+            value: The value to store in the node.
+
+        Returns:
+            A node holding `value` with no children.
+        """
+        if self._pool is not None:
+            return self._pool.acquire(value)
+        return _BinaryNode(value=value)
+
+    def _release_node(self, node: _BinaryNode[T]) -> None:
+        """Hand a detached node back to the pool, if pooling is enabled.
+
+        Args:
+            node: The node that was just removed from the tree.
+        """
+        if self._pool is not None:
+            self._pool.release(node)
+
     def clear(self) -> None:
         """Remove all elements from the tree."""
         self.root = None
@@ -12,7 +12,7 @@ class BinarySearchTree(BinaryTree[T]):
         Args:
             value: The value to insert into the tree.
         """
-        insert_node = _BinaryNode(value=value)
+        insert_node = self._new_node(value)
         self.size += 1
         if self.root is None:
             self.root = insert_node
@@ -72,6 +72,7 @@ class BinarySearchTree(BinaryTree[T]):
         if current.left is None or current.right is None:
             child = current.left if current.left is not None else current.right
             self._replace_child(parent, current, child)
+            self._release_node(current)
             return
 
         succ_parent, succ = current, current.right
@@ -80,6 +81,7 @@ class BinarySearchTree(BinaryTree[T]):
 
         current.value = succ.value
         self._replace_child(succ_parent, succ, succ.right)
+        self._release_node(succ)
 
     @staticmethod
     def _get_min_node(node: _BinaryNode[T]) -> _BinaryNode[T]:
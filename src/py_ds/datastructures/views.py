@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Generic, TypeVar, overload
+
+if TYPE_CHECKING:
+    from .queue import Queue
+    from .stack import Stack
+
+T = TypeVar('T')
+
+
+class _ContainerView(Generic[T], ABC):
+    """Abstract base class for read-only views over a container.
+
+    A view stores the container, the positions it exposes as a `range` of
+    storage indexes, and the container's modification counter at creation
+    time. Slicing a view only slices the range, so it never copies items.
+    Every access compares the counter with the container's current one and
+    raises RuntimeError if the container was modified in between.
+    """
+
+    def __init__(self, container: Stack[T] | Queue[T], positions: range) -> None:
+        """Initialize the view.
+
+        Args:
+            container: The container being viewed.
+            positions: The storage indexes exposed by the view, in view order.
+        """
+        self._container = container
+        self._positions = positions
+        self._mod_count = container._mod_count
+
+    @abstractmethod
+    def _get(self, position: int) -> T:
+        """Read the item stored at a storage index of the container.
+
+        Args:
+            position: The storage index to read.
+
+        Returns:
+            The item at that index.
+        """
+        ...
+
+    def _check(self) -> None:
+        """Verify that the container has not been modified since the view was made.
+
+        Raises:
+            RuntimeError: If the container was modified.
+        """
+        if self._container._mod_count != self._mod_count:
+            name = self._container.__class__.__name__.lower()
+            raise RuntimeError(f'{name} changed during view')
+
+    def __len__(self) -> int:
+        """Return the number of items in the view.
+
+        Returns:
+            The number of items in the view.
+
+        Raises:
+            RuntimeError: If the container was modified.
+
+        Time complexity: O(1).
+        """
+        self._check()
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> _ContainerView[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | _ContainerView[T]:
+        """Get an item of the view, or a sub-view for a slice.
+
+        Args:
+            index: 0-based index (negative indexes supported) or a slice.
+
+        Returns:
+            The item at the index, or a new view of the same container for a slice.
+
+        Raises:
+            IndexError: If the index is out of range.
+            RuntimeError: If the container was modified.
+        """
+        self._check()
+        if isinstance(index, slice):
+            view = self.__class__(self._container, self._positions[index])
+            view._mod_count = self._mod_count
+            return view
+        try:
+            position = self._positions[index]
+        except IndexError:
+            raise IndexError('view index out of range') from None
+        return self._get(position)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items of the view.
+
+        Yields:
+            Each item of the view, in view order.
+
+        Raises:
+            RuntimeError: If the container is modified during iteration.
+        """
+        for position in self._positions:
+            self._check()
+            yield self._get(position)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the view.
+
+        Returns:
+            A string representation showing the class name and the viewed items.
+        """
+        return f'{self.__class__.__name__}({list(self)})'
+
+
+class StackView(_ContainerView[T]):
+    """A read-only view of a `Stack`, indexed from the top.
+
+    Created with `Stack.view()`. Indexing and slicing cost O(1).
+    """
+
+    def _get(self, position: int) -> T:
+        """Read an item of the underlying list.
+
+        Args:
+            position: The list index to read.
+
+        Returns:
+            The item at that index.
+        """
+        return self._container._items[position]
+
+
+class QueueView(_ContainerView[T]):
+    """A read-only view of a `Queue`, indexed from the front.
+
+    Created with `Queue.view()`. Because the queue is a linked list, indexing
+    costs O(i), while iterating a forward view walks the list once.
+    """
+
+    def _get(self, position: int) -> T:
+        """Read an item of the underlying linked list.
+
+        Args:
+            position: The list index to read.
+
+        Returns:
+            The item at that index.
+        """
+        return self._container._items[position]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the items of the view.
+
+        Forward views walk the linked list once; reversed views fall back to
+        indexing.
+
+        Yields:
+            Each item of the view, in view order.
+
+        Raises:
+            RuntimeError: If the queue is modified during iteration.
+        """
+        positions = self._positions
+        if positions.step < 0:
+            yield from super().__iter__()
+            return
+        self._check()
+        for item in islice(self._container._items, positions.start, positions.stop, positions.step):
+            self._check()
+            yield item
@@ -212,3 +212,15 @@ def test_deletions_maintain_balance():
         validate_avl_tree(tree)
 
     assert len(tree) == 0
+
+
+def test_pool_recycles_removed_nodes():
+    tree = AVLTree(range(10), pool_size=16)
+    for v in range(10):
+        tree.remove(v)
+    assert len(tree.pool) == 10
+    for v in range(10):
+        tree.insert(v)
+        validate_avl_tree(tree)
+    assert tree.pool.hits == 10
+    assert len(tree.pool) == 0
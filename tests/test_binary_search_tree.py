@@ -258,3 +258,9 @@ def test_str_tree(small_bst: BinarySearchTree[int]) -> None:
     └── 2
 """[1:]
     assert str(small_bst) == result
+
+
+def test_nodes_are_slotted():
+    bst = BinarySearchTree([2, 1, 3])
+    assert not hasattr(bst.root, '__dict__')
+    assert not hasattr(bst.root.left, '__dict__')
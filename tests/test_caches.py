@@ -0,0 +1,238 @@
+import pytest
+
+from py_ds.datastructures.caches import CacheStats, LFUCache, LRUCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# -------------------------------------------------
+# LRU
+# -------------------------------------------------
+
+
+def test_lru_get_and_put():
+    cache: LRUCache[str, int] = LRUCache(2)
+    assert cache.get('a') is None
+    assert cache.get('a', 0) == 0
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+    assert 'a' in cache
+    assert len(cache) == 1
+    assert bool(cache) is True
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache
+    assert 'c' in cache
+
+
+def test_lru_put_existing_key_refreshes_recency():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 10)
+    cache.put('c', 3)
+    assert cache.get('a') == 10
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+
+def test_lru_weigher_evicts_by_weight():
+    cache = LRUCache(10, weigher=lambda k, v: len(v))
+    cache.put('a', 'xxxx')
+    cache.put('b', 'xxxx')
+    assert cache.weight == 8
+    cache.put('c', 'xxxxx')
+    assert 'a' not in cache
+    assert 'b' in cache
+    assert cache.weight == 9
+    with pytest.raises(ValueError):
+        cache.put('d', 'x' * 11)
+
+
+def test_lru_pop_and_clear():
+    cache = LRUCache(3)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.pop('a') == 1
+    assert cache.pop('a', None) is None
+    with pytest.raises(KeyError):
+        cache.pop('a')
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.weight == 0
+
+
+def test_stats_count_hits_misses_and_evictions():
+    cache = LRUCache(1)
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('b')
+    cache.put('b', 2)
+    stats = cache.stats()
+    assert stats == CacheStats(hits=1, misses=1, evictions=1, expirations=0, size=1, weight=1)
+    assert stats.hit_rate == 0.5
+    assert LRUCache(1).stats().hit_rate == 0.0
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+    with pytest.raises(ValueError):
+        LFUCache(0)
+
+
+def test_repr():
+    cache = LRUCache(5)
+    cache.put('a', 1)
+    assert repr(cache) == 'LRUCache(size=1, weight=1, capacity=5)'
+
+
+# -------------------------------------------------
+# TTL
+# -------------------------------------------------
+
+
+def test_ttl_entries_expire():
+    clock = FakeClock()
+    cache = TTLCache(10, ttl=5, clock=clock)
+    cache.put('a', 1)
+    clock.now = 3
+    cache.put('b', 2)
+    clock.now = 5
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    clock.now = 8
+    assert 'b' not in cache
+    assert cache.stats().expirations == 2
+
+
+def test_ttl_put_renews_expiry():
+    clock = FakeClock()
+    cache = TTLCache(10, ttl=5, clock=clock)
+    cache.put('a', 1)
+    clock.now = 4
+    cache.put('a', 2)
+    clock.now = 6
+    assert cache.get('a') == 2
+    clock.now = 9
+    assert cache.expire() == 1
+    assert len(cache) == 0
+
+
+def test_ttl_still_evicts_by_recency():
+    clock = FakeClock()
+    cache = TTLCache(2, ttl=100, clock=clock)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.stats().evictions == 1
+    cache.pop('a')
+    cache.clear()
+    assert cache.expire() == 0
+
+
+def test_ttl_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(1, ttl=0)
+
+
+# -------------------------------------------------
+# LFU
+# -------------------------------------------------
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = LFUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert cache.frequency('a') == 2
+    assert cache.frequency('c') == 1
+
+
+def test_lfu_ties_evict_least_recently_used():
+    cache = LFUCache(3)
+    for key in 'abc':
+        cache.put(key, 0)
+    cache.get('a')
+    cache.get('b')
+    cache.put('d', 0)
+    assert 'c' not in cache
+    cache.get('d')
+    cache.put('e', 0)
+    assert 'a' not in cache
+    assert sorted(k for k in 'abcde' if k in cache) == ['b', 'd', 'e']
+
+
+def test_lfu_put_existing_counts_as_use():
+    cache = LFUCache(2)
+    cache.put('a', 1)
+    cache.put('a', 2)
+    cache.put('b', 3)
+    cache.put('c', 4)
+    assert cache.get('a') == 2
+    assert cache.frequency('a') == 3
+    assert 'b' not in cache
+
+
+def test_lfu_new_entry_is_not_evicted_by_its_own_put():
+    cache = LFUCache(4, weigher=lambda k, v: v)
+    cache.put('a', 1)
+    cache.put('b', 1)
+    cache.put('c', 4)
+    assert 'c' in cache
+    assert 'a' not in cache
+    assert 'b' not in cache
+    assert cache.weight == 4
+    assert cache.stats().evictions == 2
+
+
+def test_lfu_pop_and_clear():
+    cache = LFUCache(3)
+    cache.put('a', 1)
+    cache.get('a')
+    assert cache.pop('a') == 1
+    assert cache.pop('a', None) is None
+    with pytest.raises(KeyError):
+        cache.pop('a')
+    with pytest.raises(KeyError):
+        cache.frequency('a')
+    cache.put('b', 2)
+    cache.clear()
+    assert len(cache) == 0
+    cache.put('c', 3)
+    assert cache.frequency('c') == 1
+
+
+def test_lfu_lone_key_keeps_bucket_order():
+    cache = LFUCache(3)
+    cache.put('a', 1)
+    for _ in range(3):
+        cache.get('a')
+    cache.put('b', 2)
+    cache.get('b')
+    cache.put('c', 3)
+    assert [cache.frequency(k) for k in 'abc'] == [4, 2, 1]
+    cache.get('c')
+    cache.get('c')
+    assert cache.frequency('c') == 3
+    cache.put('d', 4)
+    assert 'b' not in cache
+    assert [cache.frequency(k) for k in 'acd'] == [4, 3, 1]
@@ -0,0 +1,82 @@
+import copy
+import pickle
+
+import pytest
+
+from py_ds.datastructures.linked_lists import ConsList, LinkedList
+
+
+def test_empty_list_initial_state():
+    cons = ConsList()
+    assert len(cons) == 0
+    assert bool(cons) is False
+    assert cons.head() is None
+    assert list(cons) == []
+
+
+def test_init_with_items_keeps_order():
+    cons = ConsList([1, 2, 3])
+    assert list(cons) == [1, 2, 3]
+    assert len(cons) == 3
+    assert cons.head() == 1
+    assert repr(cons) == 'ConsList([1, 2, 3])'
+
+
+def test_prepend_returns_new_list_sharing_the_tail():
+    base = ConsList([2, 3])
+    a = base.prepend(1)
+    b = base.prepend(0)
+    assert list(base) == [2, 3]
+    assert list(a) == [1, 2, 3]
+    assert list(b) == [0, 2, 3]
+    assert a.rest()._first is base._first
+    assert b.rest()._first is base._first
+
+
+def test_rest():
+    cons = ConsList([1, 2])
+    assert list(cons.rest()) == [2]
+    assert len(cons.rest()) == 1
+    assert cons.rest().rest() == ConsList()
+    with pytest.raises(IndexError):
+        ConsList().rest()
+
+
+def test_getitem():
+    cons = ConsList([1, 2, 3])
+    assert cons[0] == 1
+    assert cons[2] == 3
+    assert cons[-1] == 3
+    assert cons[-3] == 1
+    with pytest.raises(IndexError):
+        cons[3]
+    with pytest.raises(IndexError):
+        cons[-4]
+
+
+def test_equality():
+    base = ConsList([2, 3])
+    assert base.prepend(1) == ConsList([1, 2, 3])
+    assert base.prepend(1) == base.prepend(1)
+    assert base.prepend(1) != base.prepend(0)
+    assert ConsList([1]) != ConsList([1, 2])
+    assert ConsList([1]) != [1]
+
+
+def test_conversion_to_and_from_linked_list():
+    ll = LinkedList([1, 2, 3])
+    cons = ConsList(ll)
+    assert list(cons) == [1, 2, 3]
+    back = cons.to_linked_list()
+    assert isinstance(back, LinkedList)
+    assert list(back) == [1, 2, 3]
+    back.append(4)
+    assert list(cons) == [1, 2, 3]
+
+
+def test_long_chains_iterate_and_pickle():
+    cons = ConsList(range(200_000))
+    assert sum(cons) == sum(range(200_000))
+    restored = pickle.loads(pickle.dumps(cons))
+    assert restored == cons
+    assert copy.deepcopy(cons) == cons
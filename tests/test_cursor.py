@@ -0,0 +1,140 @@
+import pytest
+
+from py_ds.datastructures.linked_lists import DoublyLinkedList, LinkedList
+
+LIST_TYPES = [LinkedList, DoublyLinkedList]
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_cursor_walks_forward(list_type):
+    ll = list_type([1, 2, 3])
+    cur = ll.cursor()
+    seen = []
+    while not cur.at_end:
+        seen.append((cur.index, cur.value))
+        cur.move_next()
+    assert seen == [(0, 1), (1, 2), (2, 3)]
+    assert cur.index == 3
+    with pytest.raises(IndexError):
+        cur.move_next()
+    with pytest.raises(IndexError):
+        _ = cur.value
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_cursor_walks_backward(list_type):
+    ll = list_type([1, 2, 3])
+    cur = ll.cursor(at=len(ll))
+    seen = []
+    while cur.index > 0:
+        cur.move_prev()
+        seen.append(cur.value)
+    assert seen == [3, 2, 1]
+    with pytest.raises(IndexError):
+        cur.move_prev()
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_cursor_start_position(list_type):
+    ll = list_type([1, 2, 3])
+    assert ll.cursor(at=1).value == 2
+    assert ll.cursor(at=-1).value == 3
+    assert list_type().cursor().at_end
+    with pytest.raises(IndexError):
+        ll.cursor(at=4)
+    with pytest.raises(IndexError):
+        ll.cursor(at=-4)
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_filter_in_one_pass(list_type):
+    ll = list_type(range(10))
+    cur = ll.cursor()
+    while not cur.at_end:
+        if cur.value % 2 == 0:
+            cur.remove_current()
+        else:
+            cur.move_next()
+    assert list(ll) == [1, 3, 5, 7, 9]
+    assert len(ll) == 5
+    assert ll.head() == 1
+    assert ll.tail() == 9
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_insert_before_and_after(list_type):
+    ll = list_type([1, 3])
+    cur = ll.cursor()
+    cur.insert_before(0)
+    assert (cur.index, cur.value) == (1, 1)
+    cur.insert_after(2)
+    assert cur.value == 1
+    cur.move_next()
+    cur.move_next()
+    cur.insert_after(4)
+    cur.move_next()
+    cur.move_next()
+    cur.insert_before(5)
+    assert cur.at_end
+    assert list(ll) == [0, 1, 2, 3, 4, 5]
+    assert ll.tail() == 5
+    assert len(ll) == 6
+    with pytest.raises(IndexError):
+        cur.insert_after(6)
+
+
+def test_doubly_prev_links_stay_consistent():
+    dll = DoublyLinkedList([1, 2, 3, 4])
+    cur = dll.cursor(at=1)
+    cur.remove_current()
+    cur.insert_before(5)
+    cur.insert_after(6)
+    assert list(dll) == [1, 5, 3, 6, 4]
+    assert list(dll.reverse_iter()) == [4, 6, 3, 5, 1]
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_remove_last_updates_tail(list_type):
+    ll = list_type([1, 2])
+    cur = ll.cursor(at=1)
+    assert cur.remove_current() == 2
+    assert cur.at_end
+    assert ll.tail() == 1
+    ll_cur = ll.cursor()
+    ll_cur.remove_current()
+    assert ll.head() is None and ll.tail() is None
+    with pytest.raises(IndexError):
+        ll_cur.remove_current()
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_replace(list_type):
+    ll = list_type([1, 2])
+    cur = ll.cursor(at=1)
+    assert cur.replace(20) == 2
+    assert list(ll) == [1, 20]
+
+
+@pytest.mark.parametrize('list_type', LIST_TYPES)
+def test_outside_modification_fails_fast(list_type):
+    ll = list_type([1, 2, 3])
+    cur = ll.cursor()
+    ll.append(4)
+    with pytest.raises(RuntimeError):
+        _ = cur.value
+    with pytest.raises(RuntimeError):
+        cur.move_next()
+
+    other = ll.cursor()
+    ll[0] = 10
+    assert other.value == 10
+    ll.cursor().remove_current()
+    with pytest.raises(RuntimeError):
+        other.insert_before(0)
+
+
+def test_repr():
+    cur = LinkedList([5, 6]).cursor(at=1)
+    assert repr(cur) == 'Cursor(index=1, value=6)'
+    cur.move_next()
+    assert repr(cur) == 'Cursor(index=2, value=END)'
@@ -0,0 +1,180 @@
+import collections
+
+import pytest
+
+from py_ds.datastructures.deque import _BLOCK_SIZE, Deque
+
+
+def test_empty_deque_initial_state():
+    d: Deque[int] = Deque()
+    assert d.is_empty() is True
+    assert len(d) == 0
+    assert bool(d) is False
+    assert list(d) == []
+
+
+def test_init_with_items():
+    d = Deque([1, 2, 3])
+    assert len(d) == 3
+    assert d.peekleft() == 1
+    assert d.peek() == 3
+    assert list(d) == [1, 2, 3]
+
+
+def test_append_and_appendleft():
+    d = Deque[int]()
+    d.append(2)
+    d.appendleft(1)
+    d.append(3)
+    assert list(d) == [1, 2, 3]
+
+
+def test_pop_and_popleft():
+    d = Deque([1, 2, 3, 4])
+    assert d.pop() == 4
+    assert d.popleft() == 1
+    assert list(d) == [2, 3]
+
+
+def test_pop_on_empty_raises():
+    d = Deque[int]()
+    with pytest.raises(IndexError):
+        d.pop()
+    with pytest.raises(IndexError):
+        d.popleft()
+
+
+def test_peek_on_empty_raises():
+    d = Deque[int]()
+    with pytest.raises(IndexError):
+        d.peek()
+    with pytest.raises(IndexError):
+        d.peekleft()
+
+
+def test_grows_across_many_blocks_in_both_directions():
+    n = _BLOCK_SIZE * 5 + 3
+    d = Deque[int]()
+    for i in range(n):
+        d.append(i)
+        d.appendleft(-i - 1)
+    assert len(d) == 2 * n
+    assert list(d) == list(range(-n, n))
+    assert list(reversed(d)) == list(range(n - 1, -n - 1, -1))
+
+
+def test_drain_across_blocks_from_both_ends():
+    n = _BLOCK_SIZE * 4
+    d = Deque(range(n))
+    popped = [d.popleft() if i % 2 else d.pop() for i in range(n)]
+    assert sorted(popped) == list(range(n))
+    assert d.is_empty()
+    d.append(1)
+    assert list(d) == [1]
+
+
+def test_mixed_operations_match_reference():
+    from collections import deque
+
+    d = Deque[int]()
+    ref: deque[int] = deque()
+    for i in range(1000):
+        op = i % 7
+        if op in (0, 1, 2):
+            d.append(i)
+            ref.append(i)
+        elif op in (3, 4):
+            d.appendleft(i)
+            ref.appendleft(i)
+        elif op == 5 and ref:
+            assert d.pop() == ref.pop()
+        elif ref:
+            assert d.popleft() == ref.popleft()
+    assert list(d) == list(ref)
+
+
+def test_indexing():
+    d = Deque(range(_BLOCK_SIZE * 3))
+    d.appendleft(-1)
+    assert d[0] == -1
+    assert d[1] == 0
+    assert d[-1] == _BLOCK_SIZE * 3 - 1
+    assert all(d[i + 1] == i for i in range(_BLOCK_SIZE * 3))
+
+
+def test_setitem():
+    d = Deque(range(_BLOCK_SIZE * 2))
+    d[_BLOCK_SIZE] = 'x'
+    d[-1] = 'y'
+    assert d[_BLOCK_SIZE] == 'x'
+    assert d.peek() == 'y'
+
+
+def test_index_out_of_range_raises():
+    d = Deque([1, 2, 3])
+    with pytest.raises(IndexError):
+        d[3]
+    with pytest.raises(IndexError):
+        d[-4]
+    with pytest.raises(IndexError):
+        Deque()[0]
+
+
+def test_extend_and_extendleft():
+    d = Deque([3])
+    d.extend([4, 5])
+    d.extendleft([2, 1])
+    assert list(d) == [1, 2, 3, 4, 5]
+
+
+def test_clear():
+    d = Deque(range(_BLOCK_SIZE * 2))
+    d.clear()
+    assert d.is_empty()
+    assert list(d) == []
+    d.appendleft(1)
+    assert list(d) == [1]
+
+
+def test_repr():
+    assert repr(Deque([1, 2, 3])) == 'Deque([1, 2, 3])'
+
+
+def test_pop_many_and_popleft_many():
+    d = Deque(range(_BLOCK_SIZE * 2))
+    assert d.popleft_many(3) == [0, 1, 2]
+    assert d.pop_many(2) == [_BLOCK_SIZE * 2 - 1, _BLOCK_SIZE * 2 - 2]
+    with pytest.raises(IndexError):
+        d.pop_many(len(d) + 1)
+    with pytest.raises(ValueError):
+        d.popleft_many(-1)
+
+
+def test_bulk_operations_cross_block_boundaries():
+    d = Deque()
+    ref = collections.deque()
+    n = _BLOCK_SIZE * 3 + 5
+    d.extend(range(n))
+    ref.extend(range(n))
+    d.extendleft(iter(range(-1, -n, -1)))
+    ref.extendleft(range(-1, -n, -1))
+    assert list(d) == list(ref)
+    assert list(reversed(d)) == list(reversed(ref))
+    assert d.pop_many(_BLOCK_SIZE * 2 + 3) == [ref.pop() for _ in range(_BLOCK_SIZE * 2 + 3)]
+    assert d.popleft_many(_BLOCK_SIZE * 2 + 7) == [ref.popleft() for _ in range(_BLOCK_SIZE * 2 + 7)]
+    assert list(d) == list(ref)
+    d.extend(d)
+    ref.extend(ref)
+    assert list(d) == list(ref)
+    assert d.popleft_many(len(d) - 1) == [ref.popleft() for _ in range(len(ref) - 1)]
+    assert d.pop_many(1) == [ref.pop()]
+    assert d.is_empty()
+    d.extendleft(range(_BLOCK_SIZE))
+    d.append('x')
+    assert d[0] == _BLOCK_SIZE - 1
+    assert d.pop() == 'x'
+    assert len(d) == _BLOCK_SIZE
+
+
+def test_blocks_are_slotted():
+    assert not hasattr(Deque([1])._head, '__dict__')
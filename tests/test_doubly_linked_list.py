@@ -3,6 +3,7 @@
 import pytest
 
 from py_ds.datastructures.linked_lists.doubly_linked import DoublyLinkedList
+from py_ds.datastructures.linked_lists.singly_linked import LinkedList
 
 
 def test_empty_list_initial_state():
@@ -275,3 +276,138 @@ def test_complex_operations():
     # Clear
     dll.clear()
     assert len(dll) == 0
+
+
+def test_extend_links_prev_pointers():
+    dll = DoublyLinkedList([1])
+    dll.extend([2, 3])
+    assert list(dll) == [1, 2, 3]
+    assert list(dll.reverse_iter()) == [3, 2, 1]
+    assert dll.tail() == 3
+
+
+def test_pop_front_batch_resets_head_prev():
+    dll = DoublyLinkedList([1, 2, 3])
+    assert dll._pop_front(2) == [1, 2]
+    assert dll._head.prev is dll._sentinel
+    assert list(dll.reverse_iter()) == [3]
+    assert dll._pop_front(1) == [3]
+    assert dll.tail() is None
+
+
+def test_nodes_are_slotted():
+    dll = DoublyLinkedList([1, 2])
+    assert not hasattr(dll._head, '__dict__')
+    assert dll._tail.prev is dll._head
+
+
+def test_pool_recycles_removed_nodes():
+    dll = DoublyLinkedList([1, 2, 3], pool_size=8)
+    dll.pop()
+    dll.remove(1)
+    dll.extend([4, 5])
+    assert list(dll) == [2, 4, 5]
+    assert dll._tail.prev.value == 4
+    assert dll.pool.hits == 2
+    assert len(dll.pool) == 0
+
+
+def test_finger_walks_in_both_directions():
+    dll = DoublyLinkedList(range(100))
+    assert dll[50] == 50
+    assert dll[48] == 48
+    assert dll._valid_finger()[0] == 48
+    assert [dll[i] for i in range(99, -1, -1)] == list(range(99, -1, -1))
+    assert dll.pop(-50) == 50
+    assert dll._valid_finger()[0] == 49
+    dll.insert(-1, 'x')
+    assert dll[-2] == 'x'
+    assert list(dll.reverse_iter())[:3] == [99, 'x', 98]
+    with pytest.raises(IndexError):
+        dll.insert(-len(dll) - 1, 0)
+
+
+def test_concat_split_and_splice_keep_prev_links():
+    a = DoublyLinkedList([1, 2])
+    a.concat(DoublyLinkedList([3, 4]))
+    a.splice(2, DoublyLinkedList(['x', 'y']))
+    assert list(a) == [1, 2, 'x', 'y', 3, 4]
+    assert list(a.reverse_iter()) == [4, 3, 'y', 'x', 2, 1]
+    rest = a.split_at(3)
+    assert list(a.reverse_iter()) == ['x', 2, 1]
+    assert list(rest.reverse_iter()) == [4, 3, 'y']
+    assert rest._head.prev is rest._sentinel
+    assert isinstance(rest, DoublyLinkedList)
+    with pytest.raises(TypeError):
+        a.concat(LinkedList([5]))
+
+
+def test_sort_fixes_prev_links():
+    dll = DoublyLinkedList([5, 3, 4, 1, 2])
+    dll.sort()
+    assert list(dll) == [1, 2, 3, 4, 5]
+    assert list(dll.reverse_iter()) == [5, 4, 3, 2, 1]
+    assert dll._head.prev is dll._sentinel
+    assert dll[-2] == 4
+
+
+def test_slicing_and_get_many_near_tail():
+    dll = DoublyLinkedList(range(20))
+    assert list(dll[15:]) == list(range(15, 20))
+    assert list(dll[18:10:-3]) == [18, 15, 12]
+    assert isinstance(dll[1:3], DoublyLinkedList)
+    assert list(dll[1:3].reverse_iter()) == [2, 1]
+    assert dll.get_many([19, 17, -2]) == [19, 17, 18]
+    assert dll.get_many([0, 19]) == [0, 19]
+
+
+def test_reverse_swaps_links():
+    dll = DoublyLinkedList([1, 2, 3, 4])
+    dll.reverse()
+    assert list(dll) == [4, 3, 2, 1]
+    assert list(dll.reverse_iter()) == [1, 2, 3, 4]
+    assert dll.head() == 4
+    assert dll.tail() == 1
+    dll.append(0)
+    assert list(dll.reverse_iter()) == [0, 1, 2, 3, 4]
+
+
+def test_rotate_fixes_prev_links_and_keeps_handles():
+    from collections import deque
+
+    for k in (-6, -2, -1, 0, 1, 3, 4, 11):
+        dll, expected = DoublyLinkedList(range(5)), deque(range(5))
+        dll.rotate(k)
+        expected.rotate(k)
+        assert list(dll) == list(expected)
+        assert list(dll.reverse_iter()) == list(reversed(expected))
+    dll = DoublyLinkedList()
+    h = dll.append(1, handle=True)
+    dll.extend([2, 3])
+    dll.rotate(1)
+    dll.reverse()
+    assert dll.remove_node(h) == 1
+    assert list(dll) == [2, 3]
+
+
+def test_sentinel_ring_stays_consistent():
+    dll = DoublyLinkedList()
+    assert dll._sentinel.next is dll._sentinel and dll._sentinel.prev is dll._sentinel
+    for i in range(6):
+        dll.append(i)
+        dll.prepend(-i)
+    dll.pop(0)
+    dll.pop()
+    dll.insert(3, 'x')
+    dll.remove(0)
+    dll.rotate(-4)
+    dll.reverse()
+    forward = list(dll)
+    assert list(dll.reverse_iter()) == forward[::-1]
+    assert dll.head() == forward[0] and dll.tail() == forward[-1]
+    assert len(dll) == len(forward)
+    while dll:
+        dll.pop(0)
+    assert dll.head() is None and dll.tail() is None
+    assert dll._head is None and dll._tail is None
+    assert dll._sentinel.value is None
@@ -0,0 +1,147 @@
+import itertools
+
+import pytest
+
+from py_ds.datastructures.fair_queue import FairQueue
+
+
+def fake_clock():
+    ticks = itertools.count()
+    return lambda: float(next(ticks))
+
+
+def test_empty_fair_queue_initial_state():
+    q: FairQueue[str, int] = FairQueue()
+    assert q.is_empty() is True
+    assert len(q) == 0
+    assert bool(q) is False
+    assert q.lanes() == []
+
+
+def test_dequeue_on_empty_raises():
+    q: FairQueue[str, int] = FairQueue({'a': 1})
+    with pytest.raises(IndexError):
+        q.dequeue()
+
+
+def test_single_lane_is_fifo():
+    q: FairQueue[str, int] = FairQueue()
+    for i in range(5):
+        q.enqueue(i, 'a')
+    assert [q.dequeue() for _ in range(5)] == [0, 1, 2, 3, 4]
+    assert q.is_empty()
+
+
+def test_equal_weights_round_robin():
+    q: FairQueue[str, str] = FairQueue()
+    for i in range(3):
+        q.enqueue(f'a{i}', 'a')
+    for i in range(3):
+        q.enqueue(f'b{i}', 'b')
+    assert [q.dequeue() for _ in range(6)] == ['a0', 'b0', 'a1', 'b1', 'a2', 'b2']
+
+
+def test_heavy_lane_does_not_block_others():
+    q: FairQueue[str, str] = FairQueue()
+    for i in range(1000):
+        q.enqueue(f'bulk{i}', 'bulk')
+    q.enqueue('urgent', 'small')
+    assert 'urgent' in [q.dequeue() for _ in range(2)]
+
+
+def test_weights_control_share():
+    q: FairQueue[str, str] = FairQueue({'a': 3, 'b': 1})
+    for _ in range(40):
+        q.enqueue('a', 'a')
+        q.enqueue('b', 'b')
+    first = [q.dequeue() for _ in range(40)]
+    assert first.count('a') == 30
+    assert first.count('b') == 10
+
+
+def test_fractional_weights():
+    q: FairQueue[str, str] = FairQueue({'a': 1, 'b': 0.5})
+    for _ in range(30):
+        q.enqueue('a', 'a')
+        q.enqueue('b', 'b')
+    first = [q.dequeue() for _ in range(30)]
+    assert first.count('a') == 20
+    assert first.count('b') == 10
+
+
+def test_lane_that_drains_leaves_the_ring():
+    q: FairQueue[str, str] = FairQueue({'a': 2, 'b': 2})
+    q.enqueue('a0', 'a')
+    for i in range(3):
+        q.enqueue(f'b{i}', 'b')
+    assert [q.dequeue() for _ in range(4)] == ['a0', 'b0', 'b1', 'b2']
+    q.enqueue('a1', 'a')
+    assert q.dequeue() == 'a1'
+
+
+def test_set_weight():
+    q: FairQueue[str, str] = FairQueue()
+    q.enqueue('a', 'a')
+    q.set_weight('a', 4)
+    assert q.stats('a').weight == 4
+    with pytest.raises(KeyError):
+        q.set_weight('missing', 1)
+
+
+def test_invalid_weights_raise():
+    with pytest.raises(ValueError):
+        FairQueue({'a': 0})
+    with pytest.raises(ValueError):
+        FairQueue(default_weight=-1)
+    q: FairQueue[str, int] = FairQueue()
+    with pytest.raises(ValueError):
+        q.add_lane('a', -2)
+
+
+def test_add_existing_lane_raises():
+    q: FairQueue[str, int] = FairQueue({'a': 1})
+    with pytest.raises(ValueError):
+        q.add_lane('a')
+
+
+def test_depth_and_stats():
+    q: FairQueue[str, str] = FairQueue(clock=fake_clock())
+    q.enqueue('x', 'a')  # t=0
+    q.enqueue('y', 'a')  # t=1
+    q.enqueue('z', 'b')  # t=2
+    assert q.depth('a') == 2
+    assert q.dequeue() == 'x'  # t=3, waited 3
+    assert q.dequeue() == 'z'  # t=4, waited 2
+    stats = q.stats('a')
+    assert stats.depth == 1
+    assert stats.enqueued == 2
+    assert stats.dequeued == 1
+    assert stats.total_wait == 3
+    assert stats.max_wait == 3
+    assert stats.mean_wait == 3
+    assert q.all_stats()['b'].mean_wait == 2
+
+
+def test_mean_wait_without_dequeues():
+    q: FairQueue[str, str] = FairQueue({'a': 1})
+    assert q.stats('a').mean_wait == 0.0
+
+
+def test_clear_keeps_lanes_and_stats():
+    q: FairQueue[str, int] = FairQueue()
+    q.enqueue(1, 'a')
+    q.enqueue(2, 'b')
+    q.dequeue()
+    q.clear()
+    assert q.is_empty()
+    assert q.lanes() == ['a', 'b']
+    assert q.stats('a').dequeued == 1
+    q.enqueue(3, 'b')
+    assert q.dequeue() == 3
+
+
+def test_repr():
+    q: FairQueue[str, int] = FairQueue({'a': 1})
+    q.enqueue(1, 'a')
+    q.enqueue(2, 'b')
+    assert repr(q) == "FairQueue({'a': 1, 'b': 1})"
@@ -0,0 +1,88 @@
+import pytest
+
+from py_ds.datastructures.linked_hash_map import LinkedHashMap
+
+
+def test_empty_map_initial_state():
+    m: LinkedHashMap[str, int] = LinkedHashMap()
+    assert len(m) == 0
+    assert bool(m) is False
+    assert list(m) == []
+    assert 'a' not in m
+
+
+def test_insertion_order_is_kept():
+    m = LinkedHashMap([('b', 2), ('a', 1), ('c', 3)])
+    assert list(m) == ['b', 'a', 'c']
+    assert list(m.values()) == [2, 1, 3]
+    assert list(m.items()) == [('b', 2), ('a', 1), ('c', 3)]
+    assert list(reversed(m)) == ['c', 'a', 'b']
+
+
+def test_assigning_existing_key_keeps_position():
+    m = LinkedHashMap([('a', 1), ('b', 2)])
+    m['a'] = 10
+    assert list(m.items()) == [('a', 10), ('b', 2)]
+    assert len(m) == 2
+
+
+def test_get_and_contains():
+    m = LinkedHashMap([('a', 1)])
+    assert m['a'] == 1
+    assert m.get('a') == 1
+    assert m.get('z') is None
+    assert m.get('z', 0) == 0
+    assert 'a' in m
+    with pytest.raises(KeyError):
+        m['z']
+
+
+def test_delete_and_pop():
+    m = LinkedHashMap([('a', 1), ('b', 2), ('c', 3)])
+    del m['b']
+    assert list(m) == ['a', 'c']
+    assert m.pop('c') == 3
+    assert m.pop('c', None) is None
+    assert list(m) == ['a']
+    with pytest.raises(KeyError):
+        m.pop('c')
+    with pytest.raises(KeyError):
+        del m['c']
+
+
+def test_move_to_end_and_front():
+    m = LinkedHashMap((k, k) for k in 'abcd')
+    m.move_to_end('b')
+    assert list(m) == ['a', 'c', 'd', 'b']
+    m.move_to_front('d')
+    assert list(m) == ['d', 'a', 'c', 'b']
+    m.move_to_front('d')
+    m.move_to_end('b')
+    assert list(m) == ['d', 'a', 'c', 'b']
+    assert list(reversed(m)) == ['b', 'c', 'a', 'd']
+    assert (m.first(), m.last()) == ('d', 'b')
+    with pytest.raises(KeyError):
+        m.move_to_end('z')
+
+
+def test_popitem_from_both_ends():
+    m = LinkedHashMap([('a', 1), ('b', 2), ('c', 3)])
+    assert m.popitem() == ('c', 3)
+    assert m.popitem(last=False) == ('a', 1)
+    assert m.popitem() == ('b', 2)
+    with pytest.raises(KeyError):
+        m.popitem()
+    with pytest.raises(KeyError):
+        m.first()
+
+
+def test_clear():
+    m = LinkedHashMap([('a', 1)])
+    m.clear()
+    assert list(m) == []
+    m['b'] = 2
+    assert list(m.items()) == [('b', 2)]
+
+
+def test_repr():
+    assert repr(LinkedHashMap([('a', 1), ('b', 2)])) == "LinkedHashMap({'a': 1, 'b': 2})"
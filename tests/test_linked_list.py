@@ -1,5 +1,6 @@
 import pytest
 
+from py_ds.datastructures.linked_lists.doubly_linked import DoublyLinkedList
 from py_ds.datastructures.linked_lists.singly_linked import LinkedList
 
 
@@ -203,3 +204,201 @@ def test_set_item():
 
     with pytest.raises(IndexError):
         ll[-4] = 40
+
+
+def test_extend_appends_in_order():
+    ll = LinkedList([1])
+    ll.extend(iter([2, 3]))
+    ll.extend([])
+    assert list(ll) == [1, 2, 3]
+    assert ll.tail() == 3
+    assert len(ll) == 3
+    ll.append(4)
+    assert list(ll) == [1, 2, 3, 4]
+
+
+def test_extend_on_empty_list():
+    ll = LinkedList()
+    ll.extend([1, 2])
+    assert ll.head() == 1
+    assert ll.tail() == 2
+
+
+def test_nodes_are_slotted():
+    ll = LinkedList([1, 2])
+    assert not hasattr(ll._head, '__dict__')
+
+
+def test_pool_recycles_removed_nodes():
+    ll = LinkedList([1, 2, 3], pool_size=2)
+    node = ll._head
+    assert ll.pop(0) == 1
+    ll.remove(3)
+    assert len(ll.pool) == 2
+    assert node.value is None
+    ll.append(4)
+    ll.insert(0, 5)
+    assert list(ll) == [5, 2, 4]
+    assert ll.pool.hits == 2
+    assert LinkedList([1]).pool is None
+
+
+def test_finger_speeds_up_sequential_access():
+    ll = LinkedList(range(10))
+    assert [ll[i] for i in range(10)] == list(range(10))
+    assert ll[3] == 3
+    assert ll._valid_finger()[0] == 2
+    assert ll[5] == 5
+    ll.insert(2, 'x')
+    assert ll._valid_finger()[0] == 1
+    assert ll[2] == 'x'
+    assert ll.pop(4) == 3
+    assert ll._valid_finger()[0] == 3
+    assert list(ll) == [0, 1, 'x', 2, 4, 5, 6, 7, 8, 9]
+    ll.append(10)
+    assert ll._valid_finger() is None
+    assert [ll[i] for i in range(len(ll))] == list(ll)
+
+
+def test_filter_by_index_keeps_finger():
+    ll = LinkedList(range(20))
+    i = 0
+    while i < len(ll):
+        if ll[i] % 3 == 0:
+            ll.pop(i)
+        else:
+            i += 1
+    assert list(ll) == [v for v in range(20) if v % 3]
+
+
+def test_concat_moves_nodes():
+    a, b = LinkedList([1, 2]), LinkedList([3, 4])
+    node = b._head
+    a.concat(b)
+    assert list(a) == [1, 2, 3, 4]
+    assert a.tail() == 4
+    assert len(a) == 4
+    assert a._head.next.next is node
+    assert list(b) == [] and len(b) == 0 and b.tail() is None
+    a.concat(LinkedList())
+    empty = LinkedList()
+    empty.concat(a)
+    assert list(empty) == [1, 2, 3, 4]
+
+
+def test_concat_rejects_self_and_other_types():
+    ll = LinkedList([1])
+    with pytest.raises(ValueError):
+        ll.concat(ll)
+    with pytest.raises(TypeError):
+        ll.concat([2])
+
+
+def test_concat_and_splice_reject_doubly_linked_lists():
+    ll = LinkedList([1, 2])
+    donor = DoublyLinkedList([3, 4])
+    with pytest.raises(TypeError):
+        ll.concat(donor)
+    with pytest.raises(TypeError):
+        ll.splice(1, donor)
+    assert list(ll) == [1, 2]
+    assert list(donor) == [3, 4]
+
+
+def test_split_at():
+    ll = LinkedList(range(5))
+    rest = ll.split_at(2)
+    assert list(ll) == [0, 1] and ll.tail() == 1 and len(ll) == 2
+    assert list(rest) == [2, 3, 4] and rest.tail() == 4 and len(rest) == 3
+    assert list(ll.split_at(-1)) == [1]
+    assert list(ll) == [0]
+    assert list(ll.split_at(1)) == []
+    assert list(ll.split_at(0)) == [0]
+    assert ll.head() is None and ll.tail() is None
+    with pytest.raises(IndexError):
+        ll.split_at(1)
+
+
+def test_splice():
+    ll = LinkedList([1, 5])
+    ll.splice(1, LinkedList([2, 3, 4]))
+    ll.splice(0, LinkedList([0]))
+    ll.splice(len(ll), LinkedList([6]))
+    assert list(ll) == [0, 1, 2, 3, 4, 5, 6]
+    assert ll.tail() == 6
+    assert len(ll) == 7
+    with pytest.raises(IndexError):
+        ll.splice(8, LinkedList([7]))
+
+
+def test_sort_relinks_nodes():
+    ll = LinkedList([3, 1, 2])
+    nodes = {ll._head.value: ll._head, ll._head.next.value: ll._head.next}
+    ll.sort()
+    assert list(ll) == [1, 2, 3]
+    assert ll._head is nodes[1]
+    assert ll.tail() == 3
+    assert ll._tail.next is None
+    ll.sort(reverse=True)
+    assert list(ll) == [3, 2, 1]
+
+
+def test_sort_is_stable_with_key():
+    words = ['bb', 'a', 'cc', 'd', 'eee']
+    ll = LinkedList(words)
+    ll.sort(key=len)
+    assert list(ll) == sorted(words, key=len)
+    ll = LinkedList(words)
+    ll.sort(key=len, reverse=True)
+    assert list(ll) == sorted(words, key=len, reverse=True)
+    empty = LinkedList()
+    empty.sort()
+    assert list(empty) == []
+
+
+def test_slicing_returns_new_list():
+    ll = LinkedList(range(10))
+    for s in (slice(2, 7), slice(None, None, 3), slice(-3, None), slice(8, 2, -2), slice(None, None, -1), slice(5, 5)):
+        sliced = ll[s]
+        assert isinstance(sliced, LinkedList)
+        assert list(sliced) == list(range(10))[s]
+    assert ll[2:4].tail() == 3
+    assert list(ll) == list(range(10))
+
+
+def test_get_many():
+    ll = LinkedList(range(0, 100, 10))
+    assert ll.get_many([3, 0, -1, 3]) == [30, 0, 90, 30]
+    assert ll.get_many([]) == []
+    with pytest.raises(IndexError):
+        ll.get_many([1, 10])
+
+
+def test_reverse_relinks_nodes():
+    ll = LinkedList([1, 2, 3])
+    first = ll._head
+    ll.reverse()
+    assert list(ll) == [3, 2, 1]
+    assert ll._tail is first
+    assert ll._tail.next is None
+    ll.append(0)
+    assert list(ll) == [3, 2, 1, 0]
+    for items in ([], [1]):
+        short = LinkedList(items)
+        short.reverse()
+        assert list(short) == items
+
+
+def test_rotate_matches_deque():
+    from collections import deque
+
+    for k in (-7, -3, -1, 0, 1, 2, 4, 5, 12):
+        ll, expected = LinkedList(range(5)), deque(range(5))
+        ll.rotate(k)
+        expected.rotate(k)
+        assert list(ll) == list(expected)
+        assert ll.tail() == expected[-1]
+        assert ll[-1] == expected[-1]
+    empty = LinkedList()
+    empty.rotate(3)
+    assert list(empty) == []
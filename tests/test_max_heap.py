@@ -134,3 +134,11 @@ def test_peek_does_not_remove_element():
     # But pop should remove it
     assert heap.pop() == 7
     assert len(heap) == 2
+
+
+def test_extend_and_pop_many():
+    heap = MaxHeap([3, 1])
+    heap.extend([4, 1, 5, 9, 2, 6])
+    assert heap.pop_many(3) == [9, 6, 5]
+    heap.extend([7])
+    assert heap.pop_many(len(heap)) == [7, 4, 3, 2, 1, 1]
@@ -135,3 +135,28 @@ def test_peek_does_not_remove_element():
     # But pop should remove it
     assert heap.pop() == 2
     assert len(heap) == 2
+
+
+def test_extend_small_batch_pushes_items():
+    heap = MinHeap([5, 3, 8, 1])
+    heap.extend([7, 0])
+    assert len(heap) == 6
+    assert heap.pop_many(6) == [0, 1, 3, 5, 7, 8]
+
+
+def test_extend_large_batch_rebuilds_heap():
+    heap = MinHeap([5])
+    heap.pop()
+    heap.push(4)
+    heap.extend([9, 2, 7, 1, 3])
+    assert len(heap) == 6
+    assert heap.pop_many(6) == [1, 2, 3, 4, 7, 9]
+
+
+def test_pop_many_invalid_count_raises():
+    heap = MinHeap([1, 2])
+    with pytest.raises(IndexError):
+        heap.pop_many(3)
+    with pytest.raises(ValueError):
+        heap.pop_many(-1)
+    assert heap.pop_many(0) == []
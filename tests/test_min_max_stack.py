@@ -0,0 +1,98 @@
+import pytest
+
+from py_ds.datastructures.stack import MaxStack, MinStack
+
+
+def test_min_stack_tracks_minimum():
+    s = MinStack([5, 3, 7])
+    assert s.min() == 3
+    s.push(1)
+    assert s.min() == 1
+    assert s.pop() == 1
+    assert s.min() == 3
+
+
+def test_min_stack_handles_duplicate_minimums():
+    s = MinStack([2, 1, 1])
+    assert s.pop() == 1
+    assert s.min() == 1
+    assert s.pop() == 1
+    assert s.min() == 2
+
+
+def test_max_stack_tracks_maximum():
+    s = MaxStack([1, 4, 2])
+    assert s.max() == 4
+    s.push(9)
+    assert s.max() == 9
+    s.pop()
+    s.pop()
+    assert s.max() == 4
+
+
+def test_max_stack_handles_duplicate_maximums():
+    s = MaxStack([3, 3])
+    s.pop()
+    assert s.max() == 3
+
+
+def test_extreme_on_empty_raises():
+    with pytest.raises(IndexError):
+        MinStack().min()
+    with pytest.raises(IndexError):
+        MaxStack().max()
+
+
+def test_only_new_extremes_are_recorded():
+    s = MinStack([1, 5, 6, 7, 8])
+    assert s._extremes == [1]
+
+
+def test_extend_and_clear_keep_tracking_consistent():
+    s = MinStack([4])
+    s.extend([6, 2, 8])
+    assert s.min() == 2
+    s.clear()
+    assert s.is_empty()
+    with pytest.raises(IndexError):
+        s.min()
+    s.push(10)
+    assert s.min() == 10
+
+
+def test_matches_rescan_on_random_workload():
+    import random
+
+    rng = random.Random(0)
+    lo, hi = MinStack[int](), MaxStack[int]()
+    reference: list[int] = []
+    for _ in range(2000):
+        if reference and rng.random() < 0.4:
+            reference.pop()
+            lo.pop()
+            hi.pop()
+        else:
+            value = rng.randint(0, 50)
+            reference.append(value)
+            lo.push(value)
+            hi.push(value)
+        if reference:
+            assert lo.min() == min(reference)
+            assert hi.max() == max(reference)
+
+
+def test_stack_behaviour_is_preserved():
+    s = MinStack([1, 2, 3])
+    assert list(s) == [3, 2, 1]
+    assert s.peek() == 3
+    assert len(s) == 3
+    assert repr(s) == 'MinStack([1, 2, 3])'
+
+
+def test_pop_many_keeps_tracking_consistent():
+    s = MinStack([5, 3, 4, 1, 2])
+    assert s.pop_many(3) == [2, 1, 4]
+    assert s.min() == 3
+    s = MaxStack([1, 9, 2, 9])
+    s.pop_many(2)
+    assert s.max() == 9
@@ -0,0 +1,55 @@
+from py_ds.datastructures.stack import MonotonicStack
+
+
+def test_increasing_stack_evicts_larger_items():
+    s = MonotonicStack[int]()
+    assert s.push(3) == []
+    assert s.push(5) == []
+    assert s.push(4) == [5]
+    assert s.push(1) == [4, 3]
+    assert list(s) == [1]
+
+
+def test_non_strict_keeps_equal_items():
+    s = MonotonicStack([2, 2])
+    assert s.push(2) == []
+    assert len(s) == 3
+
+
+def test_strict_evicts_equal_items():
+    s = MonotonicStack([2, 2], strict=True)
+    assert list(s) == [2]
+    assert s.push(2) == [2]
+
+
+def test_decreasing_stack_next_greater_element():
+    values = [2, 1, 5, 3, 4]
+    next_greater = {}
+    s = MonotonicStack[int](increasing=False)
+    for value in values:
+        for smaller in s.push(value):
+            next_greater[smaller] = value
+    assert next_greater == {1: 5, 2: 5, 3: 4}
+    assert list(s) == [4, 5]
+
+
+def test_init_items_are_pushed_in_order():
+    s = MonotonicStack([1, 3, 2, 4])
+    assert list(s) == [4, 2, 1]
+
+
+def test_pop_and_peek():
+    s = MonotonicStack([1, 2, 3])
+    assert s.peek() == 3
+    assert s.pop() == 3
+    assert len(s) == 2
+
+
+def test_repr():
+    assert repr(MonotonicStack([1, 2])) == 'MonotonicStack([1, 2])'
+
+
+def test_extend_keeps_stack_monotonic():
+    s = MonotonicStack([1, 5])
+    s.extend([3, 4, 2])
+    assert list(s) == [2, 1]
@@ -0,0 +1,120 @@
+import pytest
+
+from py_ds.datastructures.linked_lists import DoublyLinkedList, NodeHandle
+
+
+def test_append_prepend_insert_return_handles_on_request():
+    dll = DoublyLinkedList([2])
+    assert dll.append(3) is None
+    last = dll.append(4, handle=True)
+    first = dll.prepend(1, handle=True)
+    middle = dll.insert(2, 9, handle=True)
+    assert isinstance(last, NodeHandle)
+    assert (first.value, middle.value, last.value) == (1, 9, 4)
+    assert list(dll) == [1, 2, 9, 3, 4]
+
+
+def test_remove_node():
+    dll = DoublyLinkedList()
+    handles = [dll.append(i, handle=True) for i in range(5)]
+    assert dll.remove_node(handles[2]) == 2
+    assert dll.remove_node(handles[0]) == 0
+    assert dll.remove_node(handles[4]) == 4
+    assert list(dll) == [1, 3]
+    assert list(dll.reverse_iter()) == [3, 1]
+    assert dll.head() == 1
+    assert dll.tail() == 3
+    assert len(dll) == 2
+
+
+def test_insert_after_and_before():
+    dll = DoublyLinkedList()
+    h = dll.append(2, handle=True)
+    after = dll.insert_after(h, 3)
+    before = dll.insert_before(h, 1)
+    dll.insert_after(after, 4)
+    dll.insert_before(before, 0)
+    assert list(dll) == [0, 1, 2, 3, 4]
+    assert list(dll.reverse_iter()) == [4, 3, 2, 1, 0]
+    assert dll.head() == 0
+    assert dll.tail() == 4
+
+
+def test_move_to_front_and_end():
+    dll = DoublyLinkedList()
+    handles = [dll.append(i, handle=True) for i in range(4)]
+    dll.move_to_front(handles[2])
+    assert list(dll) == [2, 0, 1, 3]
+    dll.move_to_end(handles[0])
+    assert list(dll) == [2, 1, 3, 0]
+    dll.move_to_front(handles[2])
+    dll.move_to_end(handles[0])
+    assert list(dll) == [2, 1, 3, 0]
+    assert list(dll.reverse_iter()) == [0, 3, 1, 2]
+    assert handles[0].alive
+    assert handles[0].value == 0
+
+
+def test_handle_value_can_be_set():
+    dll = DoublyLinkedList([1])
+    h = dll.append(2, handle=True)
+    h.value = 20
+    assert list(dll) == [1, 20]
+    assert repr(h) == 'NodeHandle(value=20)'
+
+
+def test_removed_handle_is_stale():
+    dll = DoublyLinkedList()
+    a = dll.append('a', handle=True)
+    b = dll.append('b', handle=True)
+    dll.remove_node(a)
+    assert not a.alive
+    assert repr(a) == 'NodeHandle(value=STALE)'
+    with pytest.raises(ValueError):
+        dll.remove_node(a)
+    with pytest.raises(ValueError):
+        _ = a.value
+    dll.pop()
+    assert not b.alive
+    with pytest.raises(ValueError):
+        dll.insert_after(b, 'c')
+
+
+def test_handles_survive_other_changes():
+    dll = DoublyLinkedList([1, 2, 3])
+    h = dll.insert(1, 10, handle=True)
+    dll.pop(0)
+    dll.append(4)
+    dll.sort()
+    assert h.alive
+    assert dll.remove_node(h) == 10
+    assert list(dll) == [2, 3, 4]
+
+
+def test_clear_split_and_concat_make_handles_stale():
+    dll = DoublyLinkedList([1, 2])
+    h = dll.append(3, handle=True)
+    dll.clear()
+    assert not h.alive
+
+    dll = DoublyLinkedList([1, 2])
+    h = dll.append(3, handle=True)
+    rest = dll.split_at(1)
+    assert not h.alive
+    assert list(rest) == [2, 3]
+
+    other = DoublyLinkedList([0])
+    h = rest.append(4, handle=True)
+    other.concat(rest)
+    assert not h.alive
+    assert list(other) == [0, 2, 3, 4]
+
+
+def test_handle_from_another_list_is_rejected():
+    a = DoublyLinkedList()
+    b = DoublyLinkedList([1])
+    h = a.append(1, handle=True)
+    with pytest.raises(ValueError):
+        b.remove_node(h)
+    with pytest.raises(ValueError):
+        b.move_to_front(h)
@@ -0,0 +1,48 @@
+import pytest
+
+from py_ds.datastructures.linked_lists.doubly_linked import _DoublyNode
+from py_ds.datastructures.node_pool import NodePool
+
+
+def test_acquire_allocates_when_empty():
+    pool = NodePool(_DoublyNode, 4)
+    node = pool.acquire(1)
+    assert node.value == 1
+    assert node.next is None and node.prev is None
+    assert (pool.hits, pool.misses) == (0, 1)
+
+
+def test_release_clears_fields_and_recycles():
+    pool = NodePool(_DoublyNode, 4)
+    a, b = pool.acquire(1), pool.acquire(2)
+    a.next, b.prev = b, a
+    pool.release(a)
+    assert len(pool) == 1
+    assert a.value is None and a.next is None
+    assert pool.acquire(3) is a
+    assert a.value == 3
+    assert pool.hits == 1
+
+
+def test_release_beyond_max_size_is_dropped():
+    pool = NodePool(_DoublyNode, 1)
+    pool.release(_DoublyNode(1))
+    pool.release(_DoublyNode(2))
+    assert len(pool) == 1
+
+
+def test_clear_resets_pool():
+    pool = NodePool(_DoublyNode, 2)
+    pool.release(pool.acquire(1))
+    pool.clear()
+    assert len(pool) == 0
+    assert (pool.hits, pool.misses) == (0, 0)
+
+
+def test_negative_max_size_raises():
+    with pytest.raises(ValueError):
+        NodePool(_DoublyNode, -1)
+
+
+def test_repr():
+    assert repr(NodePool(_DoublyNode, 8)) == 'NodePool(_DoublyNode, size=0, max_size=8, hits=0, misses=0)'
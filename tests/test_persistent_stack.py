@@ -0,0 +1,92 @@
+import copy
+import pickle
+
+import pytest
+
+from py_ds.datastructures.persistent_stack import PersistentStack
+
+
+def test_empty_stack_initial_state():
+    s: PersistentStack[int] = PersistentStack()
+    assert s.is_empty() is True
+    assert len(s) == 0
+    assert bool(s) is False
+    assert list(s) == []
+
+
+def test_init_with_items():
+    s = PersistentStack([1, 2, 3])
+    assert len(s) == 3
+    assert s.peek() == 3
+    assert list(s) == [3, 2, 1]
+
+
+def test_push_returns_new_version():
+    s0: PersistentStack[int] = PersistentStack()
+    s1 = s0.push(1)
+    s2 = s1.push(2)
+    assert list(s0) == []
+    assert list(s1) == [1]
+    assert list(s2) == [2, 1]
+    assert len(s2) == 2
+
+
+def test_pop_returns_new_version():
+    s = PersistentStack([1, 2, 3])
+    popped = s.pop()
+    assert list(popped) == [2, 1]
+    assert list(s) == [3, 2, 1]
+
+
+def test_pop_and_peek_on_empty_raise():
+    s: PersistentStack[int] = PersistentStack()
+    with pytest.raises(IndexError):
+        s.pop()
+    with pytest.raises(IndexError):
+        s.peek()
+
+
+def test_branches_share_common_frames():
+    base = PersistentStack([1, 2, 3])
+    left = base.push(10)
+    right = base.push(20)
+    assert left.pop()._top is right.pop()._top is base._top
+    assert list(left) == [10, 3, 2, 1]
+    assert list(right) == [20, 3, 2, 1]
+
+
+def test_backtracking_keeps_snapshots_intact():
+    snapshots = []
+    s: PersistentStack[int] = PersistentStack()
+    for i in range(5):
+        s = s.push(i)
+        snapshots.append(s)
+    for depth, snap in enumerate(snapshots, start=1):
+        assert len(snap) == depth
+        assert snap.peek() == depth - 1
+
+
+def test_equality():
+    a = PersistentStack([1, 2, 3])
+    assert a == PersistentStack([1, 2, 3])
+    assert a == a.push(4).pop()
+    assert a != PersistentStack([1, 2])
+    assert a != PersistentStack([1, 2, 4])
+    assert a != [3, 2, 1]
+
+
+def test_bool_truthiness():
+    assert bool(PersistentStack()) is False
+    assert bool(PersistentStack([1])) is True
+
+
+def test_repr_contains_items():
+    assert repr(PersistentStack([1, 2, 3])) == 'PersistentStack([1, 2, 3])'
+
+
+def test_deep_stacks_pickle_and_copy():
+    s = PersistentStack(range(200_000))
+    restored = pickle.loads(pickle.dumps(s))
+    assert restored == s
+    assert restored.peek() == 199_999
+    assert copy.deepcopy(s) == s
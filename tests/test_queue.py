@@ -83,3 +83,32 @@ def test_bool_truthiness():
 def test_repr():
     q = Queue([1, 2, 3])
     assert repr(q) == 'Queue([1, 2, 3])'
+
+
+def test_dequeue_many_returns_items_in_fifo_order():
+    q = Queue([1, 2, 3, 4])
+    assert q.dequeue_many(3) == [1, 2, 3]
+    assert list(q) == [4]
+    assert q.dequeue_many(1) == [4]
+    assert q.is_empty()
+    q.enqueue(5)
+    assert list(q) == [5]
+
+
+def test_dequeue_many_invalid_count_raises():
+    q = Queue([1, 2])
+    with pytest.raises(IndexError):
+        q.dequeue_many(3)
+    with pytest.raises(ValueError):
+        q.dequeue_many(-1)
+    assert q.dequeue_many(0) == []
+    assert len(q) == 2
+
+
+def test_pool_recycles_dequeued_nodes():
+    q = Queue(pool_size=4)
+    for i in range(100):
+        q.enqueue(i)
+        assert q.dequeue() == i
+    assert q.pool.misses == 1
+    assert q.pool.hits == 99
@@ -0,0 +1,129 @@
+import bisect
+import random
+
+import pytest
+
+from py_ds.datastructures.linked_lists.skip_list import SkipList
+
+
+def test_empty_list_initial_state():
+    sl: SkipList[int] = SkipList()
+    assert len(sl) == 0
+    assert bool(sl) is False
+    assert list(sl) == []
+    assert 1 not in sl
+
+
+def test_init_sorts_items():
+    sl = SkipList([5, 1, 4, 2, 3], seed=1)
+    assert list(sl) == [1, 2, 3, 4, 5]
+    assert len(sl) == 5
+
+
+def test_invalid_parameters_raise():
+    with pytest.raises(ValueError):
+        SkipList(max_level=0)
+    with pytest.raises(ValueError):
+        SkipList(p=1.0)
+
+
+def test_contains():
+    sl = SkipList(range(0, 100, 2), seed=2)
+    assert 42 in sl
+    assert 43 not in sl
+    assert -1 not in sl
+    assert 100 not in sl
+
+
+def test_duplicates_are_kept():
+    sl = SkipList([3, 1, 3, 2, 3], seed=3)
+    assert list(sl) == [1, 2, 3, 3, 3]
+    sl.remove(3)
+    assert list(sl) == [1, 2, 3, 3]
+    assert sl.find(3) == 2
+
+
+def test_remove_missing_raises():
+    sl = SkipList([1, 2], seed=4)
+    with pytest.raises(ValueError):
+        sl.remove(3)
+    with pytest.raises(ValueError):
+        SkipList().remove(1)
+
+
+def test_rank_and_find():
+    sl = SkipList([10, 20, 30, 40], seed=5)
+    assert sl.rank(5) == 0
+    assert sl.rank(20) == 1
+    assert sl.rank(25) == 2
+    assert sl.rank(50) == 4
+    assert sl.find(30) == 2
+    with pytest.raises(ValueError):
+        sl.find(25)
+    with pytest.raises(ValueError):
+        sl.find(50)
+
+
+def test_indexing():
+    sl = SkipList(range(100), seed=6)
+    assert [sl[i] for i in range(100)] == list(range(100))
+    assert sl[-1] == 99
+    assert sl[-100] == 0
+    with pytest.raises(IndexError):
+        sl[100]
+    with pytest.raises(IndexError):
+        SkipList()[0]
+
+
+def test_pop():
+    sl = SkipList(range(10), seed=7)
+    assert sl.pop() == 9
+    assert sl.pop(0) == 0
+    assert sl.pop(3) == 4
+    assert list(sl) == [1, 2, 3, 5, 6, 7, 8]
+    with pytest.raises(IndexError):
+        sl.pop(7)
+
+
+def test_iter_range():
+    sl = SkipList(range(0, 20, 2), seed=8)
+    assert list(sl.iter_range(5, 11)) == [6, 8, 10]
+    assert list(sl.iter_range(stop=4)) == [0, 2]
+    assert list(sl.iter_range(start=15)) == [16, 18]
+    assert list(sl.iter_range(7, 7)) == []
+
+
+def test_clear():
+    sl = SkipList(range(10), seed=9)
+    sl.clear()
+    assert list(sl) == []
+    sl.insert(1)
+    assert list(sl) == [1]
+
+
+def test_random_operations_match_sorted_list():
+    rng = random.Random(10)
+    sl: SkipList[int] = SkipList(seed=11)
+    ref: list[int] = []
+    for _ in range(3000):
+        op = rng.randrange(4)
+        value = rng.randrange(200)
+        if op <= 1 or not ref:
+            sl.insert(value)
+            bisect.insort_right(ref, value)
+        elif op == 2:
+            if value in ref:
+                sl.remove(value)
+                ref.remove(value)
+            else:
+                assert value not in sl
+        else:
+            index = rng.randrange(len(ref))
+            assert sl.pop(index) == ref.pop(index)
+        assert sl.rank(value) == bisect.bisect_left(ref, value)
+    assert list(sl) == ref
+    assert [sl[i] for i in range(len(ref))] == ref
+
+
+def test_repr():
+    assert repr(SkipList([2, 1], seed=12)) == 'SkipList([1, 2])'
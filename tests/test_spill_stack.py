@@ -0,0 +1,145 @@
+import json
+import marshal
+
+import pytest
+
+from py_ds.datastructures.spill_stack import SpillStack
+
+
+class JsonCodec:
+    @staticmethod
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+def test_empty_stack_initial_state():
+    s = SpillStack[int]()
+    assert s.is_empty() is True
+    assert len(s) == 0
+    assert bool(s) is False
+    assert s.spilled == 0
+
+
+def test_invalid_limits_raise():
+    with pytest.raises(ValueError):
+        SpillStack(memory_limit=0)
+    with pytest.raises(ValueError):
+        SpillStack(memory_limit=4, chunk_size=5)
+    with pytest.raises(ValueError):
+        SpillStack(memory_limit=4, chunk_size=0)
+
+
+def test_pushes_beyond_limit_spill_oldest_items(tmp_path):
+    s = SpillStack(range(10), memory_limit=4, chunk_size=2, directory=str(tmp_path))
+    assert len(s) == 10
+    assert len(s._items) <= 4
+    assert s.spilled == 10 - len(s._items)
+    assert s.peek() == 9
+
+
+def test_pop_pages_chunks_back_in_lifo_order(tmp_path):
+    s = SpillStack(range(100), memory_limit=8, chunk_size=3, directory=str(tmp_path))
+    assert [s.pop() for _ in range(100)] == list(range(99, -1, -1))
+    assert s.is_empty()
+    with pytest.raises(IndexError):
+        s.pop()
+
+
+def test_peek_pages_in_when_memory_is_empty():
+    s = SpillStack(range(6), memory_limit=2, chunk_size=2)
+    while s._items:
+        s._items.pop()
+    assert s.peek() == s.pop()
+
+
+def test_interleaved_push_pop_matches_list():
+    import random
+
+    rng = random.Random(1)
+    s = SpillStack[int](memory_limit=16, chunk_size=5)
+    reference: list[int] = []
+    for i in range(3000):
+        if reference and rng.random() < 0.45:
+            assert s.pop() == reference.pop()
+        else:
+            s.push(i)
+            reference.append(i)
+        assert len(s) == len(reference)
+    assert list(s) == reference[::-1]
+
+
+def test_iteration_reads_spilled_chunks_without_paging_in():
+    s = SpillStack(range(20), memory_limit=5, chunk_size=3)
+    spilled = s.spilled
+    assert list(s) == list(range(19, -1, -1))
+    assert s.spilled == spilled
+
+
+@pytest.mark.parametrize('codec', [marshal, JsonCodec])
+def test_pluggable_codecs(codec):
+    s = SpillStack([[1, 2], [3]] * 10, memory_limit=3, chunk_size=2, codec=codec)
+    assert [s.pop() for _ in range(20)] == [[3], [1, 2]] * 10
+
+
+def test_clear_empties_memory_and_disk():
+    s = SpillStack(range(50), memory_limit=4)
+    s.clear()
+    assert s.is_empty()
+    assert len(s) == 0
+    s.extend(range(10))
+    assert [s.pop() for _ in range(10)] == list(range(9, -1, -1))
+
+
+def test_context_manager_closes_file():
+    with SpillStack(range(10), memory_limit=2) as s:
+        backing = s._file
+        assert s.pop() == 9
+    assert backing.closed
+    assert s.is_empty()
+
+
+def test_views_are_not_supported():
+    with pytest.raises(TypeError):
+        SpillStack().view()
+
+
+def test_repr():
+    s = SpillStack(range(10), memory_limit=4, chunk_size=4)
+    assert repr(s) == 'SpillStack(in_memory=2, spilled=8)'
+
+
+def test_extend_spills_overflow_in_chunks():
+    s = SpillStack(memory_limit=4, chunk_size=2)
+    s.extend(range(11))
+    assert len(s._items) <= 4
+    assert len(s) == 11
+    assert list(s) == list(range(10, -1, -1))
+
+
+def test_extend_from_generator_keeps_memory_bounded():
+    peaks = []
+
+    class Recording(SpillStack):
+        def _spill(self):
+            peaks.append(len(self._items))
+            super()._spill()
+
+    s = Recording((i for i in range(5000)), memory_limit=100, chunk_size=30)
+    s.extend(i for i in range(5000, 10_000))
+    assert max(peaks) <= 100 + 30
+    assert len(s._items) <= 100
+    assert len(s) == 10_000
+    assert s.pop_many(3) == [9999, 9998, 9997]
+
+
+def test_pop_many_pages_in_across_chunks():
+    s = SpillStack(range(20), memory_limit=4, chunk_size=3)
+    assert s.pop_many(15) == list(range(19, 4, -1))
+    assert len(s) == 5
+    with pytest.raises(IndexError):
+        s.pop_many(6)
+    assert s.pop_many(5) == [4, 3, 2, 1, 0]
@@ -0,0 +1,121 @@
+import threading
+
+import pytest
+
+from py_ds.datastructures.spsc_queue import SPSCQueue
+
+
+def test_empty_queue_initial_state():
+    q: SPSCQueue[int] = SPSCQueue(4)
+    assert q.is_empty() is True
+    assert q.is_full() is False
+    assert len(q) == 0
+    assert bool(q) is False
+
+
+def test_capacity_rounds_up_to_power_of_two():
+    assert SPSCQueue(1).capacity == 1
+    assert SPSCQueue(5).capacity == 8
+    assert SPSCQueue(8).capacity == 8
+
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        SPSCQueue(0)
+
+
+def test_init_with_items():
+    q = SPSCQueue(4, [1, 2, 3])
+    assert len(q) == 3
+    assert q.peek() == 1
+    with pytest.raises(ValueError):
+        SPSCQueue(2, [1, 2, 3])
+
+
+def test_push_pop_fifo_order():
+    q: SPSCQueue[int] = SPSCQueue(4)
+    assert q.push(1) is True
+    assert q.push(2) is True
+    assert q.pop() == 1
+    assert q.pop() == 2
+    assert q.is_empty()
+
+
+def test_push_on_full_returns_false():
+    q: SPSCQueue[int] = SPSCQueue(2)
+    assert q.push(1)
+    assert q.push(2)
+    assert q.is_full()
+    assert q.push(3) is False
+    assert len(q) == 2
+
+
+def test_pop_and_peek_on_empty_raise():
+    q: SPSCQueue[int] = SPSCQueue(2)
+    with pytest.raises(IndexError):
+        q.pop()
+    with pytest.raises(IndexError):
+        q.peek()
+
+
+def test_wraps_around_the_ring():
+    q: SPSCQueue[int] = SPSCQueue(16)
+    out = []
+    for i in range(20):
+        q.push(i)
+        if i % 2:
+            out.append(q.pop())
+    out.extend(q.pop_many(10))
+    assert out == list(range(20))
+
+
+def test_push_many_partial_and_wrapping():
+    q: SPSCQueue[int] = SPSCQueue(4)
+    q.push_many([0, 1, 2])
+    assert q.pop_many(2) == [0, 1]
+    assert q.push_many([3, 4, 5, 6, 7]) == 3
+    assert q.is_full()
+    assert q.pop_many(10) == [2, 3, 4, 5]
+    assert q.push_many([]) == 0
+
+
+def test_pop_many_on_empty_and_negative():
+    q: SPSCQueue[int] = SPSCQueue(4)
+    assert q.pop_many(3) == []
+    with pytest.raises(ValueError):
+        q.pop_many(-1)
+
+
+def test_popped_slots_are_released():
+    q: SPSCQueue[object] = SPSCQueue(4)
+    q.push_many([object(), object()])
+    q.pop()
+    q.pop_many(1)
+    assert q._buffer == [None] * 4
+
+
+def test_repr():
+    q = SPSCQueue(4, [1, 2])
+    assert repr(q) == 'SPSCQueue(capacity=4, items=[1, 2])'
+
+
+def test_threaded_producer_consumer_preserves_order():
+    n = 20_000
+    q: SPSCQueue[int] = SPSCQueue(256)
+    received: list[int] = []
+
+    def produce():
+        i = 0
+        while i < n:
+            i += q.push_many(range(i, min(i + 64, n)))
+
+    def consume():
+        while len(received) < n:
+            received.extend(q.pop_many(64))
+
+    threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=30)
+    assert received == list(range(n))
@@ -81,3 +81,25 @@ def test_bool_truthiness():
 def test_repr_contains_items():
     s = Stack([1, 2, 3])
     assert repr(s) == 'Stack([1, 2, 3])'
+
+
+def test_pop_many_returns_items_in_pop_order():
+    s = Stack([1, 2, 3, 4])
+    assert s.pop_many(3) == [4, 3, 2]
+    assert list(s) == [1]
+    assert s.pop_many(0) == []
+
+
+def test_pop_many_invalid_count_raises():
+    s = Stack([1, 2])
+    with pytest.raises(IndexError):
+        s.pop_many(3)
+    with pytest.raises(ValueError):
+        s.pop_many(-1)
+    assert len(s) == 2
+
+
+def test_extend_accepts_generators():
+    s = Stack[int]()
+    s.extend(x * 2 for x in range(3))
+    assert list(s) == [4, 2, 0]
@@ -0,0 +1,121 @@
+import struct
+from array import array
+
+import pytest
+
+from py_ds.datastructures.stack import TypedStack
+
+
+def test_empty_stack_initial_state():
+    s = TypedStack('q')
+    assert s.is_empty() is True
+    assert len(s) == 0
+    assert s.typecode == 'q'
+
+
+def test_invalid_typecode_raises():
+    with pytest.raises(ValueError):
+        TypedStack('z')
+
+
+def test_push_pop_peek():
+    s = TypedStack('d', [1.5, 2.5])
+    s.push(3.5)
+    assert s.peek() == 3.5
+    assert s.pop() == 3.5
+    assert list(s) == [2.5, 1.5]
+
+
+def test_pop_on_empty_raises():
+    with pytest.raises(IndexError):
+        TypedStack('i').pop()
+
+
+def test_values_are_checked_against_typecode():
+    s = TypedStack('b')
+    with pytest.raises(OverflowError):
+        s.push(1000)
+    with pytest.raises(TypeError):
+        s.push('x')
+
+
+def test_push_many_from_iterable():
+    s = TypedStack('i')
+    s.push_many(x * x for x in range(4))
+    assert list(s) == [9, 4, 1, 0]
+
+
+def test_push_many_from_matching_buffer():
+    s = TypedStack('q', [1])
+    s.push_many(array('q', [2, 3]))
+    s.push_many(memoryview(array('q', [4])))
+    assert list(s) == [4, 3, 2, 1]
+
+
+def test_push_many_from_mismatched_buffer_converts_items():
+    s = TypedStack('q')
+    s.push_many(bytes([1, 2, 3]))
+    s.push_many(array('i', [4]))
+    assert list(s) == [4, 3, 2, 1]
+
+
+@pytest.mark.skipif(struct.calcsize('l') != 8, reason='needs an 8-byte C long')
+def test_push_many_copies_buffers_of_same_kind_and_size():
+    s = TypedStack('q', [1])
+    # An int64 NumPy array reports format 'l' on LP64 platforms.
+    as_long = memoryview(array('q', [2, 3])).cast('B').cast('l')
+    assert s._matches_buffer(as_long)
+    s.push_many(as_long)
+    assert list(s) == [3, 2, 1]
+    assert not s._matches_buffer(memoryview(array('Q', [1])))
+    assert not s._matches_buffer(memoryview(array('d', [1.0])))
+
+
+def test_rejected_push_many_does_not_modify_the_stack():
+    s = TypedStack('q', [1])
+    view = s.view()
+    with pytest.raises(TypeError):
+        s.push_many([2, 'x'])
+    with pytest.raises(OverflowError):
+        s.push_many(array('Q', [2**64 - 1]))
+    assert list(s) == [1]
+    assert view[0] == 1
+
+
+def test_pop_many_returns_array_in_pop_order():
+    s = TypedStack('i', range(5))
+    popped = s.pop_many(3)
+    assert popped == array('i', [4, 3, 2])
+    assert list(s) == [1, 0]
+    assert s.pop_many(0) == array('i')
+
+
+def test_pop_many_invalid_count_raises():
+    s = TypedStack('i', [1, 2])
+    with pytest.raises(IndexError):
+        s.pop_many(3)
+    with pytest.raises(ValueError):
+        s.pop_many(-1)
+    assert len(s) == 2
+
+
+def test_to_memoryview_is_zero_copy():
+    s = TypedStack('i', [1, 2, 3])
+    with s.to_memoryview() as view:
+        assert view.tolist() == [1, 2, 3]
+        view[0] = 10
+        with pytest.raises(BufferError):
+            s.push(4)
+    s.push(4)
+    assert list(s) == [4, 3, 2, 10]
+
+
+def test_clear_keeps_typecode():
+    s = TypedStack('d', [1.0])
+    s.clear()
+    assert s.is_empty()
+    assert s.typecode == 'd'
+
+
+def test_repr():
+    assert repr(TypedStack('i', [1, 2])) == "TypedStack('i', [1, 2])"
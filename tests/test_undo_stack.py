@@ -0,0 +1,106 @@
+import pytest
+
+from py_ds.datastructures.stack import UndoStack
+
+
+def test_checkpoints_are_unique():
+    log = UndoStack([1, 2])
+    assert log.checkpoint() != log.checkpoint()
+
+
+def test_rollback_removes_items_since_checkpoint():
+    log = UndoStack(['a'])
+    mark = log.checkpoint()
+    log.extend(['b', 'c'])
+    assert log.rollback(mark) == ['c', 'b']
+    assert list(log) == ['a']
+
+
+def test_nested_checkpoints():
+    log = UndoStack[str]()
+    outer = log.checkpoint()
+    log.push('a')
+    inner = log.checkpoint()
+    log.extend(['b', 'c'])
+    assert log.rollback(inner) == ['c', 'b']
+    log.push('d')
+    assert log.rollback(outer) == ['d', 'a']
+    assert log.is_empty()
+
+
+def test_rollback_to_current_height_is_noop():
+    log = UndoStack([1])
+    assert log.rollback(log.checkpoint()) == []
+    assert len(log) == 1
+
+
+def test_rollback_calls_undo_once_in_bulk():
+    calls = []
+    log = UndoStack([1])
+    mark = log.checkpoint()
+    log.extend([2, 3, 4])
+    log.rollback(mark, undo=calls.append)
+    assert calls == [[4, 3, 2]]
+
+
+def test_invalid_mark_raises():
+    log = UndoStack([1, 2, 3])
+    mark = log.checkpoint()
+    log.pop()
+    with pytest.raises(ValueError):
+        log.rollback(mark)
+    with pytest.raises(ValueError):
+        log.rollback(-1)
+    with pytest.raises(ValueError):
+        log.rollback(99)
+
+
+def test_rollback_invalidates_later_marks():
+    log = UndoStack[str]()
+    outer = log.checkpoint()
+    log.push('a')
+    inner = log.checkpoint()
+    assert log.rollback(outer) == ['a']
+    log.extend('xy')
+    with pytest.raises(ValueError):
+        log.rollback(inner)
+    assert list(log) == ['y', 'x']
+    assert log.rollback(outer) == ['y', 'x']
+    assert log.rollback(outer) == []
+
+
+def test_clear_then_regrow_invalidates_marks():
+    log = UndoStack([1, 2])
+    mark = log.checkpoint()
+    log.clear()
+    log.extend([7, 8, 9])
+    with pytest.raises(ValueError):
+        log.rollback(mark)
+    assert list(log) == [9, 8, 7]
+    assert log._marks == []
+
+
+def test_pop_then_regrow_invalidates_marks():
+    log = UndoStack([1])
+    keep = log.checkpoint()
+    log.push(2)
+    mark = log.checkpoint()
+    log.pop()
+    log.push(5)
+    with pytest.raises(ValueError):
+        log.rollback(mark)
+    log.push(6)
+    assert log.pop_many(2) == [6, 5]
+    log.push(4)
+    assert log.rollback(keep) == [4]
+    assert list(log) == [1]
+
+
+def test_rollback_invalidates_views():
+    log = UndoStack([1, 2])
+    mark = log.checkpoint()
+    log.push(3)
+    view = log.view()
+    log.rollback(mark)
+    with pytest.raises(RuntimeError):
+        view[0]
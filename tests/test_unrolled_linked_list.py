@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from py_ds.datastructures.linked_lists.unrolled import UnrolledLinkedList
+
+
+def chunk_sizes(ll: UnrolledLinkedList) -> list[int]:
+    sizes, chunk = [], ll._head
+    while chunk:
+        sizes.append(len(chunk.items))
+        chunk = chunk.next
+    return sizes
+
+
+def test_empty_list_initial_state():
+    ll: UnrolledLinkedList[int] = UnrolledLinkedList()
+    assert len(ll) == 0
+    assert bool(ll) is False
+    assert list(ll) == []
+    assert ll.head() is None
+    assert ll.tail() is None
+
+
+def test_init_fills_whole_chunks():
+    ll = UnrolledLinkedList(range(10), chunk_size=4)
+    assert list(ll) == list(range(10))
+    assert chunk_sizes(ll) == [4, 4, 2]
+    assert ll.head() == 0
+    assert ll.tail() == 9
+
+
+def test_invalid_chunk_size_raises():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(chunk_size=0)
+
+
+def test_append_prepend_and_extend():
+    ll = UnrolledLinkedList([3], chunk_size=2)
+    ll.append(4)
+    ll.append(5)
+    ll.prepend(2)
+    ll.prepend(1)
+    ll.extend([6, 7, 8])
+    assert list(ll) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert all(size <= 2 for size in chunk_sizes(ll))
+
+
+def test_insert_splits_full_chunk():
+    ll = UnrolledLinkedList(range(4), chunk_size=4)
+    ll.insert(3, 'x')
+    assert list(ll) == [0, 1, 2, 'x', 3]
+    assert chunk_sizes(ll) == [2, 3]
+    ll.insert(0, 'a')
+    ll.insert(-1, 'b')
+    ll.insert(len(ll), 'c')
+    assert list(ll) == ['a', 0, 1, 2, 'x', 3, 'b', 'c']
+
+
+def test_insert_out_of_bounds_raises():
+    ll = UnrolledLinkedList([1, 2])
+    with pytest.raises(IndexError):
+        ll.insert(3, 0)
+    with pytest.raises(IndexError):
+        ll.insert(-4, 0)
+
+
+def test_remove_merges_and_unlinks_chunks():
+    ll = UnrolledLinkedList(range(8), chunk_size=4)
+    ll.remove(1)
+    ll.remove(2)
+    assert chunk_sizes(ll) == [2, 4]
+    ll.remove(0)
+    assert chunk_sizes(ll) == [1, 4]
+    for value in (3, 4, 5, 6, 7):
+        ll.remove(value)
+    assert list(ll) == []
+    assert ll._head is None and ll._tail is None
+    with pytest.raises(ValueError):
+        ll.remove(1)
+
+
+def test_pop():
+    ll = UnrolledLinkedList(range(10), chunk_size=3)
+    assert ll.pop() == 9
+    assert ll.pop(0) == 0
+    assert ll.pop(4) == 5
+    assert list(ll) == [1, 2, 3, 4, 6, 7, 8]
+    assert ll.tail() == 8
+    with pytest.raises(IndexError):
+        ll.pop(7)
+    with pytest.raises(IndexError):
+        UnrolledLinkedList().pop()
+
+
+def test_indexing_and_setitem():
+    ll = UnrolledLinkedList(range(20), chunk_size=3)
+    assert [ll[i] for i in range(20)] == list(range(20))
+    assert ll[-1] == 19
+    ll[10] = 'x'
+    ll[-1] = 'y'
+    assert ll[10] == 'x'
+    assert ll.tail() == 'y'
+    with pytest.raises(IndexError):
+        ll[20]
+    with pytest.raises(IndexError):
+        UnrolledLinkedList()[0]
+
+
+def test_find():
+    ll = UnrolledLinkedList([5, 6, 7, 6], chunk_size=2)
+    assert ll.find(7) == 2
+    assert ll.find(6) == 1
+    with pytest.raises(ValueError):
+        ll.find(8)
+
+
+def test_random_operations_match_list():
+    rng = random.Random(7)
+    ll: UnrolledLinkedList[int] = UnrolledLinkedList(chunk_size=5)
+    ref: list[int] = []
+    for i in range(2000):
+        op = rng.randrange(5)
+        if op == 0 or not ref:
+            index = rng.randint(0, len(ref))
+            ll.insert(index, i)
+            ref.insert(index, i)
+        elif op == 1:
+            ll.append(i)
+            ref.append(i)
+        elif op == 2:
+            index = rng.randrange(len(ref))
+            assert ll.pop(index) == ref.pop(index)
+        elif op == 3:
+            value = rng.choice(ref)
+            ll.remove(value)
+            ref.remove(value)
+        else:
+            assert ll.pop() == ref.pop()
+    assert list(ll) == ref
+    assert len(ll) == len(ref)
+    assert all(0 < size <= 5 for size in chunk_sizes(ll))
+
+
+def test_repr_and_str():
+    ll = UnrolledLinkedList([1, 2, 3], chunk_size=2)
+    assert repr(ll) == 'UnrolledLinkedList([1, 2, 3])'
+    assert str(ll) == 'HEAD → [1, 2] → [3] → TAIL'
+    assert str(UnrolledLinkedList()) == 'HEAD → TAIL'
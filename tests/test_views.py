@@ -0,0 +1,111 @@
+import pytest
+
+from py_ds.datastructures.queue import Queue
+from py_ds.datastructures.stack import MinStack, MonotonicStack, Stack, TypedStack
+from py_ds.datastructures.views import QueueView, StackView
+
+
+def test_stack_view_is_indexed_from_the_top():
+    view = Stack([1, 2, 3]).view()
+    assert isinstance(view, StackView)
+    assert len(view) == 3
+    assert view[0] == 3
+    assert view[-1] == 1
+    assert list(view) == [3, 2, 1]
+
+
+def test_stack_view_slicing_returns_view():
+    view = Stack([1, 2, 3, 4, 5]).view()
+    sub = view[1:4]
+    assert isinstance(sub, StackView)
+    assert list(sub) == [4, 3, 2]
+    assert list(sub[::2]) == [4, 2]
+    assert list(view[::-1]) == [1, 2, 3, 4, 5]
+
+
+def test_view_index_out_of_range_raises():
+    view = Stack([1]).view()
+    with pytest.raises(IndexError):
+        view[1]
+    with pytest.raises(IndexError):
+        Stack().view()[0]
+
+
+def test_stack_view_fails_fast_after_modification():
+    s = Stack([1, 2, 3])
+    view = s.view()
+    sub = view[:2]
+    s.push(4)
+    with pytest.raises(RuntimeError):
+        len(view)
+    with pytest.raises(RuntimeError):
+        sub[0]
+    with pytest.raises(RuntimeError):
+        list(view)
+
+
+def test_stack_view_fails_fast_during_iteration():
+    s = Stack([1, 2, 3])
+    it = iter(s.view())
+    next(it)
+    s.pop()
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+@pytest.mark.parametrize(
+    'stack, mutate',
+    [
+        (MinStack([1, 2]), lambda s: s.push(0)),
+        (MonotonicStack([1, 2]), lambda s: s.push(3)),
+        (TypedStack('i', [1, 2]), lambda s: s.push_many([3])),
+        (TypedStack('i', [1, 2]), lambda s: s.pop_many(1)),
+        (Stack([1, 2]), lambda s: s.clear()),
+        (Stack([1, 2]), lambda s: s.extend([3])),
+    ],
+)
+def test_every_stack_mutation_invalidates_views(stack, mutate):
+    view = stack.view()
+    mutate(stack)
+    with pytest.raises(RuntimeError):
+        view[0]
+
+
+def test_queue_view_is_indexed_from_the_front():
+    view = Queue([1, 2, 3]).view()
+    assert isinstance(view, QueueView)
+    assert len(view) == 3
+    assert view[0] == 1
+    assert view[-1] == 3
+    assert list(view) == [1, 2, 3]
+
+
+def test_queue_view_slicing():
+    view = Queue(range(10)).view()
+    assert list(view[2:8:3]) == [2, 5]
+    assert list(view[::-4]) == [9, 5, 1]
+    assert list(view[5:2]) == []
+
+
+def test_queue_view_fails_fast_after_modification():
+    q = Queue([1, 2, 3])
+    view = q.view()
+    it = iter(view)
+    next(it)
+    q.dequeue()
+    with pytest.raises(RuntimeError):
+        next(it)
+    with pytest.raises(RuntimeError):
+        view[0]
+
+
+def test_view_repr():
+    assert repr(Stack([1, 2]).view()) == 'StackView([2, 1])'
+    assert repr(Queue([1, 2]).view()) == 'QueueView([1, 2])'
+
+
+def test_stack_iteration_is_lazy():
+    s = Stack([1, 2, 3])
+    it = iter(s)
+    assert next(it) == 3
+    assert list(it) == [2, 1]